@@ -60,12 +60,9 @@ def demonstrate_interpolation():
     # Plot forward rates
     plt.subplot(2, 2, 3)
     forward_tenors = tenors_smooth[:-1]
-    linear_forwards = [linear_curve.get_forward_rate(tenors_smooth[i], tenors_smooth[i+1]) 
-                      for i in range(len(tenors_smooth)-1)]
-    cubic_forwards = [cubic_curve.get_forward_rate(tenors_smooth[i], tenors_smooth[i+1]) 
-                     for i in range(len(tenors_smooth)-1)]
-    log_linear_forwards = [log_linear_curve.get_forward_rate(tenors_smooth[i], tenors_smooth[i+1]) 
-                          for i in range(len(tenors_smooth)-1)]
+    linear_forwards = linear_curve.get_forward_rates(tenors_smooth[:-1], tenors_smooth[1:])
+    cubic_forwards = cubic_curve.get_forward_rates(tenors_smooth[:-1], tenors_smooth[1:])
+    log_linear_forwards = log_linear_curve.get_forward_rates(tenors_smooth[:-1], tenors_smooth[1:])
     
     plt.plot(forward_tenors, [f*100 for f in linear_forwards], 'b-', label='Linear', linewidth=2)
     plt.plot(forward_tenors, [f*100 for f in cubic_forwards], 'g-', label='Cubic', linewidth=2)
@@ -3,10 +3,29 @@ Curve bootstrapping algorithms for building yield curves from market instruments
 """
 
 import numpy as np
-from scipy.optimize import minimize
+from scipy.optimize import brentq, fsolve, minimize
 from typing import List, Optional, Tuple, Dict
 from .curve import YieldCurve
-from .instruments import Instrument
+from .instruments import Instrument, IRSwap
+
+
+def _par_swap_value(curve: YieldCurve,
+                    maturity: float,
+                    payment_dates: np.ndarray,
+                    coupon: float) -> float:
+    """
+    Value of a spot-starting unit-notional payer swap: 1 - DF(maturity) - coupon * annuity.
+    
+    Args:
+        curve: Yield curve to discount with
+        maturity: Swap maturity in years
+        payment_dates: Fixed-leg payment dates in years
+        coupon: Fixed coupon per period (rate / frequency)
+        
+    Returns:
+        Swap value; zero when the swap is at par
+    """
+    return 1.0 - curve.get_discount_factor(maturity) - coupon * float(curve.get_discount_factors(payment_dates).sum())
 
 
 class CurveBootstrapper:
@@ -14,14 +33,20 @@ class CurveBootstrapper:
     Bootstrapper for building yield curves from market instruments.
     """
     
-    def __init__(self, interpolation_method: str = 'cubic'):
+    def __init__(self, interpolation_method: str = 'cubic', warm_start: bool = False):
         """
         Initialize bootstrapper.
         
         Args:
             interpolation_method: Interpolation method for the curve
+            warm_start: Start each forward-control bootstrap from the previous solution
+                when it was fitted on the same tenors. Off by default so a shared
+                bootstrapper gives the same curve for the same inputs.
         """
         self.interpolation_method = interpolation_method
+        self.warm_start = warm_start
+        # (tenors, rates) of the last forward-control bootstrap, kept when warm_start is on
+        self._last_solution: Optional[Tuple[Tuple[float, ...], List[float]]] = None
     
     def bootstrap_curve(self, 
                        instruments: List[Instrument],
@@ -63,7 +88,8 @@ class CurveBootstrapper:
     
     def bootstrap_with_forward_control(self, 
                                      instruments: List[Instrument],
-                                     market_prices: List[float]) -> YieldCurve:
+                                     market_prices: List[float],
+                                     x0: Optional[List[float]] = None) -> YieldCurve:
         """
         Bootstrap curve with explicit forward starting swap control.
         
@@ -73,6 +99,8 @@ class CurveBootstrapper:
         Args:
             instruments: List of instruments (mix of spot and forward starting swaps)
             market_prices: Market prices (should be 0.0 for par swaps)
+            x0: Optional initial rates, one per instrument tenor, e.g. the rates of
+                a curve bootstrapped from a neighbouring scenario
             
         Returns:
             Bootstrapped yield curve
@@ -99,18 +127,55 @@ class CurveBootstrapper:
         
         # For forward starting swaps, we need to be more careful about bootstrapping
         # as they control specific curve segments
-        initial_rates = self._get_initial_rates(all_tenors)
+        if x0 is not None:
+            if len(x0) != len(all_tenors):
+                raise ValueError(f"x0 must have one rate per tenor ({len(all_tenors)}), got {len(x0)}")
+            initial_rates = list(x0)
+        elif self._last_solution is not None and self._last_solution[0] == tuple(all_tenors):
+            initial_rates = self._last_solution[1]
+        else:
+            initial_rates = self._get_initial_rates(all_tenors)
         
         # Optimize to match all instruments simultaneously
         optimized_rates = self._optimize_rates(
             instruments, market_prices, all_tenors, initial_rates
         )
+        if self.warm_start:
+            self._last_solution = (tuple(all_tenors), optimized_rates)
         
         # Create curve
         curve = YieldCurve(all_tenors, optimized_rates, self.interpolation_method)
         
         return curve
     
+    def batch_price(self, instruments: List[Instrument], curve: YieldCurve) -> np.ndarray:
+        """
+        Price many instruments against one curve.
+        
+        Instruments that are linear in discount factors (swaps) have their
+        cashflow times stacked so the curve is interpolated once, then the
+        discounted amounts are summed per instrument. Anything else is priced
+        individually.
+        
+        Args:
+            instruments: List of financial instruments
+            curve: Yield curve
+            
+        Returns:
+            Array of prices in the order of the instruments
+        """
+        prices = np.empty(len(instruments))
+        linear = [i for i, inst in enumerate(instruments) if hasattr(inst, 'get_discount_weights')]
+        
+        if linear:
+            prices[linear] = IRSwap.price_batch([instruments[i] for i in linear], curve)
+        
+        for i, inst in enumerate(instruments):
+            if not hasattr(inst, 'get_discount_weights'):
+                prices[i] = inst.price(curve)
+        
+        return prices
+    
     def analyze_forward_swap_coverage(self, instruments: List[Instrument]) -> Dict[str, any]:
         """
         Analyze how forward starting swaps cover different parts of the curve.
@@ -121,47 +186,37 @@ class CurveBootstrapper:
         Returns:
             Analysis dictionary with coverage information
         """
-        forward_swaps = []
-        spot_swaps = []
-        
-        for instrument in instruments:
-            if hasattr(instrument, 'is_forward_starting'):
-                if instrument.is_forward_starting:
-                    forward_swaps.append(instrument)
-                else:
-                    spot_swaps.append(instrument)
-        
-        # Analyze coverage
-        coverage_segments = []
-        for swap in forward_swaps:
-            start, end = swap.forward_tenor_range
-            coverage_segments.append({
-                'instrument': str(swap),
+        swaps = [instrument for instrument in instruments if hasattr(instrument, 'is_forward_starting')]
+        count = len(swaps)
+        is_forward = np.fromiter((swap.is_forward_starting for swap in swaps), dtype=bool, count=count)
+        ends = np.fromiter((swap.maturity for swap in swaps), dtype=np.float64, count=count)
+        # Spot swaps cover the curve from 0
+        starts = np.fromiter((swap.start_date for swap in swaps), dtype=np.float64, count=count)
+        starts[~is_forward] = 0.0
+        
+        # Forward swaps first, then spot swaps, each stable-sorted by start tenor
+        order = np.concatenate([np.flatnonzero(is_forward), np.flatnonzero(~is_forward)])
+        order = order[np.argsort(starts[order], kind='stable')]
+        coverage_segments = [
+            {
+                'instrument': str(swaps[i]),
                 'start_tenor': start,
                 'end_tenor': end,
                 'length': end - start,
-                'type': 'forward'
-            })
-        
-        for swap in spot_swaps:
-            coverage_segments.append({
-                'instrument': str(swap),
-                'start_tenor': 0.0,
-                'end_tenor': swap.maturity,
-                'length': swap.maturity,
-                'type': 'spot'
-            })
-        
-        # Sort by start tenor
-        coverage_segments.sort(key=lambda x: x['start_tenor'])
+                'type': 'forward' if forward else 'spot'
+            }
+            for i, start, end, forward in zip(order.tolist(), starts[order].tolist(),
+                                              ends[order].tolist(), is_forward[order].tolist())
+        ]
         
+        forward_count = int(is_forward.sum())
         return {
             'total_instruments': len(instruments),
-            'forward_starting_count': len(forward_swaps),
-            'spot_starting_count': len(spot_swaps),
+            'forward_starting_count': forward_count,
+            'spot_starting_count': count - forward_count,
             'coverage_segments': coverage_segments,
-            'max_tenor': max(seg['end_tenor'] for seg in coverage_segments) if coverage_segments else 0,
-            'min_tenor': min(seg['start_tenor'] for seg in coverage_segments) if coverage_segments else 0
+            'max_tenor': float(ends.max()) if count else 0,
+            'min_tenor': float(starts.min()) if count else 0
         }
     
     def _extract_tenors(self, instruments: List[Instrument]) -> List[float]:
@@ -227,20 +282,32 @@ class CurveBootstrapper:
         Returns:
             Optimized rates
         """
+        # Swap cashflows don't depend on the curve: stack their times and weights
+        # once so every objective call prices all swaps from one curve lookup
+        linear = [i for i, inst in enumerate(instruments) if hasattr(inst, 'get_discount_weights')]
+        others = [i for i, inst in enumerate(instruments) if not hasattr(inst, 'get_discount_weights')]
+        legs = [instruments[i].get_discount_weights() for i in linear]
+        if legs:
+            times = np.concatenate([t for t, _ in legs])
+            weights = np.concatenate([w for _, w in legs])
+            starts = np.cumsum([0] + [len(t) for t, _ in legs[:-1]])
+        market_prices = np.asarray(market_prices, dtype=np.float64)
+        
         def objective_function(rates):
             """Objective function to minimize pricing errors."""
             # Create temporary curve
             temp_curve = YieldCurve(tenors, rates, self.interpolation_method)
             
             # Calculate pricing errors
-            errors = []
-            for instrument, market_price in zip(instruments, market_prices):
-                model_price = instrument.price(temp_curve)
-                error = (model_price - market_price) / market_price  # Relative error
-                errors.append(error)
+            model_prices = np.empty(len(instruments))
+            if legs:
+                model_prices[linear] = np.add.reduceat(weights * temp_curve.get_discount_factors(times), starts)
+            for i in others:
+                model_prices[i] = instruments[i].price(temp_curve)
+            errors = (model_prices - market_prices) / market_prices  # Relative error
             
             # Return sum of squared errors
-            return np.sum(np.array(errors) ** 2)
+            return np.sum(errors ** 2)
         
         # Optimize using scipy
         result = minimize(
@@ -290,6 +357,11 @@ class CurveBootstrapper:
         """
         Bootstrap zero-coupon rates from swap rates.
         
+        Each rate is first solved node by node against the rates already known. With
+        cubic (or extrapolated linear) interpolation a later node bends the curve
+        before it, so the rates are then solved jointly on the final curve until
+        every input swap reprices to par.
+        
         Args:
             tenors: Swap tenors
             swap_rates: Swap rates
@@ -301,17 +373,25 @@ class CurveBootstrapper:
         zero_rates = []
         
         for i, (tenor, swap_rate) in enumerate(zip(tenors, swap_rates)):
-            if i == 0:
-                # First rate is the swap rate
-                zero_rates.append(swap_rate)
-            else:
-                # Bootstrap subsequent rates
-                zero_rate = self._bootstrap_single_rate(
-                    tenor, swap_rate, tenors[:i], zero_rates, frequency
-                )
-                zero_rates.append(zero_rate)
+            zero_rate = self._bootstrap_single_rate(
+                tenor, swap_rate, tenors[:i], zero_rates, frequency
+            )
+            zero_rates.append(zero_rate)
+        
+        # Payment dates and coupons of each input swap, on a unit notional
+        schedules = [(IRSwap(0.0, tenor, swap_rate, frequency).payment_dates, swap_rate / frequency)
+                     for tenor, swap_rate in zip(tenors, swap_rates)]
+        
+        def residuals(rates: np.ndarray) -> List[float]:
+            curve = YieldCurve(tenors, rates, self.interpolation_method)
+            return [_par_swap_value(curve, tenor, payment_dates, coupon)
+                    for tenor, (payment_dates, coupon) in zip(tenors, schedules)]
         
-        return zero_rates
+        solution, _, _, _ = fsolve(residuals, zero_rates, full_output=True)
+        if not np.all(np.abs(residuals(solution)) < 1e-10):
+            raise ValueError("Could not find zero rates that reprice every swap to par")
+        
+        return [float(rate) for rate in solution]
     
     def _bootstrap_single_rate(self, 
                               tenor: float,
@@ -322,6 +402,9 @@ class CurveBootstrapper:
         """
         Bootstrap a single zero-coupon rate.
         
+        Solves 1 = (swap_rate / frequency) * sum(DF(t_i)) + DF(tenor) over the swap's
+        payment dates, on a curve of the known rates plus the unknown one.
+        
         Args:
             tenor: Target tenor
             swap_rate: Swap rate for this tenor
@@ -332,53 +415,17 @@ class CurveBootstrapper:
         Returns:
             Zero-coupon rate for the target tenor
         """
-        # Create temporary curve with known rates
-        temp_curve = YieldCurve(known_tenors, known_rates, self.interpolation_method)
-        
-        # Calculate periods
-        periods = int(tenor * frequency)
-        period_size = 1.0 / frequency
-        
-        # Calculate present value of coupons using known rates
-        coupon_pv = 0.0
-        for i in range(1, periods):
-            period_tenor = i * period_size
-            if period_tenor <= known_tenors[-1]:
-                discount_factor = temp_curve.get_discount_factor(period_tenor)
-                coupon_pv += discount_factor
-        
-        # Calculate present value of final principal using known rates
-        principal_pv = 0.0
-        if tenor <= known_tenors[-1]:
-            principal_pv = temp_curve.get_discount_factor(tenor)
-        
-        # Solve for the unknown zero-coupon rate
-        # The equation is: 1 = swap_rate * coupon_pv + principal_pv + final_discount_factor
-        # where final_discount_factor = exp(-rate * tenor)
-        
-        coupon_amount = swap_rate / frequency
-        remaining_coupons = coupon_amount * (periods - len([t for t in known_tenors if t < tenor]))
-        
-        # Solve for the zero-coupon rate
-        if remaining_coupons > 0:
-            # Use Newton-Raphson or similar method
-            # For simplicity, we'll use a numerical approach
-            def objective(rate):
-                final_df = np.exp(-rate * tenor)
-                total_pv = coupon_amount * coupon_pv + principal_pv + final_df
-                return total_pv - 1.0
-            
-            # Simple bisection method
-            rate_low, rate_high = 0.0, 0.20
-            for _ in range(50):
-                rate_mid = (rate_low + rate_high) / 2
-                if objective(rate_mid) > 0:
-                    rate_high = rate_mid
-                else:
-                    rate_low = rate_mid
-            
-            return rate_mid
-        else:
-            # No remaining coupons, just solve for final discount factor
-            final_df = (1.0 - coupon_amount * coupon_pv - principal_pv)
-            return -np.log(final_df) / tenor 
\ No newline at end of file
+        payment_dates = IRSwap(0.0, tenor, swap_rate, frequency).payment_dates
+        coupon = swap_rate / frequency
+        
+        # A single node is a flat curve, which every method would otherwise fail to
+        # extrapolate from
+        method = self.interpolation_method if len(known_tenors) > 0 else 'flat'
+        curve_tenors = list(known_tenors) + [tenor]
+        
+        def swap_value(rate: float) -> float:
+            curve = YieldCurve(curve_tenors, list(known_rates) + [rate], method)
+            return _par_swap_value(curve, tenor, payment_dates, coupon)
+        
+        # The swap value rises with the rate, so the root is unique in the bracket
+        return float(brentq(swap_value, -0.20, 1.0, xtol=1e-14)) 
\ No newline at end of file
@@ -2,17 +2,104 @@
 Yield Curve implementation for interest rate modeling.
 """
 
+import math
+import weakref
+from bisect import bisect_right
+
 import numpy as np
-from scipy.interpolate import interp1d
-from typing import List, Tuple, Optional, Union
+from scipy.interpolate import PPoly, interp1d, make_interp_spline
+from typing import Dict, List, Tuple, Optional, Union
 import pandas as pd
 
 
+def _flat_rate(tenors: List[float], rates: List[float], tenor: float) -> float:
+    """
+    Step-function lookup on plain Python lists.
+    
+    A scalar bisect avoids the per-call overhead of numpy on the hot path;
+    tenors outside the node range take the first/last rate.
+    """
+    idx = bisect_right(tenors, tenor) - 1
+    return rates[idx if idx > 0 else 0]
+
+
+def _linear_rate(tenors: List[float], rates: List[float], tenor: float) -> float:
+    """
+    Linear interpolation on plain Python lists.
+    
+    Uses the same slope * (t - t0) + r0 form as np.interp, so results match it exactly;
+    beyond the nodes the end segments are extended, as interp1d extrapolates.
+    """
+    idx = bisect_right(tenors, tenor) - 1
+    if idx >= len(tenors) - 1:
+        if tenor == tenors[-1]:
+            return rates[-1]
+        idx = len(tenors) - 2
+    elif idx < 0:
+        idx = 0
+    t0, r0 = tenors[idx], rates[idx]
+    slope = (rates[idx + 1] - r0) / (tenors[idx + 1] - t0)
+    return slope * (tenor - t0) + r0
+
+
+def _rate_pieces(tenors: np.ndarray, rates: np.ndarray, method: str,
+                 interpolator) -> Optional[List[Tuple[float, ...]]]:
+    """
+    Polynomial pieces (start, origin, a, b, c, d) reproducing a rate interpolator.
+    
+    Each piece holds from its start up to the next one and evaluates
+    ((a*dx + b)*dx + c)*dx + d with dx = tenor - origin; the first and last
+    pieces also carry the interpolator's extrapolation. Returns None for
+    log_linear, which is not polynomial in the rate.
+    """
+    if method == 'flat':
+        return [(t, t, 0.0, 0.0, 0.0, r) for t, r in zip(tenors.tolist(), rates.tolist())]
+    left = tenors[:-1]
+    if method == 'cubic' and len(tenors) >= 4:
+        # Expand each spline segment around its left node from the derivatives there
+        columns = [left, left, interpolator(left, 3) / 6.0, interpolator(left, 2) / 2.0,
+                   interpolator(left, 1), interpolator(left)]
+    elif method in ('linear', 'cubic'):
+        zeros = np.zeros_like(left)
+        columns = [left, left, zeros, zeros, np.diff(rates) / np.diff(tenors), rates[:-1]]
+    else:
+        return None
+    return [tuple(row) for row in np.column_stack(columns).tolist()]
+
+
+def _cubic_spline(tenors: np.ndarray, rates: np.ndarray) -> PPoly:
+    """
+    Not-a-knot cubic spline through the nodes, in piecewise-polynomial form.
+    
+    This is the same spline interp1d builds. Converting the B-spline to PPoly
+    lets array calls run one compiled Horner loop per point instead of de Boor,
+    which is several times faster on long tenor grids.
+    """
+    return PPoly.from_spline(make_interp_spline(tenors, rates, k=3, check_finite=False))
+
+
+def _piecewise_rate(starts: List[float], pieces: List[Tuple[float, ...]], tenor: float) -> float:
+    """Evaluate the polynomial piece covering a scalar tenor in Horner form."""
+    idx = bisect_right(starts, tenor) - 1
+    origin, a, b, c, d = pieces[idx if idx > 0 else 0]
+    dx = tenor - origin
+    return ((a * dx + b) * dx + c) * dx + d
+
+
+def _flat_discount_factor(tenors: List[float], rates: List[float], tenor: float) -> float:
+    """Discount factor on a flat curve, staying in plain floats throughout."""
+    return math.exp(-_flat_rate(tenors, rates, tenor) * tenor)
+
+
 class YieldCurve:
     """
     Zero-coupon yield curve with interpolation and forward rate calculations.
     """
     
+    # Curves built on the same tenors share one read-only grid; entries go away
+    # with the last curve that uses them
+    _TENOR_CACHE: 'weakref.WeakValueDictionary' = weakref.WeakValueDictionary()
+    
     def __init__(self, 
                  tenors: List[float], 
                  rates: List[float],
@@ -31,8 +118,16 @@ class YieldCurve:
             pre_cutoff_method: Interpolation method before cutoff (default: 'flat')
             post_cutoff_method: Interpolation method after cutoff (default: 'cubic')
         """
-        self.tenors = np.array(tenors)
+        self.tenors = self._shared_tenors(tenors)
         self.rates = np.array(rates)
+        # Interpolators are built from the rates once, so a curve is read-only after construction
+        self.rates.flags.writeable = False
+        # Swap par rates keyed by (start, maturity, frequency), filled by IRSwap.get_par_rate;
+        # the curve never changes, so entries never go stale
+        self._par_cache: Dict[Tuple[float, float, int], float] = {}
+        # Discount factors on swap schedules, keyed by the schedule times' bytes, so swaps
+        # that differ only in rate or notional share one lookup
+        self._schedule_df_cache: Dict[bytes, np.ndarray] = {}
         self.interpolation_method = interpolation_method
         self.cutoff_tenor = cutoff_tenor
         self.pre_cutoff_method = pre_cutoff_method
@@ -47,29 +142,45 @@ class YieldCurve:
         # Create interpolator
         self._create_interpolator()
     
+    @classmethod
+    def _shared_tenors(cls, tenors: List[float]) -> np.ndarray:
+        """Return the interned read-only array for this tenor grid."""
+        key = tuple(np.asarray(tenors).tolist())
+        grid = cls._TENOR_CACHE.get(key)
+        if grid is None:
+            grid = np.array(tenors, dtype=np.float64)
+            grid.flags.writeable = False
+            cls._TENOR_CACHE[key] = grid
+        return grid
+    
     def _create_interpolator(self):
         """Create the rate interpolator based on method."""
         if self.interpolation_method == 'linear':
             self._interpolator = interp1d(self.tenors, self.rates, 
                                          kind='linear', fill_value='extrapolate')
+            self._nodes = (self.tenors.tolist(), self.rates.tolist())
         elif self.interpolation_method == 'cubic':
             # Use linear interpolation if we have fewer than 4 points for cubic
             if len(self.tenors) < 4:
-                self._interpolator = interp1d(self.tenors, self.rates, 
+                self._interpolator = interp1d(self.tenors, self.rates,
                                              kind='linear', fill_value='extrapolate')
+                self._cubic_nodes = None
             else:
-                self._interpolator = interp1d(self.tenors, self.rates, 
-                                             kind='cubic', fill_value='extrapolate')
+                self._interpolator = _cubic_spline(self.tenors, self.rates)
+                pieces = _rate_pieces(self.tenors, self.rates, 'cubic', self._interpolator)
+                self._cubic_nodes = ([p[0] for p in pieces], [p[1:] for p in pieces])
         elif self.interpolation_method == 'log_linear':
             # Log-linear interpolation on discount factors
             discount_factors = np.exp(-self.tenors * self.rates)
             self._discount_interpolator = interp1d(self.tenors, discount_factors,
                                                   kind='linear', fill_value='extrapolate')
+            self._df_nodes = (self.tenors.tolist(), discount_factors.tolist())
         elif self.interpolation_method == 'flat':
             # Flat (step function) interpolation - suitable for SOFR/Fed Fund rates
             # Rate stays constant between nodes (left-continuous step function)
             self._interpolator = interp1d(self.tenors, self.rates, 
                                          kind='previous', fill_value='extrapolate')
+            self._nodes = (self.tenors.tolist(), self.rates.tolist())
         elif self.interpolation_method == 'hybrid':
             # Hybrid interpolation using two different methods before and after cutoff
             if self.cutoff_tenor is None:
@@ -119,6 +230,10 @@ class YieldCurve:
                 self._post_tenors = self.tenors[exact_idx:]
                 self._post_rates = self.rates[exact_idx:]
         
+        # Plain-list copies for the scalar flat lookup
+        self._pre_flat_nodes = (self._pre_tenors.tolist(), self._pre_rates.tolist())
+        self._post_flat_nodes = (self._post_tenors.tolist(), self._post_rates.tolist())
+        
         # Create pre-cutoff interpolator
         if len(self._pre_tenors) > 0:
             self._pre_interpolator = self._create_single_interpolator(
@@ -135,6 +250,42 @@ class YieldCurve:
         else:
             self._post_interpolator = None
     
+        self._create_hybrid_pieces()
+    
+    def _create_hybrid_pieces(self):
+        """
+        Stitch the pre- and post-cutoff methods into one table of polynomial pieces.
+        
+        Pre-cutoff pieces cover tenors up to and including the cutoff and the
+        post-cutoff ones start at the next float above it, so a single bisect
+        (or searchsorted) picks the method. Left as None when either side is
+        log_linear, which keeps the per-method dispatch.
+        """
+        self._hybrid_pieces = None
+        sides = []
+        for interpolator, tenors, rates, method in (
+                (self._pre_interpolator, self._pre_tenors, self._pre_rates, self.pre_cutoff_method),
+                (self._post_interpolator, self._post_tenors, self._post_rates, self.post_cutoff_method)):
+            if interpolator is None:
+                continue
+            pieces = _rate_pieces(tenors, rates, method, interpolator)
+            if not pieces:
+                # log_linear, or a single-node side with no segment to stitch
+                return
+            sides.append(pieces)
+        
+        if len(sides) == 2:
+            pre, post = sides
+            above = float(np.nextafter(self.cutoff_tenor, np.inf))
+            pre = [p for p in pre if p[0] <= self.cutoff_tenor]
+            # The post piece in force just above the cutoff starts there instead
+            first = max(bisect_right([p[0] for p in post], above) - 1, 0)
+            sides = [pre, [(above,) + post[first][1:]] + post[first + 1:]]
+        pieces = [p for side in sides for p in side]
+        self._hybrid_pieces = ([p[0] for p in pieces], [p[1:] for p in pieces])
+        # Column-wise copies for the vectorized evaluation in get_rates
+        self._hybrid_arrays = (np.array(self._hybrid_pieces[0]), np.array(self._hybrid_pieces[1]).T)
+    
     def _create_single_interpolator(self, tenors, rates, method):
         """Create a single interpolator for given method."""
         if method == 'linear':
@@ -143,7 +294,7 @@ class YieldCurve:
             if len(tenors) < 4:
                 return interp1d(tenors, rates, kind='linear', fill_value='extrapolate')
             else:
-                return interp1d(tenors, rates, kind='cubic', fill_value='extrapolate')
+                return _cubic_spline(tenors, rates)
         elif method == 'flat':
             return interp1d(tenors, rates, kind='previous', fill_value='extrapolate')
         elif method == 'log_linear':
@@ -168,14 +319,16 @@ class YieldCurve:
             return -np.log(df) / tenor
         elif self.interpolation_method == 'flat':
             # For flat interpolation, we need custom logic for extrapolation
-            if tenor <= self.tenors[0]:
-                return float(self.rates[0])
-            elif tenor >= self.tenors[-1]:
-                return float(self.rates[-1])
-            else:
-                # Find the index where tenor fits
-                idx = np.searchsorted(self.tenors, tenor, side='right') - 1
-                return float(self.rates[idx])
+            return _flat_rate(*self._nodes, tenor)
+        elif self.interpolation_method == 'linear':
+            # A list bisect avoids numpy call overhead
+            return _linear_rate(*self._nodes, tenor)
+        elif self.interpolation_method == 'cubic' and self._cubic_nodes is not None:
+            # Scalar Horner on the spline's segment coefficients skips BSpline's call overhead
+            return _piecewise_rate(*self._cubic_nodes, tenor)
+        elif self.interpolation_method == 'hybrid' and self._hybrid_pieces is not None:
+            # One bisect over the stitched pieces picks both the side of the cutoff and the segment
+            return _piecewise_rate(*self._hybrid_pieces, tenor)
         elif self.interpolation_method == 'hybrid':
             # Use appropriate interpolator based on cutoff
             if tenor <= self.cutoff_tenor:
@@ -195,18 +348,9 @@ class YieldCurve:
         """Get rate from a specific interpolator with method-specific logic."""
         if method == 'flat':
             # Custom flat interpolation logic
-            if interpolator == self._pre_interpolator:
-                tenors, rates = self._pre_tenors, self._pre_rates
-            else:
-                tenors, rates = self._post_tenors, self._post_rates
-                
-            if tenor <= tenors[0]:
-                return float(rates[0])
-            elif tenor >= tenors[-1]:
-                return float(rates[-1])
-            else:
-                idx = np.searchsorted(tenors, tenor, side='right') - 1
-                return float(rates[idx])
+            if interpolator is self._pre_interpolator:
+                return _flat_rate(*self._pre_flat_nodes, tenor)
+            return _flat_rate(*self._post_flat_nodes, tenor)
         elif method == 'log_linear':
             # Convert back from discount factor to rate
             df = interpolator(tenor)
@@ -224,8 +368,125 @@ class YieldCurve:
         Returns:
             Discount factor
         """
-        rate = self.get_rate(tenor)
-        return np.exp(-rate * tenor)
+        if self.interpolation_method == 'flat':
+            return _flat_discount_factor(*self._nodes, tenor)
+        elif self.interpolation_method == 'log_linear' and self._df_nodes[0][0] <= tenor <= self._df_nodes[0][-1]:
+            # Discount factors are the interpolated quantity, so skip the round trip through the rate
+            return _linear_rate(*self._df_nodes, tenor)
+        # The scalar rate paths return plain floats, so finish with math.exp rather
+        # than a numpy ufunc call per lookup
+        return math.exp(-self.get_rate(tenor) * tenor)
+    
+    def get_discount_factors(self, tenors: np.ndarray) -> np.ndarray:
+        """
+        Get discount factors at many tenors with one interpolator call.
+        
+        Args:
+            tenors: Tenors in years
+            
+        Returns:
+            Array of discount factors, one per tenor
+        """
+        tenors = np.asarray(tenors, dtype=np.float64)
+        # get_rates hands back a fresh array, so the exponent and the discount
+        # factors can share its buffer; 0-d input comes back as a numpy scalar
+        exponent = self.get_rates(tenors) * -tenors
+        if isinstance(exponent, np.ndarray):
+            return np.exp(exponent, out=exponent)
+        return np.exp(exponent)
+    
+    def get_rates(self, tenors: np.ndarray) -> np.ndarray:
+        """
+        Get interpolated rates at many tenors with one interpolator call.
+        
+        Args:
+            tenors: Tenors in years
+            
+        Returns:
+            Array of zero-coupon rates, one per tenor
+        """
+        tenors = np.asarray(tenors, dtype=np.float64)
+        if self.interpolation_method == 'log_linear':
+            return self._get_rates_from_interpolator(
+                tenors, self._discount_interpolator, 'log_linear', self.tenors, self.rates
+            )
+        elif self.interpolation_method != 'hybrid':
+            return self._get_rates_from_interpolator(
+                tenors, self._interpolator, self.interpolation_method, self.tenors, self.rates
+            )
+        elif self._hybrid_pieces is not None:
+            starts, (origin, a, b, c, d) = self._hybrid_arrays
+            idx = np.maximum(np.searchsorted(starts, tenors, side='right') - 1, 0)
+            dx = tenors - origin[idx]
+            return ((a[idx] * dx + b[idx]) * dx + c[idx]) * dx + d[idx]
+        
+        pre = (self._pre_interpolator, self.pre_cutoff_method, self._pre_tenors, self._pre_rates)
+        post = (self._post_interpolator, self.post_cutoff_method, self._post_tenors, self._post_rates)
+        if self._pre_interpolator is None:
+            pre = post
+        if self._post_interpolator is None:
+            post = pre
+        
+        if tenors.ndim == 1 and np.all(tenors[1:] >= tenors[:-1]):
+            # Sorted grid: split once at the cutoff and interpolate contiguous slices
+            split = np.searchsorted(tenors, self.cutoff_tenor, side='right')
+            return np.concatenate([
+                self._get_rates_from_interpolator(tenors[:split], *pre),
+                self._get_rates_from_interpolator(tenors[split:], *post),
+            ])
+        
+        rates = np.empty_like(tenors)
+        mask = tenors <= self.cutoff_tenor
+        rates[mask] = self._get_rates_from_interpolator(tenors[mask], *pre)
+        rates[~mask] = self._get_rates_from_interpolator(tenors[~mask], *post)
+        return rates
+    
+    def _get_rates_from_interpolator(self, tenors: np.ndarray, interpolator, method: str,
+                                     node_tenors: np.ndarray, node_rates: np.ndarray) -> np.ndarray:
+        """Vectorized counterpart of _get_rate_from_interpolator."""
+        if method == 'flat':
+            # side='right' never indexes past the last node, so only the low end needs clamping
+            idx = np.searchsorted(node_tenors, tenors, side='right') - 1
+            return node_rates[np.maximum(idx, 0)]
+        elif method == 'log_linear':
+            return -np.log(interpolator(tenors)) / tenors
+        elif method == 'linear':
+            if len(node_tenors) < 2:
+                # No segment to extend (a single-node hybrid side); keep interp1d's result
+                return np.asarray(interpolator(tenors), dtype=np.float64)
+            rates = np.interp(tenors, node_tenors, node_rates)
+            # np.interp clamps at the ends; extend the end segments like interp1d's
+            # extrapolation, in the same slope * (t - t0) + r0 form
+            below = tenors < node_tenors[0]
+            if below.any():
+                slope = (node_rates[1] - node_rates[0]) / (node_tenors[1] - node_tenors[0])
+                rates[below] = slope * (tenors[below] - node_tenors[0]) + node_rates[0]
+            above = tenors > node_tenors[-1]
+            if above.any():
+                slope = (node_rates[-1] - node_rates[-2]) / (node_tenors[-1] - node_tenors[-2])
+                rates[above] = slope * (tenors[above] - node_tenors[-2]) + node_rates[-2]
+            return rates
+        else:
+            return np.asarray(interpolator(tenors), dtype=np.float64)
+    
+    def get_shifted_discount_factors(self, tenors: np.ndarray, shifts: np.ndarray) -> np.ndarray:
+        """
+        Get discount factors under a set of parallel rate shifts.
+        
+        A parallel shift s scales each discount factor by exp(-s * t), so the
+        base curve is only evaluated once.
+        
+        Args:
+            tenors: Tenors in years
+            shifts: Rate shifts in basis points
+            
+        Returns:
+            Array of shape (len(shifts), len(tenors))
+        """
+        tenors = np.asarray(tenors, dtype=np.float64)
+        shifts = np.asarray(shifts, dtype=np.float64) / 10000.0
+        base_dfs = self.get_discount_factors(tenors)
+        return base_dfs[None, :] * np.exp(-shifts[:, None] * tenors[None, :])
     
     def get_forward_rate(self, start_tenor: float, end_tenor: float) -> float:
         """
@@ -241,13 +502,36 @@ class YieldCurve:
         if start_tenor >= end_tenor:
             raise ValueError("Start tenor must be less than end tenor")
             
-        df_start = self.get_discount_factor(start_tenor)
-        df_end = self.get_discount_factor(end_tenor)
+        # log(DF(start) / DF(end)) is r(end) * end - r(start) * start, so skip the exp/log round trip
+        start_rate = self.get_rate(start_tenor)
+        end_rate = self.get_rate(end_tenor)
         
         # Forward rate calculation
-        forward_rate = (np.log(df_start / df_end) / (end_tenor - start_tenor))
+        forward_rate = (end_rate * end_tenor - start_rate * start_tenor) / (end_tenor - start_tenor)
         return forward_rate
     
+    def get_forward_rates(self, start_tenors: np.ndarray, end_tenors: np.ndarray) -> np.ndarray:
+        """
+        Calculate forward rates for many periods with one rate lookup.
+        
+        Args:
+            start_tenors: Start tenors in years
+            end_tenors: End tenors in years, one per start tenor
+            
+        Returns:
+            Array of forward rates (annualized), one per period
+        """
+        start_tenors = np.asarray(start_tenors, dtype=np.float64)
+        end_tenors = np.asarray(end_tenors, dtype=np.float64)
+        if start_tenors.shape != end_tenors.shape:
+            raise ValueError("Start and end tenors must have same shape")
+        if np.any(start_tenors >= end_tenors):
+            raise ValueError("Start tenor must be less than end tenor")
+        
+        # Same r(end) * end - r(start) * start form as get_forward_rate
+        start_rates, end_rates = self.get_rates(np.stack([start_tenors, end_tenors]))
+        return (end_rates * end_tenors - start_rates * start_tenors) / (end_tenors - start_tenors)
+    
     def get_par_rate(self, tenor: float, frequency: int = 2) -> float:
         """
         Calculate par rate for given tenor and frequency.
@@ -264,22 +548,57 @@ class YieldCurve:
             
         # Calculate coupon periods
         periods = int(tenor * frequency)
+        if periods == 0:
+            raise ValueError("Tenor must cover at least one coupon period")
         period_size = 1.0 / frequency
         
+        # Discount the coupon dates and the final principal payment in one lookup
+        times = np.append(np.arange(1, periods + 1) * period_size, tenor)
+        dfs = self.get_discount_factors(times)
+        
         # Calculate present value of coupons
-        coupon_pv = 0.0
-        for i in range(1, periods + 1):
-            period_tenor = i * period_size
-            coupon_pv += self.get_discount_factor(period_tenor)
+        coupon_pv = float(dfs[:-1].sum())
         
         # Add final principal payment
-        principal_pv = self.get_discount_factor(tenor)
+        principal_pv = float(dfs[-1])
         
         # Solve for par rate: 1 = par_rate * coupon_pv + principal_pv
         par_rate = (1.0 - principal_pv) / coupon_pv
         
         return par_rate * frequency  # Convert to annual rate
     
+    def get_par_rates(self, tenors: np.ndarray, frequency: int = 2) -> np.ndarray:
+        """
+        Calculate par rates for many tenors with one discount factor lookup.
+        
+        The coupon dates of every tenor lie on one grid of whole periods, so a
+        running sum over that grid gives each tenor's coupon PV.
+        
+        Args:
+            tenors: Tenors in years
+            frequency: Coupon frequency (1=annual, 2=semi-annual, etc.)
+            
+        Returns:
+            Array of par rates (annualized), one per tenor
+        """
+        tenors = np.asarray(tenors, dtype=np.float64)
+        if np.any(tenors <= 0):
+            raise ValueError("Tenor must be positive")
+        
+        periods = (tenors * frequency).astype(int)
+        if np.any(periods == 0):
+            raise ValueError("Tenor must cover at least one coupon period")
+        period_size = 1.0 / frequency
+        
+        # Coupon grid up to the longest tenor, then the principal dates, in one lookup
+        grid = np.arange(1, periods.max() + 1) * period_size
+        dfs = self.get_discount_factors(np.concatenate([grid, tenors]))
+        coupon_pvs = np.cumsum(dfs[:len(grid)])[periods - 1]
+        principal_pvs = dfs[len(grid):]
+        
+        # Solve 1 = par_rate * coupon_pv + principal_pv, then convert to annual rates
+        return (1.0 - principal_pvs) / coupon_pvs * frequency
+    
     def shift_curve(self, shift: float) -> 'YieldCurve':
         """
         Create a new curve with parallel shift.
@@ -290,15 +609,41 @@ class YieldCurve:
         Returns:
             New YieldCurve with shifted rates
         """
-        shifted_rates = self.rates + shift / 10000.0  # Convert bps to decimal
-        return YieldCurve(self.tenors, shifted_rates, self.interpolation_method)
+        delta = shift / 10000.0  # Convert bps to decimal
+        shifted_rates = self.rates + delta
+        if self.interpolation_method == 'cubic' and self._cubic_nodes is not None:
+            return self._shifted_cubic(shifted_rates, delta)
+        return YieldCurve(self.tenors, shifted_rates, self.interpolation_method, self.cutoff_tenor,
+                          self.pre_cutoff_method, self.post_cutoff_method)
+    
+    def _shifted_cubic(self, shifted_rates: np.ndarray, delta: float) -> 'YieldCurve':
+        """
+        Cubic curve with every node moved by delta, without re-solving the spline.
+        
+        A not-a-knot spline through r + delta is the spline through r plus delta,
+        so only the constant term of each piece changes. The instance is assembled
+        directly because copy.copy would go through __reduce__ and the constructor.
+        """
+        curve = object.__new__(type(self))
+        curve.__dict__.update(self.__dict__)
+        shifted_rates.flags.writeable = False
+        curve.rates = shifted_rates
+        curve._par_cache = {}
+        curve._schedule_df_cache = {}
+        
+        coefficients = self._interpolator.c.copy()
+        coefficients[-1] += delta
+        curve._interpolator = PPoly.construct_fast(coefficients, self._interpolator.x, extrapolate=True)
+        starts, pieces = self._cubic_nodes
+        curve._cubic_nodes = (starts, [(origin, a, b, c, d + delta) for origin, a, b, c, d in pieces])
+        return curve
     
     def to_dataframe(self) -> pd.DataFrame:
         """Convert curve to pandas DataFrame."""
         return pd.DataFrame({
             'tenor': self.tenors,
             'rate': self.rates,
-            'discount_factor': [self.get_discount_factor(t) for t in self.tenors]
+            'discount_factor': self.get_discount_factors(self.tenors)
         })
     
     @classmethod
@@ -319,5 +664,10 @@ class YieldCurve:
         bootstrapper = CurveBootstrapper()
         return bootstrapper.bootstrap_curve(instruments, market_prices, tenors)
     
+    def __reduce__(self):
+        """Pickle by constructor arguments; interpolators are rebuilt and the tenor grid re-shared on load."""
+        return (self.__class__, (self.tenors, self.rates, self.interpolation_method, self.cutoff_tenor,
+                                 self.pre_cutoff_method, self.post_cutoff_method))
+    
     def __repr__(self):
         return f"YieldCurve(tenors={self.tenors}, rates={self.rates}, method='{self.interpolation_method}')" 
\ No newline at end of file
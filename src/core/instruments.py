@@ -2,12 +2,26 @@
 Financial instruments for interest rate modeling.
 """
 
+import copy
+import weakref
+
 import numpy as np
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from .curve import YieldCurve
 
 
+def _fixed_leg_pv(payment_dfs: np.ndarray, fixed_rate: float, frequency: int, notional: float) -> float:
+    """Present value of fixed coupons paid on every payment date."""
+    coupon = fixed_rate / frequency * notional
+    return float(coupon * payment_dfs.sum())
+
+
+def _floating_leg_pv(start_df: float, maturity_df: float, notional: float) -> float:
+    """Present value of a floating leg, Notional * (DF(start) - DF(maturity))."""
+    return notional * (start_df - maturity_df)
+
+
 class Instrument(ABC):
     """Abstract base class for financial instruments."""
     
@@ -24,6 +38,30 @@ class Instrument(ABC):
         """Get cashflow dates and amounts."""
         pass
     
+    @property
+    def effective_tenor(self) -> float:
+        """Get the tenor used to place this instrument on the curve (maturity by default)."""
+        return self.maturity
+    
+    def price_shifted(self, curve: YieldCurve, shifts: np.ndarray,
+                      out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Price the instrument under a set of parallel curve shifts.
+        
+        Args:
+            curve: Yield curve
+            shifts: Rate shifts in basis points
+            out: Optional preallocated array to write the prices into
+            
+        Returns:
+            Array of prices, one per shift
+        """
+        if out is None:
+            out = np.empty(len(shifts))
+        for i, shift in enumerate(shifts):
+            out[i] = self.price(curve.shift_curve(shift))
+        return out
+    
     def get_dv01(self, curve: YieldCurve, shift: float = 1.0) -> float:
         """
         Calculate DV01 (dollar value of 1bp change).
@@ -36,8 +74,7 @@ class Instrument(ABC):
             DV01
         """
         base_price = self.price(curve)
-        shifted_curve = curve.shift_curve(shift)
-        shifted_price = self.price(shifted_curve)
+        shifted_price = self.price_shifted(curve, np.array([shift], dtype=np.float64))[0]
         
         return (base_price - shifted_price) / (shift / 10000.0)
     
@@ -53,11 +90,7 @@ class Instrument(ABC):
             Convexity
         """
         base_price = self.price(curve)
-        up_curve = curve.shift_curve(shift)
-        down_curve = curve.shift_curve(-shift)
-        
-        up_price = self.price(up_curve)
-        down_price = self.price(down_curve)
+        up_price, down_price = self.price_shifted(curve, np.array([shift, -shift], dtype=np.float64))
         
         shift_decimal = shift / 10000.0
         convexity = (up_price + down_price - 2 * base_price) / (shift_decimal ** 2)
@@ -101,21 +134,46 @@ class IRSwap(Instrument):
         
         # Calculate payment dates
         self._calculate_payment_dates()
+        
+        # The discounting schedule [start, maturity, payment dates...] never changes,
+        # so build it once for every pricing call
+        self._schedule_times = np.concatenate([[self.start_date, self.maturity], self.payment_dates])
+        self._schedule_times.flags.writeable = False
+        # (weak reference to the last curve, its discount factors at _schedule_times)
+        self._df_cache = None
     
     def _calculate_payment_dates(self):
-        """Calculate payment dates for the swap."""
-        period_size = 1.0 / self.frequency
-        self.payment_dates = []
-        
-        # Start from first payment date after start_date
-        current_date = self.start_date + period_size
-        while current_date <= self.maturity:
-            self.payment_dates.append(current_date)
-            current_date += period_size
+        """Calculate payment dates for the swap, stored as a read-only float64 array."""
+        # Whole periods that fit before maturity; the small slack keeps a date that
+        # lands on maturity up to rounding in (t * frequency is rarely exact)
+        n_periods = int(np.floor((self.maturity - self.start_date) * self.frequency + 1e-9))
+        payment_dates = self.start_date + np.arange(1, n_periods + 1, dtype=np.float64) / self.frequency
         
         # Ensure maturity is included
-        if len(self.payment_dates) == 0 or abs(self.payment_dates[-1] - self.maturity) > 1e-6:
-            self.payment_dates.append(self.maturity)
+        if n_periods == 0 or abs(payment_dates[-1] - self.maturity) > 1e-6:
+            payment_dates = np.append(payment_dates, self.maturity)
+        
+        self.payment_dates = payment_dates
+        self.payment_dates.flags.writeable = False
+    
+    def with_rate(self, fixed_rate: float) -> 'IRSwap':
+        """
+        Copy of this swap with a different fixed rate.
+        
+        The schedule and cached discount factors do not depend on the fixed rate,
+        so the copy shares them instead of rebuilding them in __init__.
+        
+        Args:
+            fixed_rate: Fixed rate (annualized) of the new swap
+            
+        Returns:
+            New IRSwap
+        """
+        swap = copy.copy(self)
+        swap.fixed_rate = fixed_rate
+        # copy.copy goes through __getstate__, which drops the cache
+        swap._df_cache = self._df_cache
+        return swap
     
     @property
     def effective_tenor(self) -> float:
@@ -145,28 +203,171 @@ class IRSwap(Instrument):
         Returns:
             Present value of the swap
         """
-        # Calculate fixed leg value
-        fixed_leg = self._price_fixed_leg(curve)
-        
-        # Calculate floating leg value
-        floating_leg = self._price_floating_leg(curve)
+        # Both legs read the same cached schedule discount factors
+        dfs = self._schedule_discount_factors(curve)
+        fixed_leg = _fixed_leg_pv(dfs[2:], self.fixed_rate, self.frequency, self.notional)
+        floating_leg = _floating_leg_pv(dfs[0], dfs[1], self.notional)
         
         # Swap value = Floating leg - Fixed leg (receiver perspective)
         return floating_leg - fixed_leg
     
-    def _price_fixed_leg(self, curve: YieldCurve) -> float:
-        """Price the fixed leg of the swap."""
-        fixed_leg_pv = 0.0
+    def price_shifted(self, curve: YieldCurve, shifts: np.ndarray,
+                      out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Price the swap under a set of parallel curve shifts in one pass.
+        
+        Both legs are linear in the discount factors at start, maturity and
+        the payment dates, so all shifts reduce to one matrix-vector product.
+        
+        Args:
+            curve: Yield curve
+            shifts: Rate shifts in basis points
+            out: Optional preallocated array to write the prices into
+            
+        Returns:
+            Array of swap values, one per shift
+        """
+        if curve.interpolation_method == 'log_linear':
+            # Shifting node rates is not a parallel zero shift once the
+            # discount factors themselves are interpolated
+            return super().price_shifted(curve, shifts, out)
+        
+        times, weights = self.get_discount_weights()
+        dfs = curve.get_shifted_discount_factors(times, shifts)
+        return np.matmul(dfs, weights, out=out)
+    
+    def get_dv01(self, curve: YieldCurve, shift: float = 1.0) -> float:
+        """
+        Calculate DV01 (dollar value of 1bp change).
+        
+        A parallel shift s scales each discount factor by exp(-s * t), so the
+        bump-and-reprice difference has the closed form
+        sum(w * DF * -expm1(-s * t)) / s over the swap's discount weights,
+        taken from the cached base discount factors without a bumped price.
+        
+        Args:
+            curve: Yield curve
+            shift: Rate shift in basis points
+            
+        Returns:
+            DV01
+        """
+        if curve.interpolation_method == 'log_linear':
+            return super().get_dv01(curve, shift)
+        
+        times, weights = self.get_discount_weights()
+        shift_decimal = shift / 10000.0
+        weighted_dfs = weights * self._schedule_discount_factors(curve)
+        return float(weighted_dfs @ -np.expm1(-shift_decimal * times)) / shift_decimal
+    
+    def get_convexity(self, curve: YieldCurve, shift: float = 10.0) -> float:
+        """
+        Calculate convexity in closed form.
+        
+        The up and down bumps combine as exp(-s*t) + exp(s*t) - 2 = 4 * sinh(s*t/2)**2,
+        which avoids cancelling the base price out of two nearly equal bumped prices.
+        
+        Args:
+            curve: Yield curve
+            shift: Rate shift in basis points
+            
+        Returns:
+            Convexity
+        """
+        if curve.interpolation_method == 'log_linear':
+            return super().get_convexity(curve, shift)
+        
+        times, weights = self.get_discount_weights()
+        shift_decimal = shift / 10000.0
+        weighted_dfs = weights * self._schedule_discount_factors(curve)
+        return float(weighted_dfs @ (4.0 * np.sinh(shift_decimal * times / 2.0) ** 2)) / shift_decimal ** 2
+    
+    def get_risk(self, curve: YieldCurve, shifts: List[float]) -> Dict[str, np.ndarray]:
+        """
+        Calculate DV01 and convexity for several shift sizes together.
         
-        for payment_date in self.payment_dates:
-            # Calculate coupon amount
-            coupon = self.fixed_rate / self.frequency * self.notional
+        Uses the same closed forms as get_dv01 and get_convexity, but reads the
+        base discount factors once and evaluates every shift in one matrix product.
+        
+        Args:
+            curve: Yield curve
+            shifts: Rate shifts in basis points
             
-            # Discount to present value
-            discount_factor = curve.get_discount_factor(payment_date)
-            fixed_leg_pv += coupon * discount_factor
+        Returns:
+            Dictionary with 'dv01' and 'convexity' arrays, one entry per shift
+        """
+        shifts = np.asarray(shifts, dtype=np.float64)
+        if curve.interpolation_method == 'log_linear':
+            return {
+                'dv01': np.array([self.get_dv01(curve, shift) for shift in shifts]),
+                'convexity': np.array([self.get_convexity(curve, shift) for shift in shifts]),
+            }
+        
+        times, weights = self.get_discount_weights()
+        shift_decimals = shifts / 10000.0
+        weighted_dfs = weights * self._schedule_discount_factors(curve)
+        scaled_times = np.multiply.outer(times, shift_decimals)
+        return {
+            'dv01': (weighted_dfs @ -np.expm1(-scaled_times)) / shift_decimals,
+            'convexity': (weighted_dfs @ (4.0 * np.sinh(scaled_times / 2.0) ** 2)) / shift_decimals ** 2,
+        }
+    
+    def get_discount_weights(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the swap value as a linear combination of discount factors.
+        
+        Returns:
+            Tuple of (times, weights) such that price = sum(weights * DF(times))
+        """
+        times = self._schedule_times
+        coupon = self.fixed_rate / self.frequency * self.notional
+        weights = np.full(len(times), -coupon)
+        weights[0] = self.notional
+        weights[1] = -self.notional
+        return times, weights
+    
+    @classmethod
+    def price_batch(cls, swaps: List['IRSwap'], curve: YieldCurve) -> np.ndarray:
+        """
+        Price several swaps from one discount factor lookup.
+        
+        Args:
+            swaps: List of swaps
+            curve: Yield curve
+            
+        Returns:
+            Array of swap values, one per swap
+        """
+        legs = [swap.get_discount_weights() for swap in swaps]
+        times = np.concatenate([t for t, _ in legs])
+        weights = np.concatenate([w for _, w in legs])
+        starts = np.cumsum([0] + [len(t) for t, _ in legs[:-1]])
+        return np.add.reduceat(weights * curve.get_discount_factors(times), starts)
+    
+    def _schedule_discount_factors(self, curve: YieldCurve) -> np.ndarray:
+        """
+        Discount factors at _schedule_times, reused while pricing against the same curve.
         
-        return fixed_leg_pv
+        Curves are never modified after construction, so the curve object itself
+        identifies the cached values; a weak reference keeps the cache from
+        holding old curves alive. Misses fall back to the curve's own cache,
+        shared by every swap with the same schedule.
+        """
+        if self._df_cache is not None and self._df_cache[0]() is curve:
+            return self._df_cache[1]
+        key = self._schedule_times.tobytes()
+        discount_factors = curve._schedule_df_cache.get(key)
+        if discount_factors is None:
+            discount_factors = curve.get_discount_factors(self._schedule_times)
+            discount_factors.flags.writeable = False
+            curve._schedule_df_cache[key] = discount_factors
+        self._df_cache = (weakref.ref(curve), discount_factors)
+        return discount_factors
+    
+    def _price_fixed_leg(self, curve: YieldCurve) -> float:
+        """Price the fixed leg of the swap."""
+        discount_factors = self._schedule_discount_factors(curve)[2:]
+        return _fixed_leg_pv(discount_factors, self.fixed_rate, self.frequency, self.notional)
     
     def _price_floating_leg(self, curve: YieldCurve) -> float:
         """
@@ -177,14 +378,8 @@ class IRSwap(Instrument):
         
         This represents the present value of receiving floating payments.
         """
-        # Get discount factors
-        start_df = curve.get_discount_factor(self.start_date)
-        maturity_df = curve.get_discount_factor(self.maturity)
-        
-        # Floating leg PV = Notional * (DF_start - DF_maturity)
-        floating_leg_pv = self.notional * (start_df - maturity_df)
-        
-        return floating_leg_pv
+        start_df, maturity_df = self._schedule_discount_factors(curve)[:2]
+        return _floating_leg_pv(start_df, maturity_df, self.notional)
     
     def get_par_rate(self, curve: YieldCurve) -> float:
         """
@@ -194,20 +389,54 @@ class IRSwap(Instrument):
         Returns:
             Par swap rate
         """
+        # The par rate depends only on the schedule, not the fixed rate or notional
+        key = (self.start_date, self.maturity, self.frequency)
+        cached = curve._par_cache.get(key)
+        if cached is not None:
+            return cached
+        
         # Calculate floating leg value
         floating_leg_pv = self._price_floating_leg(curve)
         
         # Calculate annuity (present value of 1 unit per period)
-        annuity = 0.0
-        for payment_date in self.payment_dates:
-            discount_factor = curve.get_discount_factor(payment_date)
-            annuity += discount_factor / self.frequency
+        annuity = float(self._schedule_discount_factors(curve)[2:].sum()) / self.frequency
         
         # Par rate = Floating leg PV / Annuity
         if annuity == 0:
             raise ValueError("Annuity is zero - cannot calculate par rate")
         
-        return floating_leg_pv / (annuity * self.notional)
+        par_rate = floating_leg_pv / (annuity * self.notional)
+        curve._par_cache[key] = par_rate
+        return par_rate
+    
+    @classmethod
+    def get_par_rates(cls, swaps: List['IRSwap'], curve: YieldCurve) -> np.ndarray:
+        """
+        Calculate par rates for several swaps from one discount factor lookup.
+        
+        Args:
+            swaps: List of swaps
+            curve: Yield curve
+            
+        Returns:
+            Array of par swap rates, one per swap
+        """
+        # Each swap contributes [start, maturity, payment dates...] to one stacked schedule
+        times = np.concatenate([swap._schedule_times for swap in swaps])
+        float_weights = np.concatenate([[1.0, -1.0] + [0.0] * len(swap.payment_dates) for swap in swaps])
+        annuity_weights = np.concatenate(
+            [[0.0, 0.0] + [1.0 / swap.frequency] * len(swap.payment_dates) for swap in swaps]
+        )
+        starts = np.cumsum([0] + [2 + len(swap.payment_dates) for swap in swaps[:-1]])
+        
+        dfs = curve.get_discount_factors(times)
+        floating = np.add.reduceat(float_weights * dfs, starts)
+        annuities = np.add.reduceat(annuity_weights * dfs, starts)
+        
+        if np.any(annuities == 0):
+            raise ValueError("Annuity is zero - cannot calculate par rate")
+        
+        return floating / annuities
     
     def get_forward_rate_sensitivity(self, curve: YieldCurve, start_tenor: float, end_tenor: float) -> float:
         """
@@ -230,24 +459,44 @@ class IRSwap(Instrument):
             return self.notional * period_length * avg_df * 0.0001  # Per 1bp
         return 0.0
     
-    def get_cashflows(self, curve: YieldCurve) -> Dict[str, List[float]]:
-        """Get cashflow dates and amounts."""
-        fixed_cashflows = []
-        floating_cashflows = []
+    def get_forward_rate_sensitivities(self, curve: YieldCurve, segments: np.ndarray) -> np.ndarray:
+        """
+        Calculate sensitivities to several forward rate segments at once.
+        
+        Same measure as get_forward_rate_sensitivity, with the discount factors
+        at every segment boundary taken from a single curve lookup.
         
+        Args:
+            curve: Yield curve
+            segments: Array-like of (start_tenor, end_tenor) pairs
+            
+        Returns:
+            Array of sensitivities (per 1bp), one per segment
+        """
+        segments = np.asarray(segments, dtype=np.float64).reshape(-1, 2)
+        starts, ends = segments[:, 0], segments[:, 1]
+        
+        dfs = curve.get_discount_factors(np.concatenate([starts, ends]))
+        avg_dfs = (dfs[:len(starts)] + dfs[len(starts):]) / 2
+        
+        inside = (self.start_date <= starts) & (ends <= self.maturity)
+        return np.where(inside, self.notional * (ends - starts) * avg_dfs * 0.0001, 0.0)
+    
+    def get_cashflows(self, curve: YieldCurve) -> Dict[str, np.ndarray]:
+        """Get cashflow dates and amounts as float64 arrays."""
         # Fixed leg cashflows
-        for payment_date in self.payment_dates:
-            fixed_coupon = self.fixed_rate / self.frequency * self.notional
-            fixed_cashflows.append(fixed_coupon)
-        
-        # Floating leg cashflows (forward rates for each period)
-        prev_date = self.start_date
-        for payment_date in self.payment_dates:
-            if prev_date < payment_date:
-                forward_rate = curve.get_forward_rate(prev_date, payment_date)
-                floating_coupon = forward_rate / self.frequency * self.notional
-                floating_cashflows.append(floating_coupon)
-            prev_date = payment_date
+        fixed_coupon = self.fixed_rate / self.frequency * self.notional
+        fixed_cashflows = np.full(len(self.payment_dates), fixed_coupon)
+        
+        # Floating leg cashflows (forward rates for each period), from one curve lookup:
+        # the forward over [t1, t2] is (r2 * t2 - r1 * t1) / (t2 - t1)
+        times = np.concatenate([[self.start_date], self.payment_dates])
+        zero_rates = curve.get_rates(times)
+        periods = np.diff(times)
+        accrued = np.diff(zero_rates * times)
+        positive = periods > 0
+        forward_rates = accrued[positive] / periods[positive]
+        floating_cashflows = forward_rates / self.frequency * self.notional
         
         return {
             'dates': self.payment_dates,
@@ -255,6 +504,12 @@ class IRSwap(Instrument):
             'floating': floating_cashflows
         }
     
+    def __getstate__(self):
+        # Weak references cannot be pickled; the cache is rebuilt on first use
+        state = self.__dict__.copy()
+        state['_df_cache'] = None
+        return state
+    
     def __repr__(self):
         if self.is_forward_starting:
             return f"IRSwap(forward: {self.start_date}Y-{self.maturity}Y, rate={self.fixed_rate:.4f})"
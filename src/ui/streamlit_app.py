@@ -2,24 +2,162 @@
 Streamlit web interface for the Interest Rate Curve Builder.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import pyarrow.csv as pv
 
 # Import our modules
 from ..core.curve import YieldCurve
 from ..core.instruments import IRSwap, IRFuture, Instrument
 from ..core.bootstrapping import CurveBootstrapper
 from ..utils.market_data import (
-    load_sample_data, create_sample_instruments, create_sample_futures,
+    create_sample_instruments, create_sample_futures,
     create_mixed_instruments, get_sample_market_prices, save_sample_data_to_csv
 )
-from ..utils.visualization import (
-    plot_curve, plot_instruments, plot_curve_comparison,
-    plot_sensitivity_analysis, create_dashboard_data
-)
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+    from ..utils.visualization import DashboardData
+
+# Tables up to this many rows skip the interactive grid and render with st.table
+_TABLE_MAX_ROWS = 50
+
+# Sample instruments for the sensitivity page, built once at import
+_DEFAULT_SWAP = IRSwap(0.0, 5.0, 0.035, notional=1.0)
+_DEFAULT_FUTURE = IRFuture(0.0, 0.25, notional=1.0)
+
+# Plotting helpers are imported inside the cached wrappers below so that
+# pages which never draw a chart don't pay for loading plotly.
+
+
+def _curve_key(curve: YieldCurve) -> tuple:
+    """Cheap fingerprint of a curve for Streamlit's cache."""
+    return (
+        curve.tenors.tobytes(), curve.rates.tobytes(), curve.interpolation_method,
+        curve.cutoff_tenor, curve.pre_cutoff_method, curve.post_cutoff_method
+    )
+
+
+def _instrument_key(instrument: Instrument) -> tuple:
+    """Cheap fingerprint of an instrument for Streamlit's cache."""
+    return (
+        type(instrument).__name__, instrument.start_date, instrument.maturity,
+        getattr(instrument, 'fixed_rate', None), getattr(instrument, 'frequency', None),
+        getattr(instrument, 'contract_size', None), instrument.notional
+    )
+
+
+# Fingerprints used in place of Streamlit's reflective hashing of our objects
+_HASH_FUNCS = {YieldCurve: _curve_key, IRSwap: _instrument_key, IRFuture: _instrument_key}
+
+
+def _parse_csv_floats(text: str) -> np.ndarray:
+    """Parse a comma-separated list of numbers into a float array."""
+    # np.fromstring skips a trailing separator and reads "" as no numbers; reject
+    # empty fields the way float() on each one did
+    if any(not field.strip() for field in text.split(",")):
+        raise ValueError(f"Could not parse numbers from '{text}'")
+    try:
+        return np.fromstring(text, sep=",")
+    except ValueError:
+        raise ValueError(f"Could not parse numbers from '{text}'")
+
+
+def _show_table(df: pd.DataFrame, formats: Optional[dict] = None):
+    """Render a small table as static HTML, falling back to st.dataframe when large."""
+    styled = df.style.format(formats or {}).hide(axis="index")
+    if len(df) <= _TABLE_MAX_ROWS:
+        st.table(styled)
+    else:
+        st.dataframe(styled)
+
+
+@st.cache_resource(show_spinner=False)
+def _get_bootstrapper() -> CurveBootstrapper:
+    """Process-wide CurveBootstrapper shared by every page."""
+    return CurveBootstrapper()
+
+
+@st.cache_resource(show_spinner=False)
+def _get_io_executor() -> ThreadPoolExecutor:
+    """Small process-wide thread pool for file writes."""
+    return ThreadPoolExecutor(max_workers=2)
+
+
+@st.cache_resource(show_spinner=False)
+def _build_sample_curve() -> YieldCurve:
+    """Bootstrap the sample par-swap curve once per process."""
+    instruments = create_sample_instruments()
+    market_prices = [0.0] * len(instruments)  # Par swaps
+    
+    bootstrapper = _get_bootstrapper()
+    return bootstrapper.bootstrap_curve(instruments, market_prices)
+
+
+@st.cache_data(show_spinner=False, hash_funcs=_HASH_FUNCS)
+def _dashboard_data(curve: YieldCurve) -> "DashboardData":
+    """Cached wrapper around create_dashboard_data."""
+    from ..utils.visualization import create_dashboard_data
+    return create_dashboard_data(curve)
+
+
+@st.cache_data(show_spinner=False, hash_funcs=_HASH_FUNCS)
+def _cached_plot_curve(curve: YieldCurve, title: str, **kwargs) -> "go.Figure":
+    """Cached wrapper around plot_curve."""
+    from ..utils.visualization import plot_curve
+    return plot_curve(curve, title, **kwargs)
+
+
+@st.cache_data(show_spinner=False, hash_funcs=_HASH_FUNCS)
+def _cached_plot_curve_comparison(curves: list, names: list) -> "go.Figure":
+    """Cached wrapper around plot_curve_comparison."""
+    from ..utils.visualization import plot_curve_comparison
+    return plot_curve_comparison(curves, names)
+
+
+@st.cache_data(show_spinner=False, hash_funcs=_HASH_FUNCS)
+def _cached_plot_sensitivity_analysis(instrument: Instrument, curve: YieldCurve,
+                                      shifts: list) -> "go.Figure":
+    """Cached wrapper around plot_sensitivity_analysis."""
+    from ..utils.visualization import plot_sensitivity_analysis
+    return plot_sensitivity_analysis(instrument, curve, shifts)
+
+
+@st.cache_data(show_spinner=False, hash_funcs=_HASH_FUNCS)
+def _curve_csv(curve: YieldCurve) -> tuple:
+    """Cached curve table and its CSV encoding for export."""
+    curve_df = curve.to_dataframe()
+    return curve_df, curve_df.to_csv(index=False).encode("utf-8")
+
+
+@st.cache_resource(show_spinner=False)
+def _swap_curve(tenors_input: str, rates_input: str) -> Optional[YieldCurve]:
+    """Parse swap tenors/rates (in %) and bootstrap; None if the counts differ."""
+    tenors = _parse_csv_floats(tenors_input)
+    rates = _parse_csv_floats(rates_input) / 100
+    
+    if tenors.size != rates.size:
+        return None
+    
+    return _get_bootstrapper().bootstrap_from_swaps(rates, tenors)
+
+
+@st.cache_data(show_spinner=False)
+def _shift_grid(min_shift: int, max_shift: int, step: int) -> np.ndarray:
+    """Grid of parallel shifts in basis points, inclusive of max_shift."""
+    return np.arange(min_shift, max_shift + 1, step, dtype=np.float64)
+
+
+@st.cache_resource(show_spinner=False)
+def _build_comparison_curves(tenors: tuple) -> tuple:
+    """Build the flat and steep reference curves for a tenor grid."""
+    tenors = np.asarray(tenors, dtype=np.float64)
+    flat_curve = YieldCurve(tenors, np.full_like(tenors, 0.03))
+    steep_curve = YieldCurve(tenors, 0.02 + 0.01 * tenors)
+    return flat_curve, steep_curve
 
 
 def main():
@@ -34,21 +172,8 @@ def main():
     st.markdown("Build and analyze yield curves from interest rate futures and swaps")
     
     # Sidebar navigation
-    page = st.sidebar.selectbox(
-        "Choose a page:",
-        ["🏠 Dashboard", "🔧 Curve Builder", "💰 Instrument Pricing", "📊 Analysis", "📁 Data Management"]
-    )
-    
-    if page == "🏠 Dashboard":
-        show_dashboard()
-    elif page == "🔧 Curve Builder":
-        show_curve_builder()
-    elif page == "💰 Instrument Pricing":
-        show_instrument_pricing()
-    elif page == "📊 Analysis":
-        show_analysis()
-    elif page == "📁 Data Management":
-        show_data_management()
+    page = st.sidebar.selectbox("Choose a page:", list(PAGES))
+    PAGES[page]()
 
 
 def show_dashboard():
@@ -56,34 +181,29 @@ def show_dashboard():
     st.header("🏠 Dashboard")
     
     # Create sample curve for demonstration
-    sample_data = load_sample_data()
-    instruments = create_sample_instruments()
-    market_prices = [0.0] * len(instruments)  # Par swaps
-    
-    bootstrapper = CurveBootstrapper()
-    curve = bootstrapper.bootstrap_curve(instruments, market_prices)
+    curve = _build_sample_curve()
     
     # Get dashboard data
-    dashboard_data = create_dashboard_data(curve)
+    dashboard_data = _dashboard_data(curve)
     
     # Key metrics
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("3M Rate", f"{dashboard_data['short_rate']:.2f}%")
+        st.metric("3M Rate", f"{dashboard_data.short_rate:.2f}%")
     
     with col2:
-        st.metric("10Y Rate", f"{dashboard_data['long_rate']:.2f}%")
+        st.metric("10Y Rate", f"{dashboard_data.long_rate:.2f}%")
     
     with col3:
-        st.metric("Curve Slope", f"{dashboard_data['slope']:.2f}%")
+        st.metric("Curve Slope", f"{dashboard_data.slope:.2f}%")
     
     with col4:
-        st.metric("1Y Forward", f"{dashboard_data['forward_1y']:.2f}%")
+        st.metric("1Y Forward", f"{dashboard_data.forward_1y:.2f}%")
     
     # Curve plot
     st.subheader("Current Yield Curve")
-    fig = plot_curve(curve, "Sample Yield Curve", show_discount_factors=True)
+    fig = _cached_plot_curve(curve, "Sample Yield Curve", show_discount_factors=True, compact=True)
     st.plotly_chart(fig, use_container_width=True)
     
     # Recent activity
@@ -96,19 +216,11 @@ def show_curve_builder():
     st.header("🔧 Curve Builder")
     
     # Method selection
-    method = st.selectbox(
-        "Choose curve building method:",
-        ["From Market Instruments", "From Swap Rates", "Manual Input"]
-    )
-    
-    if method == "From Market Instruments":
-        show_instrument_based_builder()
-    elif method == "From Swap Rates":
-        show_swap_based_builder()
-    elif method == "Manual Input":
-        show_manual_curve_builder()
+    method = st.selectbox("Choose curve building method:", list(CURVE_BUILDERS))
+    CURVE_BUILDERS[method]()
 
 
+@st.fragment
 def show_instrument_based_builder():
     """Show instrument-based curve builder."""
     st.subheader("Build Curve from Market Instruments")
@@ -119,7 +231,13 @@ def show_instrument_based_builder():
         market_prices = get_sample_market_prices()
         
         st.session_state.instruments = instruments
-        st.session_state.market_prices = market_prices
+        st.session_state.inst_df = pd.DataFrame({
+            'Index': np.arange(len(instruments)),
+            'Type': [type(instrument).__name__ for instrument in instruments],
+            'Tenor': np.array([instrument.maturity for instrument in instruments], dtype=np.float64),
+            'Rate/Price': np.asarray(market_prices, dtype=np.float64),
+            'Notional': np.array([instrument.notional for instrument in instruments], dtype=np.float64)
+        })
     
     # Manual input
     st.subheader("Add Instruments")
@@ -144,7 +262,13 @@ def show_instrument_based_builder():
     if st.button("Add Instrument"):
         if 'instruments' not in st.session_state:
             st.session_state.instruments = []
-            st.session_state.market_prices = []
+            st.session_state.inst_df = pd.DataFrame({
+                'Index': pd.Series(dtype=np.int64),
+                'Type': pd.Series(dtype=object),
+                'Tenor': pd.Series(dtype=np.float64),
+                'Rate/Price': pd.Series(dtype=np.float64),
+                'Notional': pd.Series(dtype=np.float64)
+            })
         
         if instrument_type == "swap":
             instrument = IRSwap(0.0, tenor, rate, notional=notional)
@@ -153,8 +277,12 @@ def show_instrument_based_builder():
             instrument = IRFuture(0.0, tenor, notional=notional)
             market_price = price
         
+        # Append a single row rather than rebuilding the table
+        inst_df = st.session_state.inst_df
         st.session_state.instruments.append(instrument)
-        st.session_state.market_prices.append(market_price)
+        inst_df.loc[len(inst_df)] = (
+            len(inst_df), type(instrument).__name__, instrument.maturity, market_price, instrument.notional
+        )
         
         st.success(f"Added {instrument_type} with tenor {tenor}Y")
     
@@ -162,33 +290,22 @@ def show_instrument_based_builder():
     if 'instruments' in st.session_state and st.session_state.instruments:
         st.subheader("Current Instruments")
         
-        data = []
-        for i, (instrument, price) in enumerate(zip(st.session_state.instruments, st.session_state.market_prices)):
-            data.append({
-                'Index': i,
-                'Type': type(instrument).__name__,
-                'Tenor': f"{instrument.maturity:.1f}Y",
-                'Rate/Price': f"{price:.4f}",
-                'Notional': instrument.notional
-            })
-        
-        df = pd.DataFrame(data)
-        st.dataframe(df)
+        _show_table(st.session_state.inst_df, {'Tenor': "{:.1f}Y", 'Rate/Price': "{:.4f}"})
         
         # Build curve button
         if st.button("Build Curve"):
             with st.spinner("Building curve..."):
-                bootstrapper = CurveBootstrapper()
+                bootstrapper = _get_bootstrapper()
                 curve = bootstrapper.bootstrap_curve(
                     st.session_state.instruments,
-                    st.session_state.market_prices
+                    st.session_state.inst_df['Rate/Price'].to_numpy()
                 )
                 
                 st.session_state.current_curve = curve
                 st.success("Curve built successfully!")
                 
                 # Show curve
-                fig = plot_curve(curve, "Bootstrapped Yield Curve")
+                fig = _cached_plot_curve(curve, "Bootstrapped Yield Curve")
                 st.plotly_chart(fig, use_container_width=True)
 
 
@@ -221,23 +338,18 @@ def show_swap_based_builder():
     
     if st.button("Build Curve from Swaps"):
         try:
-            # Parse inputs
-            tenors = [float(x.strip()) for x in tenors_input.split(",")]
-            rates = [float(x.strip()) / 100 for x in rates_input.split(",")]
+            # Parse and bootstrap (cached on the raw input strings)
+            curve = _swap_curve(tenors_input, rates_input)
             
-            if len(tenors) != len(rates):
+            if curve is None:
                 st.error("Number of tenors and rates must match!")
                 return
             
-            # Build curve
-            bootstrapper = CurveBootstrapper()
-            curve = bootstrapper.bootstrap_from_swaps(rates, tenors)
-            
             st.session_state.current_curve = curve
             st.success("Curve built successfully!")
             
             # Show curve
-            fig = plot_curve(curve, "Swap-Based Yield Curve")
+            fig = _cached_plot_curve(curve, "Swap-Based Yield Curve")
             st.plotly_chart(fig, use_container_width=True)
             
         except Exception as e:
@@ -345,10 +457,10 @@ def show_manual_curve_builder():
     if st.button("Create Curve"):
         try:
             # Parse inputs
-            tenors = [float(x.strip()) for x in tenors_input.split(",")]
-            rates = [float(x.strip()) / 100 for x in rates_input.split(",")]
+            tenors = _parse_csv_floats(tenors_input)
+            rates = _parse_csv_floats(rates_input) / 100
             
-            if len(tenors) != len(rates):
+            if tenors.size != rates.size:
                 st.error("Number of tenors and rates must match!")
                 return
             
@@ -365,7 +477,7 @@ def show_manual_curve_builder():
             st.success("Curve created successfully!")
             
             # Show curve
-            fig = plot_curve(curve, "Manual Yield Curve")
+            fig = _cached_plot_curve(curve, "Manual Yield Curve")
             st.plotly_chart(fig, use_container_width=True)
             
         except Exception as e:
@@ -383,17 +495,11 @@ def show_instrument_pricing():
     curve = st.session_state.current_curve
     
     # Instrument type selection
-    instrument_type = st.selectbox(
-        "Choose instrument type:",
-        ["Interest Rate Swap", "Interest Rate Future"]
-    )
-    
-    if instrument_type == "Interest Rate Swap":
-        show_swap_pricing(curve)
-    else:
-        show_future_pricing(curve)
+    instrument_type = st.selectbox("Choose instrument type:", list(PRICERS))
+    PRICERS[instrument_type](curve)
 
 
+@st.fragment
 def show_swap_pricing(curve):
     """Show swap pricing interface."""
     st.subheader("Interest Rate Swap Pricing")
@@ -438,15 +544,16 @@ def show_swap_pricing(curve):
             st.subheader("Cashflows")
             cf_df = pd.DataFrame({
                 'Date': cashflows['dates'],
-                'Fixed': [f"{cf:.6f}" for cf in cashflows['fixed']],
-                'Floating': [f"{cf:.6f}" for cf in cashflows['floating']]
+                'Fixed': cashflows['fixed'],
+                'Floating': cashflows['floating']
             })
-            st.dataframe(cf_df)
+            _show_table(cf_df, {'Fixed': "{:.6f}", 'Floating': "{:.6f}"})
             
         except Exception as e:
             st.error(f"Error pricing swap: {str(e)}")
 
 
+@st.fragment
 def show_future_pricing(curve):
     """Show future pricing interface."""
     st.subheader("Interest Rate Future Pricing")
@@ -501,17 +608,8 @@ def show_analysis():
     curve = st.session_state.current_curve
     
     # Analysis options
-    analysis_type = st.selectbox(
-        "Choose analysis type:",
-        ["Curve Analysis", "Sensitivity Analysis", "Curve Comparison"]
-    )
-    
-    if analysis_type == "Curve Analysis":
-        show_curve_analysis(curve)
-    elif analysis_type == "Sensitivity Analysis":
-        show_sensitivity_analysis(curve)
-    else:
-        show_curve_comparison(curve)
+    analysis_type = st.selectbox("Choose analysis type:", list(ANALYSES))
+    ANALYSES[analysis_type](curve)
 
 
 def show_curve_analysis(curve):
@@ -519,25 +617,25 @@ def show_curve_analysis(curve):
     st.subheader("Curve Analysis")
     
     # Key metrics
-    dashboard_data = create_dashboard_data(curve)
+    dashboard_data = _dashboard_data(curve)
     
     col1, col2 = st.columns(2)
     
     with col1:
         st.write("**Key Metrics:**")
-        st.write(f"- 3M Rate: {dashboard_data['short_rate']:.2f}%")
-        st.write(f"- 10Y Rate: {dashboard_data['long_rate']:.2f}%")
-        st.write(f"- Curve Slope: {dashboard_data['slope']:.2f}%")
-        st.write(f"- 1Y Forward: {dashboard_data['forward_1y']:.2f}%")
+        st.write(f"- 3M Rate: {dashboard_data.short_rate:.2f}%")
+        st.write(f"- 10Y Rate: {dashboard_data.long_rate:.2f}%")
+        st.write(f"- Curve Slope: {dashboard_data.slope:.2f}%")
+        st.write(f"- 1Y Forward: {dashboard_data.forward_1y:.2f}%")
     
     with col2:
         st.write("**Discount Factors:**")
-        st.write(f"- 1Y: {dashboard_data['df_1y']:.4f}")
-        st.write(f"- 5Y: {dashboard_data['df_5y']:.4f}")
-        st.write(f"- 10Y: {dashboard_data['df_10y']:.4f}")
+        st.write(f"- 1Y: {dashboard_data.df_1y:.4f}")
+        st.write(f"- 5Y: {dashboard_data.df_5y:.4f}")
+        st.write(f"- 10Y: {dashboard_data.df_10y:.4f}")
     
     # Detailed curve plot
-    fig = plot_curve(curve, "Detailed Curve Analysis", show_discount_factors=True, show_forward_rates=True)
+    fig = _cached_plot_curve(curve, "Detailed Curve Analysis", show_discount_factors=True, show_forward_rates=True)
     st.plotly_chart(fig, use_container_width=True)
 
 
@@ -545,28 +643,26 @@ def show_sensitivity_analysis(curve):
     """Show sensitivity analysis."""
     st.subheader("Sensitivity Analysis")
     
-    # Create sample instrument
-    swap = IRSwap(0.0, 5.0, 0.035, notional=1.0)
-    
     # Analysis parameters
     col1, col2 = st.columns(2)
     
     with col1:
         min_shift = st.number_input("Min Shift (bp)", value=-50, step=5)
         max_shift = st.number_input("Max Shift (bp)", value=50, step=5)
-        step = st.number_input("Step (bp)", value=5, step=1)
+        step = st.number_input("Step (bp)", min_value=1, value=5, step=1)
     
     with col2:
         instrument_type = st.selectbox("Instrument", ["5Y Swap", "3M Future"])
         
         if instrument_type == "5Y Swap":
-            instrument = swap
+            instrument = _DEFAULT_SWAP
         else:
-            instrument = IRFuture(0.0, 0.25, notional=1.0)
+            instrument = _DEFAULT_FUTURE
+    
+    shifts = _shift_grid(min_shift, max_shift, step)
     
     if st.button("Run Sensitivity Analysis"):
-        shifts = list(range(min_shift, max_shift + 1, step))
-        fig = plot_sensitivity_analysis(instrument, curve, shifts)
+        fig = _cached_plot_sensitivity_analysis(instrument, curve, shifts)
         st.plotly_chart(fig, use_container_width=True)
 
 
@@ -575,13 +671,12 @@ def show_curve_comparison(curve):
     st.subheader("Curve Comparison")
     
     # Create comparison curves
-    flat_curve = YieldCurve(curve.tenors, [0.03] * len(curve.tenors))
-    steep_curve = YieldCurve(curve.tenors, [0.02 + 0.01 * t for t in curve.tenors])
+    flat_curve, steep_curve = _build_comparison_curves(tuple(curve.tenors))
     
     curves = [curve, flat_curve, steep_curve]
     names = ["Current", "Flat 3%", "Steep"]
     
-    fig = plot_curve_comparison(curves, names)
+    fig = _cached_plot_curve_comparison(curves, names)
     st.plotly_chart(fig, use_container_width=True)
 
 
@@ -594,10 +689,9 @@ def show_data_management():
         st.subheader("Export Curve")
         
         curve = st.session_state.current_curve
-        curve_df = curve.to_dataframe()
+        curve_df, csv = _curve_csv(curve)
         
         # Download button
-        csv = curve_df.to_csv(index=False)
         st.download_button(
             label="Download Curve Data",
             data=csv,
@@ -605,7 +699,7 @@ def show_data_management():
             mime="text/csv"
         )
         
-        st.dataframe(curve_df)
+        _show_table(curve_df)
     
     # Import data
     st.subheader("Import Market Data")
@@ -614,9 +708,13 @@ def show_data_management():
     
     if uploaded_file is not None:
         try:
-            data = pd.read_csv(uploaded_file)
+            # Arrow parses the upload in blocks and hands its buffers over to
+            # pandas as it converts, instead of holding both copies at once
+            table = pv.read_csv(uploaded_file, read_options=pv.ReadOptions(block_size=1 << 20))
+            data = table.to_pandas(self_destruct=True)
+            del table
             st.write("Uploaded data:")
-            st.dataframe(data)
+            st.dataframe(data.head(1000))
             
             if st.button("Create Instruments from Data"):
                 # This would need to be implemented based on your data format
@@ -629,9 +727,38 @@ def show_data_management():
     st.subheader("Sample Data")
     
     if st.button("Generate Sample Data"):
-        save_sample_data_to_csv()
+        future = _get_io_executor().submit(save_sample_data_to_csv)
+        with st.spinner("Writing sample data..."):
+            future.result()
         st.success("Sample data saved to data/sample_data.csv")
 
 
+# Label -> handler tables for the page and sub-page selectors
+PAGES = {
+    "🏠 Dashboard": show_dashboard,
+    "🔧 Curve Builder": show_curve_builder,
+    "💰 Instrument Pricing": show_instrument_pricing,
+    "📊 Analysis": show_analysis,
+    "📁 Data Management": show_data_management,
+}
+
+CURVE_BUILDERS = {
+    "From Market Instruments": show_instrument_based_builder,
+    "From Swap Rates": show_swap_based_builder,
+    "Manual Input": show_manual_curve_builder,
+}
+
+PRICERS = {
+    "Interest Rate Swap": show_swap_pricing,
+    "Interest Rate Future": show_future_pricing,
+}
+
+ANALYSES = {
+    "Curve Analysis": show_curve_analysis,
+    "Sensitivity Analysis": show_sensitivity_analysis,
+    "Curve Comparison": show_curve_comparison,
+}
+
+
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -2,13 +2,11 @@
 Visualization utilities for yield curves and instruments.
 """
 
-import matplotlib.pyplot as plt
 import plotly.graph_objects as go
-import plotly.express as px
 from plotly.subplots import make_subplots
 import numpy as np
 import pandas as pd
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, NamedTuple
 from ..core.curve import YieldCurve
 from ..core.instruments import Instrument
 
@@ -16,7 +14,8 @@ from ..core.instruments import Instrument
 def plot_curve(curve: YieldCurve, 
                title: str = "Yield Curve",
                show_discount_factors: bool = False,
-               show_forward_rates: bool = False) -> go.Figure:
+               show_forward_rates: bool = False,
+               compact: bool = False) -> go.Figure:
     """
     Create an interactive plot of the yield curve.
     
@@ -25,6 +24,7 @@ def plot_curve(curve: YieldCurve,
         title: Plot title
         show_discount_factors: Whether to show discount factors
         show_forward_rates: Whether to show forward rates
+        compact: Use plain x/y hover and no transition animation (for dashboards)
         
     Returns:
         Plotly figure object
@@ -36,81 +36,87 @@ def plot_curve(curve: YieldCurve,
     if show_forward_rates:
         subplot_titles.append("Forward Rates")
     
-    fig = make_subplots(
-        rows=len(subplot_titles), 
-        cols=1,
-        subplot_titles=subplot_titles,
-        vertical_spacing=0.1
-    )
-    
     # Generate smooth curve for plotting
     tenors_smooth = np.linspace(curve.tenors[0], curve.tenors[-1], 100)
-    rates_smooth = [curve.get_rate(t) for t in tenors_smooth]
+    rates_smooth = curve.get_rates(tenors_smooth)
+    
+    # Collect (trace, row) pairs and hand them to plotly in one go
+    traces = []
+    rows = []
     
     # Plot zero-coupon rates
-    fig.add_trace(
+    traces.append(
         go.Scatter(
-            x=curve.tenors,
-            y=curve.rates * 100,  # Convert to percentage
+            x=np.asarray(curve.tenors, dtype=np.float64),
+            y=np.asarray(curve.rates, dtype=np.float64) * 100,  # Convert to percentage
             mode='markers',
             name='Market Points',
             marker=dict(size=8, color='red')
-        ),
-        row=1, col=1
+        )
     )
+    rows.append(1)
     
-    fig.add_trace(
-        go.Scatter(
+    # Dense line traces use WebGL (Scattergl) to keep browser redraws cheap
+    traces.append(
+        go.Scattergl(
             x=tenors_smooth,
-            y=np.array(rates_smooth) * 100,
+            y=rates_smooth * 100,
             mode='lines',
             name='Interpolated Curve',
             line=dict(color='blue', width=2)
-        ),
-        row=1, col=1
+        )
     )
+    rows.append(1)
     
     current_row = 2
     
     # Plot discount factors if requested
     if show_discount_factors:
-        discount_factors = [curve.get_discount_factor(t) for t in tenors_smooth]
+        discount_factors = curve.get_discount_factors(tenors_smooth)
         
-        fig.add_trace(
-            go.Scatter(
+        traces.append(
+            go.Scattergl(
                 x=tenors_smooth,
                 y=discount_factors,
                 mode='lines',
                 name='Discount Factors',
                 line=dict(color='green', width=2)
-            ),
-            row=current_row, col=1
+            )
         )
+        rows.append(current_row)
         current_row += 1
     
     # Plot forward rates if requested
     if show_forward_rates:
-        forward_rates = []
-        forward_tenors = []
-        for i in range(len(tenors_smooth) - 1):
-            start_tenor = tenors_smooth[i]
-            end_tenor = tenors_smooth[i + 1]
-            if start_tenor < end_tenor:  # Ensure proper ordering
-                forward_rate = curve.get_forward_rate(start_tenor, end_tenor)
-                forward_rates.append(forward_rate * 100)  # Convert to percentage
-                forward_tenors.append(start_tenor)
+        start_tenors = tenors_smooth[:-1]
+        end_tenors = tenors_smooth[1:]
+        ordered = start_tenors < end_tenors  # Ensure proper ordering
+        forward_tenors = start_tenors[ordered]
+        forward_rates = curve.get_forward_rates(forward_tenors, end_tenors[ordered]) * 100  # Convert to percentage
         
-        if forward_rates:  # Only plot if we have valid forward rates
-            fig.add_trace(
-                go.Scatter(
+        if len(forward_rates):  # Only plot if we have valid forward rates
+            traces.append(
+                go.Scattergl(
                     x=forward_tenors,
                     y=forward_rates,
                     mode='lines',
                     name='Forward Rates',
                     line=dict(color='orange', width=2)
-                ),
-                row=current_row, col=1
+                )
             )
+            rows.append(current_row)
+    
+    if len(subplot_titles) == 1:
+        # Single panel: build the figure in one shot, no subplot grid needed
+        fig = go.Figure(data=traces)
+    else:
+        fig = make_subplots(
+            rows=len(subplot_titles), 
+            cols=1,
+            subplot_titles=subplot_titles,
+            vertical_spacing=0.1
+        )
+        fig.add_traces(traces, rows=rows, cols=[1] * len(traces))
     
     # Update layout
     fig.update_layout(
@@ -121,6 +127,10 @@ def plot_curve(curve: YieldCurve,
         showlegend=True
     )
     
+    if compact:
+        fig.update_traces(hoverinfo='x+y', hovertemplate=None)
+        fig.update_layout(uirevision='curve', hovermode='x unified', transition={'duration': 0})
+    
     return fig
 
 
@@ -142,18 +152,13 @@ def plot_instruments(instruments: List[Instrument],
     model_prices = [instrument.price(curve) for instrument in instruments]
     
     # Extract tenors from instruments
-    tenors = []
-    for instrument in instruments:
-        if hasattr(instrument, 'maturity'):
-            tenors.append(instrument.maturity)
-        else:
-            tenors.append((instrument.start_date + instrument.maturity) / 2)
+    tenors = np.fromiter((instrument.effective_tenor for instrument in instruments),
+                         dtype=np.float64, count=len(instruments))
     
-    # Create figure
-    fig = go.Figure()
+    traces = []
     
     # Plot model prices
-    fig.add_trace(
+    traces.append(
         go.Scatter(
             x=tenors,
             y=model_prices,
@@ -165,7 +170,7 @@ def plot_instruments(instruments: List[Instrument],
     
     # Plot market prices if provided
     if market_prices is not None:
-        fig.add_trace(
+        traces.append(
             go.Scatter(
                 x=tenors,
                 y=market_prices,
@@ -179,7 +184,7 @@ def plot_instruments(instruments: List[Instrument],
         errors = [(mp - mp_market) / mp_market * 100 if mp_market != 0 else 0 
                  for mp, mp_market in zip(model_prices, market_prices)]
         
-        fig.add_trace(
+        traces.append(
             go.Scatter(
                 x=tenors,
                 y=errors,
@@ -189,7 +194,10 @@ def plot_instruments(instruments: List[Instrument],
                 yaxis='y2'
             )
         )
-        
+    
+    fig = go.Figure(data=traces)
+    
+    if market_prices is not None:
         # Add secondary y-axis for errors
         fig.update_layout(
             yaxis2=dict(
@@ -223,27 +231,27 @@ def plot_curve_comparison(curves: List[YieldCurve],
     Returns:
         Plotly figure object
     """
-    fig = go.Figure()
-    
     colors = ['blue', 'red', 'green', 'orange', 'purple', 'brown']
+    traces = []
     
     for i, (curve, name) in enumerate(zip(curves, curve_names)):
         color = colors[i % len(colors)]
         
         # Generate smooth curve for plotting
         tenors_smooth = np.linspace(curve.tenors[0], curve.tenors[-1], 100)
-        rates_smooth = [curve.get_rate(t) for t in tenors_smooth]
+        rates_smooth = curve.get_rates(tenors_smooth)
         
-        fig.add_trace(
+        traces.append(
             go.Scatter(
                 x=tenors_smooth,
-                y=np.array(rates_smooth) * 100,
+                y=rates_smooth * 100,
                 mode='lines',
                 name=name,
                 line=dict(color=color, width=2)
             )
         )
     
+    fig = go.Figure(data=traces)
     fig.update_layout(
         title=title,
         xaxis_title="Tenor (Years)",
@@ -256,32 +264,31 @@ def plot_curve_comparison(curves: List[YieldCurve],
 
 def plot_sensitivity_analysis(instrument: Instrument,
                             curve: YieldCurve,
-                            shifts: List[float] = None) -> go.Figure:
+                            shifts: Optional[np.ndarray] = None) -> go.Figure:
     """
     Plot sensitivity analysis for an instrument.
     
     Args:
         instrument: Financial instrument
         curve: Yield curve
-        shifts: List of rate shifts in basis points
+        shifts: Array-like of rate shifts in basis points
         
     Returns:
         Plotly figure object
     """
     if shifts is None:
-        shifts = list(range(-50, 51, 5))  # -50bp to +50bp in 5bp steps
+        shifts = np.arange(-50, 51, 5)  # -50bp to +50bp in 5bp steps
     
-    prices = []
-    dv01s = []
+    shifts = np.asarray(shifts, dtype=np.float64)
+    prices = instrument.price_shifted(curve, shifts)
     
-    for shift in shifts:
-        shifted_curve = curve.shift_curve(shift)
-        price = instrument.price(shifted_curve)
-        prices.append(price)
-        
-        # Calculate DV01
-        dv01 = instrument.get_dv01(shifted_curve)
-        dv01s.append(dv01)
+    # DV01 is the local slope of the price sweep, so differentiate the prices
+    # we already have instead of repricing around every shifted curve.
+    # Scale from per-bp to per-unit-rate to match Instrument.get_dv01.
+    if len(shifts) > 1:
+        dv01s = -np.gradient(prices, shifts) * 10000.0
+    else:
+        dv01s = np.array([instrument.get_dv01(curve.shift_curve(shift)) for shift in shifts])
     
     # Create subplots
     fig = make_subplots(
@@ -324,7 +331,20 @@ def plot_sensitivity_analysis(instrument: Instrument,
     return fig
 
 
-def create_dashboard_data(curve: YieldCurve) -> Dict[str, Any]:
+class DashboardData(NamedTuple):
+    """Key curve metrics shown on the dashboard (rates in percent)."""
+    short_rate: float
+    long_rate: float
+    slope: float
+    forward_1y: float
+    forward_2y: float
+    df_1y: float
+    df_5y: float
+    df_10y: float
+    curve_data: pd.DataFrame
+
+
+def create_dashboard_data(curve: YieldCurve) -> DashboardData:
     """
     Create data for dashboard display.
     
@@ -332,7 +352,7 @@ def create_dashboard_data(curve: YieldCurve) -> Dict[str, Any]:
         curve: Yield curve
         
     Returns:
-        Dictionary with dashboard data
+        DashboardData with key metrics and the curve table
     """
     # Calculate key metrics
     short_rate = curve.get_rate(0.25) * 100  # 3M rate
@@ -348,14 +368,14 @@ def create_dashboard_data(curve: YieldCurve) -> Dict[str, Any]:
     df_5y = curve.get_discount_factor(5.0)
     df_10y = curve.get_discount_factor(10.0)
     
-    return {
-        'short_rate': short_rate,
-        'long_rate': long_rate,
-        'slope': slope,
-        'forward_1y': forward_1y,
-        'forward_2y': forward_2y,
-        'df_1y': df_1y,
-        'df_5y': df_5y,
-        'df_10y': df_10y,
-        'curve_data': curve.to_dataframe()
-    } 
\ No newline at end of file
+    return DashboardData(
+        short_rate=short_rate,
+        long_rate=long_rate,
+        slope=slope,
+        forward_1y=forward_1y,
+        forward_2y=forward_2y,
+        df_1y=df_1y,
+        df_5y=df_5y,
+        df_10y=df_10y,
+        curve_data=curve.to_dataframe()
+    ) 
\ No newline at end of file
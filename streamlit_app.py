@@ -2,11 +2,12 @@
 Streamlit web interface for the Interest Rate Curve Builder.
 """
 
+import io
 import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import plotly.io as pio
 import sys
 from pathlib import Path
 
@@ -18,13 +19,174 @@ from src.core.curve import YieldCurve
 from src.core.instruments import IRSwap, IRFuture, Instrument
 from src.core.bootstrapping import CurveBootstrapper
 from src.utils.market_data import (
-    load_sample_data, create_sample_instruments, create_sample_futures,
-    create_mixed_instruments, get_sample_market_prices, save_sample_data_to_csv
-)
-from src.utils.visualization import (
-    plot_curve, plot_instruments, plot_curve_comparison,
-    plot_sensitivity_analysis, create_dashboard_data
+    load_sample_data, create_sample_instruments,
+    create_mixed_instruments, get_sample_market_prices
 )
+from src.utils.visualization import plot_curve, create_dashboard_data, DashboardData
+
+
+def _curve_key(curve: YieldCurve) -> tuple:
+    """Cheap fingerprint of a curve for Streamlit's cache."""
+    return (
+        curve.tenors.tobytes(), curve.rates.tobytes(), curve.interpolation_method,
+        curve.cutoff_tenor, curve.pre_cutoff_method, curve.post_cutoff_method
+    )
+
+
+def _instrument_key(instrument: Instrument) -> tuple:
+    """Cheap fingerprint of an instrument for Streamlit's cache."""
+    return (
+        type(instrument).__name__, instrument.start_date, instrument.maturity,
+        getattr(instrument, 'fixed_rate', None), getattr(instrument, 'frequency', None),
+        getattr(instrument, 'contract_size', None), instrument.notional
+    )
+
+
+# Fingerprints used in place of Streamlit's reflective hashing of our objects
+_HASH_FUNCS = {YieldCurve: _curve_key, IRSwap: _instrument_key, IRFuture: _instrument_key}
+
+# Column dtypes of the market data CSV layout (see data/sample_data.csv)
+_MARKET_DATA_DTYPES = {
+    'tenor': np.float64,
+    'rate': np.float64,
+    'market_price': np.float64,
+    'notional': np.float64
+}
+
+# Predefined swap sets for the overlap analysis tab, built once at import
+_OVERLAP_SCENARIOS = {
+    "Heavy Overlap": (
+        IRSwap(0.0, 2.0, 0.030),
+        IRSwap(0.0, 3.0, 0.035),
+        IRSwap(1.0, 3.0, 0.038),
+        IRSwap(2.0, 4.0, 0.040),
+        IRSwap(1.5, 3.5, 0.039),
+    ),
+    "Clean Partition": (
+        IRSwap(0.0, 2.0, 0.030),
+        IRSwap(2.0, 5.0, 0.035),
+        IRSwap(5.0, 10.0, 0.040),
+    ),
+    "Market Reality": (
+        IRSwap(0.0, 1.0, 0.025),   # 1Y liquid
+        IRSwap(0.0, 2.0, 0.030),   # 2Y liquid
+        IRSwap(1.0, 4.0, 0.035),   # 1Y-4Y forward
+        IRSwap(2.0, 5.0, 0.040),   # 2Y-5Y forward (slight overlap)
+        IRSwap(5.0, 10.0, 0.045),  # 5Y-10Y forward
+    ),
+    "Gaps Example": (
+        IRSwap(0.0, 1.0, 0.025),
+        IRSwap(3.0, 5.0, 0.040),
+        IRSwap(7.0, 10.0, 0.045),
+    ),
+}
+
+# Fixed curves for the par rate calculator and forward sensitivity tabs,
+# built once at import so selecting one is a dict lookup
+_SAMPLE_TENORS = [0.5, 1, 2, 3, 5, 7, 10]
+_SAMPLE_CURVES = {
+    name: YieldCurve(_SAMPLE_TENORS, rates, interpolation_method='cubic')
+    for name, rates in {
+        "Upward Sloping": [0.02, 0.025, 0.03, 0.035, 0.04, 0.042, 0.045],
+        "Flat": [0.04] * 7,
+        "Inverted": [0.05, 0.045, 0.04, 0.035, 0.03, 0.028, 0.025],
+        "Humped": [0.02, 0.03, 0.045, 0.05, 0.045, 0.04, 0.038],
+    }.items()
+}
+_SENSITIVITY_CURVE = YieldCurve([1.0, 2.0, 3.0, 5.0, 7.0, 10.0],
+                                [0.025, 0.03, 0.035, 0.04, 0.042, 0.045],
+                                interpolation_method='cubic')
+
+
+@st.cache_resource(show_spinner=False)
+def _get_bootstrapper() -> CurveBootstrapper:
+    """Process-wide CurveBootstrapper shared by every page."""
+    return CurveBootstrapper()
+
+
+@st.cache_resource(show_spinner=False)
+def _build_sample_curve() -> tuple:
+    """Bootstrap the sample par-swap curve and its dashboard metrics once per process."""
+    instruments = create_sample_instruments()
+    market_prices = [0.0] * len(instruments)  # Par swaps
+    
+    bootstrapper = _get_bootstrapper()
+    curve = bootstrapper.bootstrap_curve(instruments, market_prices)
+    return curve, create_dashboard_data(curve)
+
+
+@st.cache_data(show_spinner=False, hash_funcs=_HASH_FUNCS)
+def _dashboard_data(curve: YieldCurve) -> DashboardData:
+    """Cached wrapper around create_dashboard_data."""
+    return create_dashboard_data(curve)
+
+
+def _cached_plot_curve(curve: YieldCurve, title: str, **kwargs) -> go.Figure:
+    """Cached wrapper around plot_curve; keeps the figures of the last few curves."""
+    return pio.from_json(_curve_fig_json(curve, title, **kwargs))
+
+
+@st.cache_data(show_spinner=False, hash_funcs=_HASH_FUNCS, max_entries=4)
+def _curve_fig_json(curve: YieldCurve, title: str, **kwargs) -> str:
+    """plot_curve serialized to JSON, which is cheaper to cache than the Figure."""
+    return plot_curve(curve, title, **kwargs).to_json()
+
+
+@st.cache_resource(show_spinner=False, hash_funcs=_HASH_FUNCS)
+def _bootstrap_instruments(instruments: list, market_prices: tuple) -> YieldCurve:
+    """Bootstrap a curve from instruments, reused while the inputs are unchanged."""
+    bootstrapper = _get_bootstrapper()
+    return bootstrapper.bootstrap_curve(instruments, list(market_prices))
+
+
+@st.cache_resource(show_spinner=False)
+def _bootstrap_swaps(rates: np.ndarray, tenors: np.ndarray) -> YieldCurve:
+    """Bootstrap a curve from par swap rates, reused while the inputs are unchanged."""
+    bootstrapper = _get_bootstrapper()
+    return bootstrapper.bootstrap_from_swaps(rates, tenors)
+
+
+@st.cache_data(show_spinner=False)
+def _shift_grid(min_shift: int, max_shift: int, step: int) -> np.ndarray:
+    """Grid of parallel shifts in basis points, inclusive of max_shift."""
+    return np.arange(min_shift, max_shift + 1, step, dtype=np.float64)
+
+
+def _error_status(errors: np.ndarray) -> np.ndarray:
+    """Classify absolute pricing errors as ✅ / ⚠️ / ❌ in one vectorized pass."""
+    return np.select([errors < 0.01, errors < 0.05], ["✅", "⚠️"], default="❌")
+
+
+def _parse_csv_floats(text: str) -> np.ndarray:
+    """Parse a comma-separated list of numbers into a float array."""
+    # np.fromstring skips a trailing separator and reads "" as no numbers; reject
+    # empty fields the way float() on each one did
+    if any(not field.strip() for field in text.split(",")):
+        raise ValueError(f"Could not parse numbers from '{text}'")
+    try:
+        return np.fromstring(text, sep=",")
+    except ValueError:
+        raise ValueError(f"Could not parse numbers from '{text}'")
+
+
+def _forward_key(instruments: list) -> tuple:
+    """Stable, hashable description of a list of forward builder swaps."""
+    return tuple(
+        (inst.start_date, inst.maturity, inst.fixed_rate, inst.frequency, inst.notional)
+        for inst in instruments
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def _bootstrap_forward(key: tuple) -> tuple:
+    """Bootstrap the forward builder curve and its verification prices once per swap set."""
+    instruments = [IRSwap(*params) for params in key]
+    market_prices = [0.0] * len(instruments)  # Par swaps
+    
+    bootstrapper = _get_bootstrapper()
+    curve = bootstrapper.bootstrap_with_forward_control(instruments, market_prices)
+    prices = bootstrapper.batch_price(instruments, curve)
+    return curve, prices
 
 
 def main():
@@ -64,33 +226,26 @@ def show_dashboard():
     
     # Create sample curve for demonstration
     sample_data = load_sample_data()
-    instruments = create_sample_instruments()
-    market_prices = [0.0] * len(instruments)  # Par swaps
-    
-    bootstrapper = CurveBootstrapper()
-    curve = bootstrapper.bootstrap_curve(instruments, market_prices)
-    
-    # Get dashboard data
-    dashboard_data = create_dashboard_data(curve)
+    curve, dashboard_data = _build_sample_curve()
     
     # Key metrics
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("3M Rate", f"{dashboard_data['short_rate']:.2f}%")
+        st.metric("3M Rate", f"{dashboard_data.short_rate:.2f}%")
     
     with col2:
-        st.metric("10Y Rate", f"{dashboard_data['long_rate']:.2f}%")
+        st.metric("10Y Rate", f"{dashboard_data.long_rate:.2f}%")
     
     with col3:
-        st.metric("Curve Slope", f"{dashboard_data['slope']:.2f}%")
+        st.metric("Curve Slope", f"{dashboard_data.slope:.2f}%")
     
     with col4:
-        st.metric("1Y Forward", f"{dashboard_data['forward_1y']:.2f}%")
+        st.metric("1Y Forward", f"{dashboard_data.forward_1y:.2f}%")
     
     # Curve plot
     st.subheader("Current Yield Curve")
-    fig = plot_curve(curve, "Sample Yield Curve", show_discount_factors=True)
+    fig = _cached_plot_curve(curve, "Sample Yield Curve", show_discount_factors=True, compact=True)
     st.plotly_chart(fig, use_container_width=True)
     
     # Recent activity
@@ -169,33 +324,30 @@ def show_instrument_based_builder():
     if 'instruments' in st.session_state and st.session_state.instruments:
         st.subheader("Current Instruments")
         
-        data = []
-        for i, (instrument, price) in enumerate(zip(st.session_state.instruments, st.session_state.market_prices)):
-            data.append({
-                'Index': i,
-                'Type': type(instrument).__name__,
-                'Tenor': f"{instrument.maturity:.1f}Y",
-                'Rate/Price': f"{price:.4f}",
-                'Notional': instrument.notional
-            })
-        
-        df = pd.DataFrame(data)
-        st.dataframe(df)
+        instruments = st.session_state.instruments
+        n = len(instruments)
+        df = pd.DataFrame({
+            'Index': np.arange(n),
+            'Type': [type(instrument).__name__ for instrument in instruments],
+            'Tenor': np.fromiter((instrument.maturity for instrument in instruments), dtype=np.float64, count=n),
+            'Rate/Price': np.asarray(st.session_state.market_prices, dtype=np.float64),
+            'Notional': np.fromiter((instrument.notional for instrument in instruments), dtype=np.float64, count=n)
+        })
+        st.dataframe(df.style.format({'Tenor': "{:.1f}Y", 'Rate/Price': "{:.4f}"}))
         
         # Build curve button
         if st.button("Build Curve"):
             with st.spinner("Building curve..."):
-                bootstrapper = CurveBootstrapper()
-                curve = bootstrapper.bootstrap_curve(
+                curve = _bootstrap_instruments(
                     st.session_state.instruments,
-                    st.session_state.market_prices
+                    tuple(st.session_state.market_prices)
                 )
                 
                 st.session_state.current_curve = curve
                 st.success("Curve built successfully!")
                 
                 # Show curve
-                fig = plot_curve(curve, "Bootstrapped Yield Curve")
+                fig = _cached_plot_curve(curve, "Bootstrapped Yield Curve")
                 st.plotly_chart(fig, use_container_width=True)
 
 
@@ -229,22 +381,21 @@ def show_swap_based_builder():
     if st.button("Build Curve from Swaps"):
         try:
             # Parse inputs
-            tenors = [float(x.strip()) for x in tenors_input.split(",")]
-            rates = [float(x.strip()) / 100 for x in rates_input.split(",")]
+            tenors = _parse_csv_floats(tenors_input)
+            rates = _parse_csv_floats(rates_input) / 100
             
-            if len(tenors) != len(rates):
+            if tenors.size != rates.size:
                 st.error("Number of tenors and rates must match!")
                 return
             
             # Build curve
-            bootstrapper = CurveBootstrapper()
-            curve = bootstrapper.bootstrap_from_swaps(rates, tenors)
+            curve = _bootstrap_swaps(rates, tenors)
             
             st.session_state.current_curve = curve
             st.success("Curve built successfully!")
             
             # Show curve
-            fig = plot_curve(curve, "Swap-Based Yield Curve")
+            fig = _cached_plot_curve(curve, "Swap-Based Yield Curve")
             st.plotly_chart(fig, use_container_width=True)
             
         except Exception as e:
@@ -351,28 +502,36 @@ def show_manual_curve_builder():
     
     if st.button("Create Curve"):
         try:
-            # Parse inputs
-            tenors = [float(x.strip()) for x in tenors_input.split(",")]
-            rates = [float(x.strip()) / 100 for x in rates_input.split(",")]
-            
-            if len(tenors) != len(rates):
-                st.error("Number of tenors and rates must match!")
-                return
+            # Reuse the last manual curve while none of its inputs have changed
+            sig = (tenors_input, rates_input, interpolation_method,
+                   cutoff_tenor, pre_cutoff_method, post_cutoff_method)
+            last_sig, curve = st.session_state.get('manual_curve', (None, None))
             
-            # Create curve
-            if interpolation_method == "hybrid":
-                curve = YieldCurve(tenors, rates, interpolation_method,
-                                 cutoff_tenor=cutoff_tenor,
-                                 pre_cutoff_method=pre_cutoff_method,
-                                 post_cutoff_method=post_cutoff_method)
-            else:
-                curve = YieldCurve(tenors, rates, interpolation_method)
+            if last_sig != sig:
+                # Parse inputs
+                tenors = _parse_csv_floats(tenors_input)
+                rates = _parse_csv_floats(rates_input) / 100
+                
+                if tenors.size != rates.size:
+                    st.error("Number of tenors and rates must match!")
+                    return
+                
+                # Create curve
+                if interpolation_method == "hybrid":
+                    curve = YieldCurve(tenors, rates, interpolation_method,
+                                     cutoff_tenor=cutoff_tenor,
+                                     pre_cutoff_method=pre_cutoff_method,
+                                     post_cutoff_method=post_cutoff_method)
+                else:
+                    curve = YieldCurve(tenors, rates, interpolation_method)
+                
+                st.session_state.manual_curve = (sig, curve)
             
             st.session_state.current_curve = curve
             st.success("Curve created successfully!")
             
             # Show curve
-            fig = plot_curve(curve, "Manual Yield Curve")
+            fig = _cached_plot_curve(curve, "Manual Yield Curve")
             st.plotly_chart(fig, use_container_width=True)
             
         except Exception as e:
@@ -526,25 +685,25 @@ def show_curve_analysis(curve):
     st.subheader("Curve Analysis")
     
     # Key metrics
-    dashboard_data = create_dashboard_data(curve)
+    dashboard_data = _dashboard_data(curve)
     
     col1, col2 = st.columns(2)
     
     with col1:
         st.write("**Key Metrics:**")
-        st.write(f"- 3M Rate: {dashboard_data['short_rate']:.2f}%")
-        st.write(f"- 10Y Rate: {dashboard_data['long_rate']:.2f}%")
-        st.write(f"- Curve Slope: {dashboard_data['slope']:.2f}%")
-        st.write(f"- 1Y Forward: {dashboard_data['forward_1y']:.2f}%")
+        st.write(f"- 3M Rate: {dashboard_data.short_rate:.2f}%")
+        st.write(f"- 10Y Rate: {dashboard_data.long_rate:.2f}%")
+        st.write(f"- Curve Slope: {dashboard_data.slope:.2f}%")
+        st.write(f"- 1Y Forward: {dashboard_data.forward_1y:.2f}%")
     
     with col2:
         st.write("**Discount Factors:**")
-        st.write(f"- 1Y: {dashboard_data['df_1y']:.4f}")
-        st.write(f"- 5Y: {dashboard_data['df_5y']:.4f}")
-        st.write(f"- 10Y: {dashboard_data['df_10y']:.4f}")
+        st.write(f"- 1Y: {dashboard_data.df_1y:.4f}")
+        st.write(f"- 5Y: {dashboard_data.df_5y:.4f}")
+        st.write(f"- 10Y: {dashboard_data.df_10y:.4f}")
     
     # Detailed curve plot
-    fig = plot_curve(curve, "Detailed Curve Analysis", show_discount_factors=True, show_forward_rates=True)
+    fig = _cached_plot_curve(curve, "Detailed Curve Analysis", show_discount_factors=True, show_forward_rates=True)
     st.plotly_chart(fig, use_container_width=True)
 
 
@@ -561,7 +720,7 @@ def show_sensitivity_analysis(curve):
     with col1:
         min_shift = st.number_input("Min Shift (bp)", value=-50, step=5)
         max_shift = st.number_input("Max Shift (bp)", value=50, step=5)
-        step = st.number_input("Step (bp)", value=5, step=1)
+        step = st.number_input("Step (bp)", min_value=1, value=5, step=1)
     
     with col2:
         instrument_type = st.selectbox("Instrument", ["5Y Swap", "3M Future"])
@@ -571,8 +730,10 @@ def show_sensitivity_analysis(curve):
         else:
             instrument = IRFuture(0.0, 0.25, notional=1.0)
     
+    shifts = _shift_grid(min_shift, max_shift, step)
+    
     if st.button("Run Sensitivity Analysis"):
-        shifts = list(range(min_shift, max_shift + 1, step))
+        from src.utils.visualization import plot_sensitivity_analysis
         fig = plot_sensitivity_analysis(instrument, curve, shifts)
         st.plotly_chart(fig, use_container_width=True)
 
@@ -582,12 +743,14 @@ def show_curve_comparison(curve):
     st.subheader("Curve Comparison")
     
     # Create comparison curves
-    flat_curve = YieldCurve(curve.tenors, [0.03] * len(curve.tenors))
-    steep_curve = YieldCurve(curve.tenors, [0.02 + 0.01 * t for t in curve.tenors])
+    tenors = np.asarray(curve.tenors, dtype=np.float64)
+    flat_curve = YieldCurve(tenors, np.full_like(tenors, 0.03))
+    steep_curve = YieldCurve(tenors, 0.02 + 0.01 * tenors)
     
     curves = [curve, flat_curve, steep_curve]
     names = ["Current", "Flat 3%", "Steep"]
     
+    from src.utils.visualization import plot_curve_comparison
     fig = plot_curve_comparison(curves, names)
     st.plotly_chart(fig, use_container_width=True)
 
@@ -603,16 +766,19 @@ def show_data_management():
         curve = st.session_state.current_curve
         curve_df = curve.to_dataframe()
         
-        # Download button
-        csv = curve_df.to_csv(index=False)
+        # Download button; write the CSV straight to bytes rather than via an intermediate str
+        buf = io.BytesIO()
+        curve_df.to_csv(buf, index=False)
+        buf.seek(0)
         st.download_button(
             label="Download Curve Data",
-            data=csv,
+            data=buf,
             file_name="yield_curve.csv",
             mime="text/csv"
         )
         
-        st.dataframe(curve_df)
+        with st.expander("Preview"):
+            st.dataframe(curve_df)
     
     # Import data
     st.subheader("Import Market Data")
@@ -621,7 +787,12 @@ def show_data_management():
     
     if uploaded_file is not None:
         try:
-            data = pd.read_csv(uploaded_file)
+            # Known market-data columns skip type inference; anything odd gets default parsing
+            try:
+                data = pd.read_csv(uploaded_file, engine='c', dtype=_MARKET_DATA_DTYPES, na_filter=False)
+            except ValueError:
+                uploaded_file.seek(0)
+                data = pd.read_csv(uploaded_file)
             st.write("Uploaded data:")
             st.dataframe(data)
             
@@ -635,6 +806,7 @@ def show_data_management():
     st.subheader("Sample Data")
     
     if st.button("Generate Sample Data"):
+        from src.utils.market_data import save_sample_data_to_csv
         save_sample_data_to_csv()
         st.success("Sample data saved to data/sample_data.csv")
 
@@ -665,6 +837,73 @@ def show_forward_swaps():
         show_forward_sensitivity_analysis()
 
 
+@st.fragment
+def _forward_instrument_panel():
+    """Input panel of the forward swap builder.
+    
+    Runs as a fragment so editing inputs leaves the analysis column alone;
+    actions that change the instrument list trigger a full rerun.
+    """
+    st.markdown("**Add Instruments**")
+    
+    # Instrument type selection
+    swap_type = st.radio("Swap Type", ["Spot Starting", "Forward Starting"])
+    
+    if swap_type == "Spot Starting":
+        start_date = 0.0
+        maturity = st.number_input("Maturity (years)", min_value=0.25, max_value=30.0, value=5.0, step=0.25)
+    else:
+        start_date = st.number_input("Start Date (years)", min_value=0.25, max_value=25.0, value=2.0, step=0.25)
+        maturity = st.number_input("Maturity (years)", min_value=start_date + 0.25, max_value=30.0, 
+                                 value=max(start_date + 3.0, 5.0), step=0.25)
+    
+    fixed_rate = st.number_input("Fixed Rate (%)", min_value=0.0, max_value=20.0, value=4.0, step=0.1) / 100
+    frequency = st.selectbox("Payment Frequency", [1, 2, 4], index=1, 
+                            format_func=lambda x: f"{x}x per year ({'Annual' if x==1 else 'Semi-annual' if x==2 else 'Quarterly'})")
+    notional = st.number_input("Notional", min_value=1.0, value=1000000.0, step=100000.0)
+    
+    if st.button("Add Swap"):
+        try:
+            new_swap = IRSwap(start_date, maturity, fixed_rate, frequency, notional)
+            st.session_state.forward_instruments.append(new_swap)
+            st.session_state.forward_message = f"Added: {new_swap}"
+            st.rerun()
+        except ValueError as e:
+            st.error(f"Error: {e}")
+    
+    # Clear all button
+    if st.button("Clear All"):
+        st.session_state.forward_instruments = []
+        st.session_state.forward_message = "Cleared all instruments"
+        st.rerun()
+    
+    # Message from the action that triggered the last full rerun
+    if 'forward_message' in st.session_state:
+        st.success(st.session_state.pop('forward_message'))
+    
+    # Show current instruments in one editable table; tick Delete to drop a row
+    st.markdown("**Current Instruments:**")
+    instruments = st.session_state.forward_instruments
+    if instruments:
+        n = len(instruments)
+        instruments_df = pd.DataFrame({
+            'Start': np.fromiter((inst.start_date for inst in instruments), dtype=np.float64, count=n),
+            'Maturity': np.fromiter((inst.maturity for inst in instruments), dtype=np.float64, count=n),
+            'Rate': np.fromiter((inst.fixed_rate for inst in instruments), dtype=np.float64, count=n),
+            'Delete': np.zeros(n, dtype=bool),
+        })
+        # Key on the instrument set so a stale tick never carries over to a shifted row
+        edited = st.data_editor(
+            instruments_df, hide_index=True, disabled=['Start', 'Maturity', 'Rate'],
+            key=f"fwd_editor_{hash(_forward_key(instruments))}"
+        )
+        if edited['Delete'].any():
+            st.session_state.forward_instruments = [
+                inst for inst, delete in zip(instruments, edited['Delete']) if not delete
+            ]
+            st.rerun()
+
+
 def show_forward_swap_builder():
     """Interactive forward starting swap builder."""
     st.subheader("📊 Forward Starting Swap Builder")
@@ -677,52 +916,12 @@ def show_forward_swap_builder():
     col1, col2 = st.columns([1, 2])
     
     with col1:
-        st.markdown("**Add Instruments**")
-        
-        # Instrument type selection
-        swap_type = st.radio("Swap Type", ["Spot Starting", "Forward Starting"])
-        
-        if swap_type == "Spot Starting":
-            start_date = 0.0
-            maturity = st.number_input("Maturity (years)", min_value=0.25, max_value=30.0, value=5.0, step=0.25)
-        else:
-            start_date = st.number_input("Start Date (years)", min_value=0.25, max_value=25.0, value=2.0, step=0.25)
-            maturity = st.number_input("Maturity (years)", min_value=start_date + 0.25, max_value=30.0, 
-                                     value=max(start_date + 3.0, 5.0), step=0.25)
-        
-        fixed_rate = st.number_input("Fixed Rate (%)", min_value=0.0, max_value=20.0, value=4.0, step=0.1) / 100
-        frequency = st.selectbox("Payment Frequency", [1, 2, 4], index=1, 
-                                format_func=lambda x: f"{x}x per year ({'Annual' if x==1 else 'Semi-annual' if x==2 else 'Quarterly'})")
-        notional = st.number_input("Notional", min_value=1.0, value=1000000.0, step=100000.0)
-        
-        if st.button("Add Swap"):
-            try:
-                new_swap = IRSwap(start_date, maturity, fixed_rate, frequency, notional)
-                st.session_state.forward_instruments.append(new_swap)
-                st.success(f"Added: {new_swap}")
-            except ValueError as e:
-                st.error(f"Error: {e}")
-        
-        # Clear all button
-        if st.button("Clear All"):
-            st.session_state.forward_instruments = []
-            st.success("Cleared all instruments")
-        
-        # Show current instruments
-        st.markdown("**Current Instruments:**")
-        for i, inst in enumerate(st.session_state.forward_instruments):
-            col_inst, col_remove = st.columns([3, 1])
-            with col_inst:
-                st.text(f"{i+1}. {inst}")
-            with col_remove:
-                if st.button("❌", key=f"remove_{i}"):
-                    st.session_state.forward_instruments.pop(i)
-                    st.rerun()
+        _forward_instrument_panel()
     
     with col2:
         if len(st.session_state.forward_instruments) > 0:
             # Coverage analysis
-            bootstrapper = CurveBootstrapper()
+            bootstrapper = _get_bootstrapper()
             coverage = bootstrapper.analyze_forward_swap_coverage(st.session_state.forward_instruments)
             
             st.markdown("**📋 Coverage Analysis**")
@@ -741,39 +940,46 @@ def show_forward_swap_builder():
             overlaps = find_overlapping_regions_streamlit(st.session_state.forward_instruments)
             if overlaps:
                 st.warning(f"⚠️ Found {len(overlaps)} overlapping regions:")
-                for overlap in overlaps:
-                    st.write(f"- **{overlap['start']:.1f}Y-{overlap['end']:.1f}Y**: {len(overlap['instruments'])} instruments")
+                overlaps_df = pd.DataFrame({
+                    'Start': [overlap['start'] for overlap in overlaps],
+                    'End': [overlap['end'] for overlap in overlaps],
+                    'Instruments': [len(overlap['instruments']) for overlap in overlaps]
+                })
+                st.table(overlaps_df.style.format({'Start': "{:.1f}Y", 'End': "{:.1f}Y"}).hide(axis="index"))
             else:
                 st.success("✅ No overlapping regions detected")
             
-            # Bootstrap curve
+            # Bootstrap curve; the result stays on screen until the instrument set changes
+            key = _forward_key(st.session_state.forward_instruments)
             if st.button("🚀 Bootstrap Curve"):
-                market_prices = [0.0] * len(st.session_state.forward_instruments)  # Par swaps
-                
+                st.session_state.forward_curve_key = key
+            
+            if st.session_state.get('forward_curve_key') == key:
                 try:
                     with st.spinner("Building curve..."):
-                        curve = bootstrapper.bootstrap_with_forward_control(
-                            st.session_state.forward_instruments, market_prices
-                        )
+                        curve, prices = _bootstrap_forward(key)
                     
                     st.success("✅ Curve built successfully!")
                     
                     # Show curve plot
-                    fig = plot_curve(curve, "Forward Swap Curve")
+                    fig = _cached_plot_curve(curve, "Forward Swap Curve")
                     st.plotly_chart(fig, use_container_width=True, key="forward_swap_curve_plot")
                     
                     # Verification
                     st.markdown("**🔍 Pricing Verification:**")
-                    total_error = 0
-                    for i, inst in enumerate(st.session_state.forward_instruments):
-                        price = inst.price(curve)
-                        error = abs(price)
-                        total_error += error
-                        
-                        status = "✅" if error < 0.01 else "⚠️" if error < 0.05 else "❌"
-                        st.write(f"{status} {inst}: Price = {price:.6f}, Error = {error:.6f}")
+                    errors = np.abs(prices)
+                    verification_df = pd.DataFrame({
+                        'Status': _error_status(errors),
+                        'Instrument': [str(inst) for inst in st.session_state.forward_instruments],
+                        'Price': prices,
+                        'Error': errors
+                    })
+                    st.dataframe(
+                        verification_df.style.format({'Price': "{:.6f}", 'Error': "{:.6f}"}),
+                        hide_index=True
+                    )
                     
-                    avg_error = total_error / len(st.session_state.forward_instruments)
+                    avg_error = errors.mean()
                     st.metric("Average Pricing Error", f"{avg_error:.6f}")
                     
                     if avg_error < 0.01:
@@ -784,6 +990,7 @@ def show_forward_swap_builder():
                         st.error("❌ Poor fit - consider reviewing instrument setup or checking for inconsistencies.")
                 
                 except Exception as e:
+                    del st.session_state.forward_curve_key
                     st.error(f"❌ Curve building failed: {e}")
         else:
             st.info("👆 Add some instruments to start building a curve")
@@ -797,42 +1004,16 @@ def show_overlap_analysis():
     # Predefined scenarios
     scenario = st.selectbox(
         "Choose a scenario:",
-        ["Custom", "Heavy Overlap", "Clean Partition", "Market Reality", "Gaps Example"]
+        ["Custom", *_OVERLAP_SCENARIOS]
     )
     
-    if scenario == "Heavy Overlap":
-        instruments = [
-            IRSwap(0.0, 2.0, 0.030),
-            IRSwap(0.0, 3.0, 0.035),
-            IRSwap(1.0, 3.0, 0.038),
-            IRSwap(2.0, 4.0, 0.040),
-            IRSwap(1.5, 3.5, 0.039),
-        ]
-    elif scenario == "Clean Partition":
-        instruments = [
-            IRSwap(0.0, 2.0, 0.030),
-            IRSwap(2.0, 5.0, 0.035),
-            IRSwap(5.0, 10.0, 0.040),
-        ]
-    elif scenario == "Market Reality":
-        instruments = [
-            IRSwap(0.0, 1.0, 0.025),   # 1Y liquid
-            IRSwap(0.0, 2.0, 0.030),   # 2Y liquid
-            IRSwap(1.0, 4.0, 0.035),   # 1Y-4Y forward
-            IRSwap(2.0, 5.0, 0.040),   # 2Y-5Y forward (slight overlap)
-            IRSwap(5.0, 10.0, 0.045),  # 5Y-10Y forward
-        ]
-    elif scenario == "Gaps Example":
-        instruments = [
-            IRSwap(0.0, 1.0, 0.025),
-            IRSwap(3.0, 5.0, 0.040),
-            IRSwap(7.0, 10.0, 0.045),
-        ]
+    if scenario in _OVERLAP_SCENARIOS:
+        instruments = list(_OVERLAP_SCENARIOS[scenario])
     else:  # Custom
         instruments = st.session_state.get('forward_instruments', [])
     
     if instruments:
-        bootstrapper = CurveBootstrapper()
+        bootstrapper = _get_bootstrapper()
         
         # Coverage analysis
         coverage = bootstrapper.analyze_forward_swap_coverage(instruments)
@@ -871,23 +1052,29 @@ def show_overlap_analysis():
             
             try:
                 with st.spinner("Testing curve construction..."):
-                    curve = bootstrapper.bootstrap_with_forward_control(instruments, market_prices)
+                    # Shared with the builder tab: one solve per distinct swap set
+                    _, prices = _bootstrap_forward(_forward_key(instruments))
                 
                 st.success("✅ Bootstrapping successful!")
                 
                 # Calculate and display pricing errors
                 st.markdown("**🔍 Pricing Results:**")
-                errors = []
-                for i, inst in enumerate(instruments):
-                    price = inst.price(curve)
-                    error = abs(price - market_prices[i])
-                    errors.append(error)
-                    
-                    status = "✅" if error < 0.01 else "⚠️" if error < 0.05 else "❌"
-                    st.write(f"{status} {inst}: Price = {price:.6f}, Target = {market_prices[i]:.6f}, Error = {error:.6f}")
+                targets = np.asarray(market_prices, dtype=np.float64)
+                errors = np.abs(prices - targets)
+                results_df = pd.DataFrame({
+                    'Status': _error_status(errors),
+                    'Instrument': [str(inst) for inst in instruments],
+                    'Price': prices,
+                    'Target': targets,
+                    'Error': errors
+                })
+                st.dataframe(
+                    results_df.style.format({'Price': "{:.6f}", 'Target': "{:.6f}", 'Error': "{:.6f}"}),
+                    hide_index=True
+                )
                 
-                total_error = sum(errors)
-                avg_error = total_error / len(errors)
+                total_error = errors.sum()
+                avg_error = errors.mean()
                 
                 col1, col2 = st.columns(2)
                 with col1:
@@ -926,22 +1113,8 @@ def show_par_rate_calculator():
         curve_type = st.radio("Curve Type", ["Sample Curve", "Custom Points"])
         
         if curve_type == "Sample Curve":
-            curve_shape = st.selectbox("Shape", ["Upward Sloping", "Flat", "Inverted", "Humped"])
-            
-            if curve_shape == "Upward Sloping":
-                tenors = [0.5, 1, 2, 3, 5, 7, 10]
-                rates = [0.02, 0.025, 0.03, 0.035, 0.04, 0.042, 0.045]
-            elif curve_shape == "Flat":
-                tenors = [0.5, 1, 2, 3, 5, 7, 10]
-                rates = [0.04] * 7
-            elif curve_shape == "Inverted":
-                tenors = [0.5, 1, 2, 3, 5, 7, 10]
-                rates = [0.05, 0.045, 0.04, 0.035, 0.03, 0.028, 0.025]
-            else:  # Humped
-                tenors = [0.5, 1, 2, 3, 5, 7, 10]
-                rates = [0.02, 0.03, 0.045, 0.05, 0.045, 0.04, 0.038]
-            
-            curve = YieldCurve(tenors, rates, interpolation_method='cubic')
+            curve_shape = st.selectbox("Shape", list(_SAMPLE_CURVES))
+            curve = _SAMPLE_CURVES[curve_shape]
             
         else:  # Custom
             st.info("Enter custom curve points (tenor, rate)")
@@ -958,7 +1131,7 @@ def show_par_rate_calculator():
     with col2:
         if curve:
             # Show the base curve
-            fig = plot_curve(curve, f"{curve_shape} Yield Curve")
+            fig = _cached_plot_curve(curve, f"{curve_shape} Yield Curve")
             st.plotly_chart(fig, use_container_width=True, key="par_rate_base_curve")
             
             # Calculate par rates for different forward swaps
@@ -976,28 +1149,24 @@ def show_par_rate_calculator():
                     (5.0, 10.0, "5Y-10Y Forward"),
                 ]
                 
-                results = []
-                for start, end, description in test_swaps:
-                    try:
-                        swap = IRSwap(start, end, 0.04, frequency, notional)  # Rate will be replaced
-                        par_rate = swap.get_par_rate(curve)
-                        results.append({
-                            "Swap": description,
-                            "Period": f"{start}Y - {end}Y",
-                            "Par Rate": f"{par_rate:.4%}",
-                            "Rate (bp)": f"{par_rate*10000:.1f}"
-                        })
-                    except Exception as e:
-                        results.append({
-                            "Swap": description,
-                            "Period": f"{start}Y - {end}Y",
-                            "Par Rate": "Error",
-                            "Rate (bp)": str(e)[:30]
-                        })
-                
-                # Display results
-                df = pd.DataFrame(results)
-                st.dataframe(df, use_container_width=True)
+                try:
+                    # Fixed rate is irrelevant to the par rate
+                    swaps = [IRSwap(start, end, 0.04, frequency, notional) for start, end, _ in test_swaps]
+                    par_rates = IRSwap.get_par_rates(swaps, curve)
+                    
+                    # Display results as one table, formatted by the Styler
+                    df = pd.DataFrame({
+                        "Swap": [description for _, _, description in test_swaps],
+                        "Period": [f"{start}Y - {end}Y" for start, end, _ in test_swaps],
+                        "Par Rate": par_rates,
+                        "Rate (bp)": par_rates * 10000
+                    })
+                    st.dataframe(
+                        df.style.format({"Par Rate": "{:.4%}", "Rate (bp)": "{:.1f}"}),
+                        use_container_width=True
+                    )
+                except Exception as e:
+                    st.error(f"Error calculating par rates: {e}")
                 
                 # Specific swap calculation
                 if start_date < maturity:
@@ -1036,9 +1205,7 @@ def show_forward_sensitivity_analysis():
         st.markdown("**📊 Setup**")
         
         # Base curve
-        tenors = [1.0, 2.0, 3.0, 5.0, 7.0, 10.0]
-        rates = [0.025, 0.03, 0.035, 0.04, 0.042, 0.045]
-        curve = YieldCurve(tenors, rates, interpolation_method='cubic')
+        curve = _SENSITIVITY_CURVE
         
         # Swaps to analyze
         swaps = [
@@ -1072,56 +1239,24 @@ def show_forward_sensitivity_analysis():
         if st.button("🔍 Run Sensitivity Analysis"):
             st.markdown("**📊 Sensitivity Results**")
             
-            # Create results table
-            results = []
+            # Analytical sensitivities for every swap/segment pair, one curve lookup per swap
+            sensitivities = np.vstack([swap.get_forward_rate_sensitivities(curve, segments) for swap in swaps])
             
-            for swap in swaps:
-                row = {"Swap": str(swap)}
-                
-                for start_seg, end_seg in segments:
-                    # Calculate analytical sensitivity
-                    sensitivity = swap.get_forward_rate_sensitivity(curve, start_seg, end_seg)
-                    
-                    # Determine if this segment affects the swap
-                    swap_start, swap_end = swap.forward_tenor_range
-                    if start_seg >= swap_start and end_seg <= swap_end:
-                        impact = "Direct"
-                    elif end_seg <= swap_start or start_seg >= swap_end:
-                        impact = "None"
-                    else:
-                        impact = "Partial"
-                    
-                    row[f"{start_seg}-{end_seg}Y"] = {
-                        "analytical": sensitivity,
-                        "impact": impact
-                    }
-                
-                results.append(row)
+            # Classify every swap/segment pair at once: rows are swaps, columns segments
+            swap_ranges = np.array([swap.forward_tenor_range for swap in swaps])
+            seg_ranges = np.array(segments)
+            swap_start, swap_end = swap_ranges[:, :1], swap_ranges[:, 1:]
+            seg_start, seg_end = seg_ranges[:, 0], seg_ranges[:, 1]
+            direct = (seg_start >= swap_start) & (seg_end <= swap_end)
+            outside = (seg_end <= swap_start) | (seg_start >= swap_end)
+            marks = np.select([direct, outside], ["✓", "✗"], default="~")
             
             # Display sensitivity matrix
             st.markdown("**Analytical Sensitivity (per 1bp rate change)**")
             
-            # Create DataFrame for display
-            display_data = []
-            for result in results:
-                row_data = {"Swap": result["Swap"]}
-                for start_seg, end_seg in segments:
-                    key = f"{start_seg}-{end_seg}Y"
-                    sensitivity = result[key]["analytical"]
-                    impact = result[key]["impact"]
-                    
-                    if impact == "Direct":
-                        cell_value = f"{sensitivity:.6f} ✓"
-                    elif impact == "None":
-                        cell_value = f"{sensitivity:.6f} ✗"
-                    else:
-                        cell_value = f"{sensitivity:.6f} ~"
-                    
-                    row_data[key] = cell_value
-                
-                display_data.append(row_data)
-            
-            df = pd.DataFrame(display_data)
+            cells = np.char.add(np.char.mod("%.6f ", sensitivities), marks)
+            df = pd.DataFrame(cells, columns=[f"{start_seg}-{end_seg}Y" for start_seg, end_seg in segments])
+            df.insert(0, "Swap", [str(swap) for swap in swaps])
             st.dataframe(df, use_container_width=True)
             
             st.markdown("""
@@ -1135,9 +1270,10 @@ def show_forward_sensitivity_analysis():
             st.markdown(f"**🔍 Focus: {selected_segment[0]}Y-{selected_segment[1]}Y Segment**")
             
             focused_results = []
-            for swap in swaps:
+            segment_idx = segments.index(selected_segment)
+            for swap, swap_sensitivities in zip(swaps, sensitivities):
                 start_seg, end_seg = selected_segment
-                sensitivity = swap.get_forward_rate_sensitivity(curve, start_seg, end_seg)
+                sensitivity = swap_sensitivities[segment_idx]
                 swap_start, swap_end = swap.forward_tenor_range
                 
                 if start_seg >= swap_start and end_seg <= swap_end:
@@ -1157,28 +1293,39 @@ def show_forward_sensitivity_analysis():
             st.dataframe(focused_df, use_container_width=True)
 
 
+def _coverage_key(instruments) -> tuple:
+    """Hashable (start, maturity, label) description of instruments for the coverage helpers."""
+    return tuple((inst.start_date, inst.maturity, str(inst)) for inst in instruments)
+
+
 def create_coverage_visualization(instruments):
     """Create a Plotly visualization of instrument coverage."""
-    fig = go.Figure()
-    
+    return pio.from_json(_coverage_fig_json(_coverage_key(instruments)))
+
+
+@st.cache_data(show_spinner=False)
+def _coverage_fig_json(key: tuple) -> str:
+    """Build the coverage chart from (start, maturity, label) triples, serialized to JSON."""
     colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FECA57', '#FF9FF3', '#54A0FF']
     
-    for i, instrument in enumerate(instruments):
-        start = instrument.start_date
-        end = instrument.maturity
-        
-        # Add horizontal bar for coverage
-        fig.add_trace(go.Scatter(
-            x=[start, end, end, start, start],
-            y=[i, i, i+0.8, i+0.8, i],
-            fill="toself",
-            fillcolor=colors[i % len(colors)],
-            line=dict(color=colors[i % len(colors)], width=2),
-            name=str(instrument),
-            text=f"{start}Y-{end}Y",
-            textposition="middle center",
-            mode="lines+text"
-        ))
+    n = len(key)
+    starts = np.fromiter((start for start, _, _ in key), dtype=np.float64, count=n)
+    ends = np.fromiter((end for _, end, _ in key), dtype=np.float64, count=n)
+    
+    # One horizontal bar trace for all instruments, each bar spanning start -> maturity
+    fig = go.Figure(go.Bar(
+        y=np.arange(n),
+        x=ends - starts,
+        base=starts,
+        orientation='h',
+        width=0.8,
+        marker_color=[colors[i % len(colors)] for i in range(n)],
+        text=[f"{start}Y-{end}Y" for start, end, _ in key],
+        textposition="inside",
+        insidetextanchor="middle",
+        hovertext=[label for _, _, label in key],
+        hoverinfo="text"
+    ))
     
     # Update layout
     fig.update_layout(
@@ -1187,44 +1334,45 @@ def create_coverage_visualization(instruments):
         yaxis_title="Instruments",
         yaxis=dict(
             tickmode='array',
-            tickvals=list(range(len(instruments))),
-            ticktext=[f"Swap {i+1}" for i in range(len(instruments))]
+            tickvals=list(range(len(key))),
+            ticktext=[f"Swap {i+1}" for i in range(len(key))]
         ),
-        height=max(400, len(instruments) * 60),
+        height=max(400, len(key) * 60),
         showlegend=False
     )
     
-    return fig
+    return fig.to_json()
 
 
 def find_overlapping_regions_streamlit(instruments):
     """Find overlapping regions for Streamlit display."""
-    # Create a list of all tenor breakpoints
-    breakpoints = set()
-    for inst in instruments:
-        breakpoints.add(inst.start_date)
-        breakpoints.add(inst.maturity)
-    
-    breakpoints = sorted(list(breakpoints))
+    return _overlapping_regions(_coverage_key(instruments))
+
+
+@st.cache_data(show_spinner=False)
+def _overlapping_regions(key: tuple) -> list:
+    """Find overlapping regions from (start, maturity, label) triples."""
+    # Sweep over start/maturity events, tracking which instruments are live
+    events = sorted(
+        [(start, 1, k) for k, (start, _, _) in enumerate(key)] +
+        [(maturity, -1, k) for k, (_, maturity, _) in enumerate(key)]
+    )
     
     overlaps = []
-    for i in range(len(breakpoints) - 1):
-        start = breakpoints[i]
-        end = breakpoints[i + 1]
-        mid_point = (start + end) / 2
-        
-        # Find instruments that cover this region
-        covering_instruments = []
-        for inst in instruments:
-            if inst.start_date <= mid_point <= inst.maturity:
-                covering_instruments.append(str(inst))
-        
-        if len(covering_instruments) > 1:
+    active = set()
+    prev_x = None
+    for x, kind, k in events:
+        if prev_x is not None and x > prev_x and len(active) > 1:
             overlaps.append({
-                'start': start,
-                'end': end,
-                'instruments': covering_instruments
+                'start': prev_x,
+                'end': x,
+                'instruments': [key[j][2] for j in sorted(active)]
             })
+        if kind > 0:
+            active.add(k)
+        else:
+            active.discard(k)
+        prev_x = x
     
     return overlaps
 
@@ -38,27 +38,31 @@ def test_flat_interpolation():
     # Create visualization
     tenors_smooth = np.linspace(0.1, 6.0, 200)
     
-    rates_flat = [curve_flat.get_rate(t) for t in tenors_smooth]
-    rates_linear = [curve_linear.get_rate(t) for t in tenors_smooth]
-    rates_cubic = [curve_cubic.get_rate(t) for t in tenors_smooth]
+    rates_flat = curve_flat.get_rates(tenors_smooth)
+    rates_linear = curve_linear.get_rates(tenors_smooth)
+    rates_cubic = curve_cubic.get_rates(tenors_smooth)
+    # Scale to percent in place; get_rates already returns fresh arrays
+    for rates_pct in (rates_flat, rates_linear, rates_cubic):
+        rates_pct *= 100
     
-    plt.figure(figsize=(12, 8))
+    fig = plt.figure(figsize=(12, 8))
     
     # Plot interpolated curves
-    plt.plot(tenors_smooth, np.array(rates_flat) * 100, 
+    plt.plot(tenors_smooth, rates_flat, 
              label='Flat (FOMC-style)', linewidth=2, linestyle='-', color='red')
-    plt.plot(tenors_smooth, np.array(rates_linear) * 100, 
+    plt.plot(tenors_smooth, rates_linear, 
              label='Linear', linewidth=2, linestyle='--', color='blue')
-    plt.plot(tenors_smooth, np.array(rates_cubic) * 100, 
+    plt.plot(tenors_smooth, rates_cubic, 
              label='Cubic', linewidth=2, linestyle='-.', color='green')
     
     # Plot original points
     plt.plot(fomc_dates, np.array(fed_rates) * 100, 
              'o', markersize=8, color='black', label='FOMC Decisions')
     
-    # Add vertical lines for FOMC meetings
-    for date in fomc_dates:
-        plt.axvline(x=date, color='gray', linestyle=':', alpha=0.5)
+    # Add vertical lines for FOMC meetings (one LineCollection spanning the full height)
+    ax = plt.gca()
+    ax.vlines(fomc_dates, 0, 1, transform=ax.get_xaxis_transform(),
+              colors='gray', linestyles=':', alpha=0.5)
     
     plt.xlabel('Tenor (years)')
     plt.ylabel('Rate (%)')
@@ -75,6 +79,7 @@ def test_flat_interpolation():
     plt.tight_layout()
     plt.savefig('flat_interpolation_demo.png', dpi=300, bbox_inches='tight')
     plt.show()
+    plt.close(fig)
     
     print("\n=== Characteristics of Flat Interpolation ===")
     print("✅ Rates stay constant between FOMC meetings")
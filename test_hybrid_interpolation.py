@@ -50,81 +50,81 @@ def demonstrate_hybrid_interpolation():
     # Create detailed visualization
     tenors_smooth = np.linspace(0.1, 30.0, 1000)
     
-    plt.figure(figsize=(15, 10))
+    # Evaluate each curve once; the subplots below only slice these arrays
+    all_rates = {name: curve.get_rates(tenors_smooth) for name, curve in curves.items()}
+    rates_pct = {name: rates_smooth * 100 for name, rates_smooth in all_rates.items()}
+    short_mask = tenors_smooth <= 5.0
+    long_mask = tenors_smooth >= 2.0
+    
+    fig, axes = plt.subplots(2, 2, figsize=(15, 10))
     
     # Main plot
-    plt.subplot(2, 2, 1)
-    for name, curve in curves.items():
-        rates_smooth = [curve.get_rate(t) for t in tenors_smooth]
-        plt.plot(tenors_smooth, np.array(rates_smooth) * 100, 
+    ax = axes[0, 0]
+    for name, rates_smooth in rates_pct.items():
+        ax.plot(tenors_smooth, rates_smooth, 
                 label=name, linewidth=2)
     
     # Plot original points
-    plt.plot(tenors, np.array(rates) * 100, 'ko', markersize=6, label='Market Data')
+    ax.plot(tenors, np.array(rates) * 100, 'ko', markersize=6, label='Market Data')
     
     # Add cutoff line
-    plt.axvline(x=cutoff_tenor, color='red', linestyle='--', alpha=0.7, 
+    ax.axvline(x=cutoff_tenor, color='red', linestyle='--', alpha=0.7, 
                 label=f'Cutoff at {cutoff_tenor}Y')
     
-    plt.xlabel('Tenor (years)')
-    plt.ylabel('Rate (%)')
-    plt.title('Hybrid Interpolation: Flat (≤2Y) + Cubic (>2Y)')
-    plt.legend()
-    plt.grid(True, alpha=0.3)
+    ax.set_xlabel('Tenor (years)')
+    ax.set_ylabel('Rate (%)')
+    ax.set_title('Hybrid Interpolation: Flat (≤2Y) + Cubic (>2Y)')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
     
     # Zoom on short end
-    plt.subplot(2, 2, 2)
-    short_tenors = tenors_smooth[tenors_smooth <= 5.0]
-    for name, curve in curves.items():
-        short_rates = [curve.get_rate(t) for t in short_tenors]
-        plt.plot(short_tenors, np.array(short_rates) * 100, 
+    ax = axes[0, 1]
+    for name, rates_smooth in rates_pct.items():
+        ax.plot(tenors_smooth[short_mask], rates_smooth[short_mask], 
                 label=name, linewidth=2)
     
-    plt.plot([t for t in tenors if t <= 5.0], 
+    ax.plot([t for t in tenors if t <= 5.0], 
              [r * 100 for t, r in zip(tenors, rates) if t <= 5.0], 
              'ko', markersize=6)
-    plt.axvline(x=cutoff_tenor, color='red', linestyle='--', alpha=0.7)
-    plt.xlabel('Tenor (years)')
-    plt.ylabel('Rate (%)')
-    plt.title('Short End Detail (≤5Y)')
-    plt.legend()
-    plt.grid(True, alpha=0.3)
+    ax.axvline(x=cutoff_tenor, color='red', linestyle='--', alpha=0.7)
+    ax.set_xlabel('Tenor (years)')
+    ax.set_ylabel('Rate (%)')
+    ax.set_title('Short End Detail (≤5Y)')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
     
     # Zoom on long end
-    plt.subplot(2, 2, 3)
-    long_tenors = tenors_smooth[tenors_smooth >= 2.0]
-    for name, curve in curves.items():
-        long_rates = [curve.get_rate(t) for t in long_tenors]
-        plt.plot(long_tenors, np.array(long_rates) * 100, 
+    ax = axes[1, 0]
+    for name, rates_smooth in rates_pct.items():
+        ax.plot(tenors_smooth[long_mask], rates_smooth[long_mask], 
                 label=name, linewidth=2)
     
-    plt.plot([t for t in tenors if t >= 2.0], 
+    ax.plot([t for t in tenors if t >= 2.0], 
              [r * 100 for t, r in zip(tenors, rates) if t >= 2.0], 
              'ko', markersize=6)
-    plt.axvline(x=cutoff_tenor, color='red', linestyle='--', alpha=0.7)
-    plt.xlabel('Tenor (years)')
-    plt.ylabel('Rate (%)')
-    plt.title('Long End Detail (≥2Y)')
-    plt.legend()
-    plt.grid(True, alpha=0.3)
+    ax.axvline(x=cutoff_tenor, color='red', linestyle='--', alpha=0.7)
+    ax.set_xlabel('Tenor (years)')
+    ax.set_ylabel('Rate (%)')
+    ax.set_title('Long End Detail (≥2Y)')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
     
     # Show rate differences
-    plt.subplot(2, 2, 4)
-    hybrid_rates = [curves['Hybrid (Flat->Cubic)'].get_rate(t) for t in tenors_smooth]
-    cubic_rates = [curves['Pure Cubic'].get_rate(t) for t in tenors_smooth]
-    
-    diff_bp = (np.array(hybrid_rates) - np.array(cubic_rates)) * 10000
-    plt.plot(tenors_smooth, diff_bp, linewidth=2, color='red')
-    plt.axhline(y=0, color='black', linestyle='-', alpha=0.3)
-    plt.axvline(x=cutoff_tenor, color='red', linestyle='--', alpha=0.7)
-    plt.xlabel('Tenor (years)')
-    plt.ylabel('Rate Difference (bp)')
-    plt.title('Hybrid vs Pure Cubic (basis points)')
-    plt.grid(True, alpha=0.3)
-    
-    plt.tight_layout()
-    plt.savefig('hybrid_interpolation_demo.png', dpi=300, bbox_inches='tight')
+    ax = axes[1, 1]
+    diff_bp = all_rates['Hybrid (Flat->Cubic)'] - all_rates['Pure Cubic']
+    diff_bp *= 10000
+    ax.plot(tenors_smooth, diff_bp, linewidth=2, color='red')
+    ax.axhline(y=0, color='black', linestyle='-', alpha=0.3)
+    ax.axvline(x=cutoff_tenor, color='red', linestyle='--', alpha=0.7)
+    ax.set_xlabel('Tenor (years)')
+    ax.set_ylabel('Rate Difference (bp)')
+    ax.set_title('Hybrid vs Pure Cubic (basis points)')
+    ax.grid(True, alpha=0.3)
+    
+    fig.tight_layout()
+    fig.savefig('hybrid_interpolation_demo.png', dpi=300, bbox_inches='tight')
     plt.show()
+    plt.close(fig)
     
     print(f"\n=== Hybrid Interpolation Analysis ===")
     print(f"Cutoff Tenor: {cutoff_tenor} years")
@@ -146,7 +146,7 @@ def test_different_cutoff_points():
     
     cutoff_points = [0.5, 1.0, 2.0, 5.0]
     
-    plt.figure(figsize=(12, 8))
+    fig = plt.figure(figsize=(12, 8))
     tenors_smooth = np.linspace(0.1, 10.0, 200)
     
     for i, cutoff in enumerate(cutoff_points):
@@ -156,10 +156,15 @@ def test_different_cutoff_points():
                           pre_cutoff_method='flat',
                           post_cutoff_method='cubic')
         
-        rates_smooth = [curve.get_rate(t) for t in tenors_smooth]
-        plt.plot(tenors_smooth, np.array(rates_smooth) * 100, 
+        rates_smooth = curve.get_rates(tenors_smooth)
+        rates_smooth *= 100
+        plt.plot(tenors_smooth, rates_smooth, 
                 label=f'Cutoff at {cutoff}Y', linewidth=2)
-        plt.axvline(x=cutoff, color=f'C{i}', linestyle='--', alpha=0.5)
+    
+    # Mark all cutoffs with one LineCollection spanning the full height
+    ax = plt.gca()
+    ax.vlines(cutoff_points, 0, 1, transform=ax.get_xaxis_transform(),
+              colors=[f'C{i}' for i in range(len(cutoff_points))], linestyles='--', alpha=0.5)
     
     # Plot original points
     plt.plot(tenors, np.array(rates) * 100, 'ko', markersize=8, label='Market Data')
@@ -171,6 +176,7 @@ def test_different_cutoff_points():
     plt.grid(True, alpha=0.3)
     plt.savefig('hybrid_cutoff_comparison.png', dpi=300, bbox_inches='tight')
     plt.show()
+    plt.close(fig)
 
 def test_different_method_combinations():
     """Test different combinations of pre/post cutoff methods."""
@@ -188,7 +194,7 @@ def test_different_method_combinations():
         ('flat', 'log_linear', 'Flat -> Log-Linear'),
     ]
     
-    plt.figure(figsize=(12, 8))
+    fig = plt.figure(figsize=(12, 8))
     tenors_smooth = np.linspace(0.1, 10.0, 200)
     
     for pre_method, post_method, label in combinations:
@@ -199,8 +205,9 @@ def test_different_method_combinations():
                               pre_cutoff_method=pre_method,
                               post_cutoff_method=post_method)
             
-            rates_smooth = [curve.get_rate(t) for t in tenors_smooth]
-            plt.plot(tenors_smooth, np.array(rates_smooth) * 100, 
+            rates_smooth = curve.get_rates(tenors_smooth)
+            rates_smooth *= 100
+            plt.plot(tenors_smooth, rates_smooth, 
                     label=label, linewidth=2)
         except Exception as e:
             print(f"Error with {label}: {e}")
@@ -216,6 +223,7 @@ def test_different_method_combinations():
     plt.grid(True, alpha=0.3)
     plt.savefig('hybrid_method_combinations.png', dpi=300, bbox_inches='tight')
     plt.show()
+    plt.close(fig)
 
 if __name__ == "__main__":
     demonstrate_hybrid_interpolation()
@@ -2,8 +2,10 @@
 Basic tests for the curve building functionality.
 """
 
+import pickle
 import unittest
 import numpy as np
+from scipy.interpolate import CubicSpline
 from src.core.curve import YieldCurve
 from src.core.instruments import IRSwap, IRFuture
 from src.core.bootstrapping import CurveBootstrapper
@@ -12,11 +14,12 @@ from src.core.bootstrapping import CurveBootstrapper
 class TestYieldCurve(unittest.TestCase):
     """Test cases for YieldCurve class."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.tenors = [0.5, 1.0, 2.0, 3.0, 5.0, 10.0]
-        self.rates = [0.025, 0.0275, 0.03, 0.0325, 0.035, 0.0375]
-        self.curve = YieldCurve(self.tenors, self.rates)
+    @classmethod
+    def setUpClass(cls):
+        """Set up test data shared by every test; curves are never mutated."""
+        cls.tenors = [0.5, 1.0, 2.0, 3.0, 5.0, 10.0]
+        cls.rates = [0.025, 0.0275, 0.03, 0.0325, 0.035, 0.0375]
+        cls.curve = YieldCurve(cls.tenors, cls.rates)
     
     def test_curve_creation(self):
         """Test curve creation."""
@@ -26,15 +29,42 @@ class TestYieldCurve(unittest.TestCase):
     def test_rate_interpolation(self):
         """Test rate interpolation."""
         # Test at known points
-        for tenor, rate in zip(self.tenors, self.rates):
-            interpolated_rate = self.curve.get_rate(tenor)
-            self.assertAlmostEqual(interpolated_rate, rate, places=6)
+        np.testing.assert_allclose(self.curve.get_rates(self.tenors), self.rates, rtol=0, atol=5e-7)
         
         # Test interpolation at intermediate point
         mid_tenor = 1.5
         mid_rate = self.curve.get_rate(mid_tenor)
         self.assertTrue(0.0275 < mid_rate < 0.03)
     
+    def test_vectorized_rates(self):
+        """Test get_rates and get_discount_factors match the scalar methods."""
+        tenors = np.linspace(0.1, 12.0, 50)
+        for method in ['linear', 'cubic', 'log_linear', 'flat']:
+            curve = YieldCurve(self.tenors, self.rates, method)
+            np.testing.assert_allclose(curve.get_rates(tenors),
+                                       [curve.get_rate(t) for t in tenors], rtol=1e-12)
+            np.testing.assert_allclose(curve.get_discount_factors(tenors),
+                                       [curve.get_discount_factor(t) for t in tenors], rtol=1e-12)
+        
+        hybrid = YieldCurve(self.tenors, self.rates, 'hybrid', cutoff_tenor=2.5)
+        np.testing.assert_allclose(hybrid.get_rates(tenors),
+                                   [hybrid.get_rate(t) for t in tenors], rtol=1e-12)
+    
+    def test_cubic_is_not_a_knot_spline(self):
+        """Test cubic curves interpolate and extrapolate like scipy's not-a-knot CubicSpline."""
+        tenors = np.linspace(0.0, 15.0, 61)
+        expected = CubicSpline(self.tenors, self.rates, bc_type='not-a-knot')(tenors)
+        np.testing.assert_allclose(self.curve.get_rates(tenors), expected, rtol=1e-12, atol=1e-15)
+    
+    def test_pickle_round_trip(self):
+        """Test a pickled curve rebuilds with the same rates and the shared tenor grid."""
+        tenors = np.linspace(0.1, 12.0, 50)
+        for curve in [self.curve, YieldCurve(self.tenors, self.rates, 'hybrid', cutoff_tenor=2.5)]:
+            restored = pickle.loads(pickle.dumps(curve))
+            self.assertIs(restored.tenors, curve.tenors)
+            self.assertEqual(restored.interpolation_method, curve.interpolation_method)
+            np.testing.assert_array_equal(restored.get_rates(tenors), curve.get_rates(tenors))
+    
     def test_discount_factor(self):
         """Test discount factor calculation."""
         tenor = 2.0
@@ -56,16 +86,60 @@ class TestYieldCurve(unittest.TestCase):
         start_rate = self.curve.get_rate(start_tenor)
         end_rate = self.curve.get_rate(end_tenor)
         self.assertTrue(0 <= forward_rate <= max(start_rate, end_rate) * 2)
+    
+    def test_shift_curve(self):
+        """Test shifted curves match curves rebuilt from shifted nodes, hybrid settings included."""
+        tenors = np.linspace(0.0, 15.0, 61)
+        shifted_rates = np.asarray(self.rates) + 0.001
+        for kwargs in [{}, {'interpolation_method': 'linear'},
+                       {'interpolation_method': 'hybrid', 'cutoff_tenor': 2.5}]:
+            curve = YieldCurve(self.tenors, self.rates, **kwargs)
+            shifted = curve.shift_curve(10.0)
+            rebuilt = YieldCurve(self.tenors, shifted_rates, **kwargs)
+            np.testing.assert_allclose(shifted.get_rates(tenors), rebuilt.get_rates(tenors), rtol=0, atol=1e-15)
+            np.testing.assert_allclose([shifted.get_rate(t) for t in tenors], rebuilt.get_rates(tenors),
+                                       rtol=0, atol=1e-15)
+        np.testing.assert_array_equal(self.curve.rates, self.rates)
+    
+    def test_par_rates_batch(self):
+        """Test batched par rates match the per-tenor calculation."""
+        tenors = np.array([1.0, 1.3, 2.0, 5.0, 7.5, 10.0])
+        for frequency in [1, 2, 4]:
+            expected = [self.curve.get_par_rate(tenor, frequency) for tenor in tenors]
+            np.testing.assert_allclose(self.curve.get_par_rates(tenors, frequency), expected, rtol=1e-12)
+        
+        # Tenors shorter than one coupon period are rejected by both paths
+        with self.assertRaises(ValueError):
+            self.curve.get_par_rates([0.5, 2.0], frequency=1)
+        with self.assertRaises(ValueError):
+            self.curve.get_par_rates([0.25])
+        with self.assertRaises(ValueError):
+            self.curve.get_par_rate(0.25)
+        with self.assertRaises(ValueError):
+            self.curve.get_par_rate(0.5, frequency=1)
+    
+    def test_forward_rates_batch(self):
+        """Test batched forward rates match the per-period calculation."""
+        start_tenors = np.array([0.25, 1.0, 2.5, 4.0, 9.0])
+        end_tenors = np.array([0.5, 2.0, 3.0, 7.0, 12.0])
+        forward_rates = self.curve.get_forward_rates(start_tenors, end_tenors)
+        
+        expected = [self.curve.get_forward_rate(start, end) for start, end in zip(start_tenors, end_tenors)]
+        np.testing.assert_allclose(forward_rates, expected, rtol=1e-12)
+        
+        with self.assertRaises(ValueError):
+            self.curve.get_forward_rates([1.0, 2.0], [2.0, 2.0])
 
 
 class TestInstruments(unittest.TestCase):
     """Test cases for financial instruments."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.tenors = [0.5, 1.0, 2.0, 3.0, 5.0, 10.0]
-        self.rates = [0.025, 0.0275, 0.03, 0.0325, 0.035, 0.0375]
-        self.curve = YieldCurve(self.tenors, self.rates)
+    @classmethod
+    def setUpClass(cls):
+        """Set up test data shared by every test; curves are never mutated."""
+        cls.tenors = [0.5, 1.0, 2.0, 3.0, 5.0, 10.0]
+        cls.rates = [0.025, 0.0275, 0.03, 0.0325, 0.035, 0.0375]
+        cls.curve = YieldCurve(cls.tenors, cls.rates)
     
     def test_swap_pricing(self):
         """Test swap pricing."""
@@ -91,27 +165,48 @@ class TestInstruments(unittest.TestCase):
         
         # DV01 should be finite for a swap
         self.assertTrue(np.isfinite(dv01))
+    
+    def test_par_rate_cached_per_schedule(self):
+        """Test swaps sharing a schedule reuse one cached par rate on a curve."""
+        curve = YieldCurve(self.tenors, self.rates)
+        par_rate = IRSwap(1.0, 5.0, 0.035, notional=1.0).get_par_rate(curve)
+        
+        self.assertEqual(curve._par_cache, {(1.0, 5.0, 2): par_rate})
+        self.assertEqual(IRSwap(1.0, 5.0, 0.05, notional=1e6).get_par_rate(curve), par_rate)
+        self.assertAlmostEqual(IRSwap(1.0, 5.0, 0.035).get_par_rate(self.curve), par_rate, places=12)
+    
+    def test_schedule_discount_factors_shared(self):
+        """Test swaps on the same schedule share one discount factor lookup per curve."""
+        curve = YieldCurve(self.tenors, self.rates)
+        payer = IRSwap(0.0, 5.0, 0.035, notional=1.0)
+        receiver = IRSwap(0.0, 5.0, 0.02, notional=1e6)
+        
+        self.assertIs(payer._schedule_discount_factors(curve), receiver._schedule_discount_factors(curve))
+        self.assertEqual(len(curve._schedule_df_cache), 1)
+        np.testing.assert_array_equal(payer._schedule_discount_factors(curve),
+                                      curve.get_discount_factors(payer._schedule_times))
 
 
 class TestSwapPricing(unittest.TestCase):
     """Comprehensive test cases for swap pricing."""
     
-    def setUp(self):
-        """Set up test data with different curve scenarios."""
+    @classmethod
+    def setUpClass(cls):
+        """Set up the curve scenarios once; tests only read them."""
         # Flat curve
-        self.flat_tenors = [0.5, 1.0, 2.0, 3.0, 5.0, 10.0]
-        self.flat_rates = [0.05] * 6
-        self.flat_curve = YieldCurve(self.flat_tenors, self.flat_rates)
+        cls.flat_tenors = [0.5, 1.0, 2.0, 3.0, 5.0, 10.0]
+        cls.flat_rates = [0.05] * 6
+        cls.flat_curve = YieldCurve(cls.flat_tenors, cls.flat_rates)
         
         # Upward sloping curve
-        self.upward_tenors = [0.5, 1.0, 2.0, 3.0, 5.0, 10.0]
-        self.upward_rates = [0.02, 0.025, 0.03, 0.035, 0.04, 0.045]
-        self.upward_curve = YieldCurve(self.upward_tenors, self.upward_rates)
+        cls.upward_tenors = [0.5, 1.0, 2.0, 3.0, 5.0, 10.0]
+        cls.upward_rates = [0.02, 0.025, 0.03, 0.035, 0.04, 0.045]
+        cls.upward_curve = YieldCurve(cls.upward_tenors, cls.upward_rates)
         
         # Downward sloping curve
-        self.downward_tenors = [0.5, 1.0, 2.0, 3.0, 5.0, 10.0]
-        self.downward_rates = [0.06, 0.055, 0.05, 0.045, 0.04, 0.035]
-        self.downward_curve = YieldCurve(self.downward_tenors, self.downward_rates)
+        cls.downward_tenors = [0.5, 1.0, 2.0, 3.0, 5.0, 10.0]
+        cls.downward_rates = [0.06, 0.055, 0.05, 0.045, 0.04, 0.035]
+        cls.downward_curve = YieldCurve(cls.downward_tenors, cls.downward_rates)
     
     def test_par_swap_pricing(self):
         """Test that par swaps have approximately zero value."""
@@ -123,7 +218,7 @@ class TestSwapPricing(unittest.TestCase):
         price = par_swap.price(self.upward_curve)
         
         # Par swap should have price close to zero
-        self.assertAlmostEqual(price, 0.0, places=2)
+        self.assertAlmostEqual(price, 0.0, places=6)
     
     def test_swap_pricing_different_curves(self):
         """Test swap pricing across different curve shapes."""
@@ -151,7 +246,7 @@ class TestSwapPricing(unittest.TestCase):
         high_price = high_rate_swap.price(self.upward_curve)
         
         # Test swap with rate below par
-        low_rate_swap = IRSwap(0.0, swap_tenor, par_rate - 0.01, notional=1.0)
+        low_rate_swap = high_rate_swap.with_rate(par_rate - 0.01)
         low_price = low_rate_swap.price(self.upward_curve)
         
         # High rate swap should have negative value (receiver pays)
@@ -176,10 +271,8 @@ class TestSwapPricing(unittest.TestCase):
         self.assertGreater(len(cashflows['floating']), 0)
         
         # Each cashflow should be finite
-        for cf in cashflows['fixed']:
-            self.assertTrue(np.isfinite(cf))
-        for cf in cashflows['floating']:
-            self.assertTrue(np.isfinite(cf))
+        self.assertTrue(np.isfinite(cashflows['fixed']).all())
+        self.assertTrue(np.isfinite(cashflows['floating']).all())
     
     def test_swap_dv01_calculation(self):
         """Test DV01 calculation for swaps."""
@@ -205,25 +298,30 @@ class TestSwapPricing(unittest.TestCase):
         # Convexity can be positive or negative depending on the curve shape
         # and swap position, but should be finite
         self.assertTrue(np.isfinite(convexity))
-    
+
+    def test_swap_sensitivities_match_bumped_curves(self):
+        """Test closed-form DV01 and convexity against repricing shifted curves."""
+        swap = IRSwap(1.0, 7.0, 0.04, frequency=4, notional=1e6)
+        curve = self.upward_curve
+        base, up, down = (swap.price(curve.shift_curve(s)) for s in (0.0, 10.0, -10.0))
+
+        self.assertAlmostEqual(swap.get_dv01(curve, shift=10.0) / ((base - up) / 1e-3), 1.0, places=8)
+        self.assertAlmostEqual(swap.get_convexity(curve) / ((up + down - 2 * base) / 1e-6), 1.0, places=5)
+
     def test_swap_different_tenors(self):
         """Test swap pricing with different tenors."""
         tenors = [1.0, 2.0, 5.0, 10.0]
         fixed_rate = 0.04
         
-        for tenor in tenors:
-            swap = IRSwap(0.0, tenor, fixed_rate, notional=1.0)
-            price = swap.price(self.upward_curve)
-            
-            # Price should be finite
-            self.assertTrue(np.isfinite(price))
-            
-            # Longer tenors should have larger absolute price (all else equal)
-            # But this depends on the curve shape, so we'll just check finiteness
-            if tenor > 1.0:
-                short_swap = IRSwap(0.0, 1.0, fixed_rate, notional=1.0)
-                short_price = short_swap.price(self.upward_curve)
-                self.assertTrue(np.isfinite(short_price))
+        swaps = [IRSwap(0.0, tenor, fixed_rate, notional=1.0) for tenor in tenors]
+        prices = IRSwap.price_batch(swaps, self.upward_curve)
+        
+        # Longer tenors should have larger absolute price (all else equal)
+        # But this depends on the curve shape, so we'll just check finiteness
+        self.assertEqual(prices.shape, (len(tenors),))
+        self.assertTrue(np.all(np.isfinite(prices)))
+        np.testing.assert_allclose(prices, [swap.price(self.upward_curve) for swap in swaps],
+                                   rtol=1e-10, atol=1e-12)
     
     def test_swap_notional_sensitivity(self):
         """Test that swap price scales with notional."""
@@ -238,17 +336,9 @@ class TestSwapPricing(unittest.TestCase):
     
     def test_swap_payment_frequency(self):
         """Test swap pricing with different payment frequencies."""
-        # Semi-annual payments (default)
-        swap_semi = IRSwap(0.0, 2.0, 0.04, notional=1.0, frequency=2)
-        price_semi = swap_semi.price(self.upward_curve)
-        
-        # Annual payments
-        swap_annual = IRSwap(0.0, 2.0, 0.04, notional=1.0, frequency=1)
-        price_annual = swap_annual.price(self.upward_curve)
-        
-        # Quarterly payments
-        swap_quarterly = IRSwap(0.0, 2.0, 0.04, notional=1.0, frequency=4)
-        price_quarterly = swap_quarterly.price(self.upward_curve)
+        # Semi-annual (default), annual and quarterly payments
+        swaps = [IRSwap(0.0, 2.0, 0.04, notional=1.0, frequency=freq) for freq in (2, 1, 4)]
+        price_semi, price_annual, price_quarterly = IRSwap.price_batch(swaps, self.upward_curve)
         
         # All should be finite
         self.assertTrue(np.isfinite(price_semi))
@@ -281,6 +371,27 @@ class TestSwapPricing(unittest.TestCase):
         high_price = high_swap.price(self.upward_curve)
         self.assertTrue(np.isfinite(high_price))
 
+    def test_swap_price_shifted(self):
+        """Test that batched shift pricing matches repricing shifted curves."""
+        shifts = np.arange(-50, 51, 5)
+        swaps = [IRSwap(0.0, 5.0, 0.04, notional=1.0),
+                 IRSwap(1.5, 7.0, 0.03, frequency=4, notional=10.0)]
+
+        for swap in swaps:
+            expected = [swap.price(self.upward_curve.shift_curve(s)) for s in shifts]
+            np.testing.assert_allclose(swap.price_shifted(self.upward_curve, shifts),
+                                       expected, atol=1e-12)
+
+    def test_swap_reprices_after_curve_change(self):
+        """Test that cached discount factors follow the curve passed in."""
+        swap = IRSwap(0.0, 5.0, 0.04, notional=1.0)
+        fresh = [IRSwap(0.0, 5.0, 0.04, notional=1.0).price(c)
+                 for c in (self.flat_curve, self.upward_curve)]
+
+        prices = [swap.price(c) for c in (self.flat_curve, self.upward_curve, self.flat_curve)]
+        np.testing.assert_array_equal(prices, fresh + fresh[:1])
+        self.assertEqual(pickle.loads(pickle.dumps(swap)).price(self.upward_curve), fresh[1])
+
 
 class TestBootstrapping(unittest.TestCase):
     """Test cases for curve bootstrapping."""
@@ -301,6 +412,33 @@ class TestBootstrapping(unittest.TestCase):
             self.assertGreater(rate, 0)
             self.assertLess(rate, 0.2)  # Less than 20%
 
+    def test_bootstrap_from_swaps_reprices_swaps(self):
+        """Test every input par swap reprices to zero on the bootstrapped curve."""
+        swap_tenors = [0.5, 1.0, 2.0, 3.0, 5.0, 10.0, 30.0]
+        swap_rates = [0.05, 0.048, 0.045, 0.043, 0.042, 0.041, 0.04]
+        
+        for method in ['cubic', 'linear', 'flat']:
+            curve = CurveBootstrapper(method).bootstrap_from_swaps(swap_rates, swap_tenors)
+            for tenor, rate in zip(swap_tenors, swap_rates):
+                self.assertAlmostEqual(IRSwap(0.0, tenor, rate).price(curve), 0.0, places=10,
+                                       msg=f"{method} {tenor}Y swap")
+
+    def test_batch_price(self):
+        """Test batch pricing matches pricing each instrument on its own."""
+        curve = YieldCurve([0.5, 1.0, 2.0, 5.0, 10.0], [0.03, 0.032, 0.034, 0.036, 0.038])
+        instruments = [
+            IRSwap(0.0, 2.0, 0.035, 2, 1000000),
+            IRFuture(0.25, 0.5),
+            IRSwap(1.0, 5.0, 0.04, 4, 500000),
+            IRSwap(0.0, 10.0, 0.03, 1, 1000000),
+        ]
+        
+        bootstrapper = CurveBootstrapper()
+        prices = bootstrapper.batch_price(instruments, curve)
+        
+        expected = [inst.price(curve) for inst in instruments]
+        np.testing.assert_allclose(prices, expected, rtol=1e-12, atol=1e-8)
+
 
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -10,48 +10,33 @@ from src.core.curve import YieldCurve
 class TestFlatInterpolation(unittest.TestCase):
     """Test cases for flat interpolation method."""
     
-    def setUp(self):
-        """Set up test data."""
+    @classmethod
+    def setUpClass(cls):
+        """Set up test data shared by every test; curves are never mutated."""
         # FOMC-style rate curve
-        self.fomc_dates = [0.25, 0.5, 1.0, 2.0, 5.0]
-        self.fed_rates = [0.05, 0.0525, 0.055, 0.06, 0.065]
-        self.flat_curve = YieldCurve(self.fomc_dates, self.fed_rates, interpolation_method='flat')
+        cls.fomc_dates = [0.25, 0.5, 1.0, 2.0, 5.0]
+        cls.fed_rates = [0.05, 0.0525, 0.055, 0.06, 0.065]
+        cls.flat_curve = YieldCurve(cls.fomc_dates, cls.fed_rates, interpolation_method='flat')
     
     def test_flat_interpolation_at_nodes(self):
         """Test that interpolation returns exact values at known points."""
-        for tenor, expected_rate in zip(self.fomc_dates, self.fed_rates):
-            actual_rate = self.flat_curve.get_rate(tenor)
-            self.assertAlmostEqual(actual_rate, expected_rate, places=6)
+        np.testing.assert_allclose(self.flat_curve.get_rates(self.fomc_dates), self.fed_rates,
+                                   rtol=0, atol=5e-7)
     
     def test_flat_interpolation_between_nodes(self):
         """Test that rates stay flat between nodes."""
-        # Test between 0.25 and 0.5 (should be 0.05)
-        test_tenor = 0.3
-        expected_rate = 0.05  # Should use the previous rate
-        actual_rate = self.flat_curve.get_rate(test_tenor)
-        self.assertAlmostEqual(actual_rate, expected_rate, places=6)
-        
-        # Test between 0.5 and 1.0 (should be 0.0525)
-        test_tenor = 0.75
-        expected_rate = 0.0525
-        actual_rate = self.flat_curve.get_rate(test_tenor)
-        self.assertAlmostEqual(actual_rate, expected_rate, places=6)
-        
-        # Test between 1.0 and 2.0 (should be 0.055)
-        test_tenor = 1.5
-        expected_rate = 0.055
-        actual_rate = self.flat_curve.get_rate(test_tenor)
-        self.assertAlmostEqual(actual_rate, expected_rate, places=6)
+        # Each point uses the previous node's rate:
+        # 0.25-0.5 -> 0.05, 0.5-1.0 -> 0.0525, 1.0-2.0 -> 0.055
+        test_tenors = [0.3, 0.75, 1.5]
+        actual_rates = [self.flat_curve.get_rate(t) for t in test_tenors]
+        np.testing.assert_allclose(actual_rates, [0.05, 0.0525, 0.055], rtol=0, atol=5e-7)
     
     def test_flat_interpolation_extrapolation(self):
         """Test extrapolation behavior (should use first/last rate)."""
-        # Before first point
-        early_rate = self.flat_curve.get_rate(0.1)
-        self.assertAlmostEqual(early_rate, self.fed_rates[0], places=6)
-        
-        # After last point
-        late_rate = self.flat_curve.get_rate(10.0)
-        self.assertAlmostEqual(late_rate, self.fed_rates[-1], places=6)
+        # Before first point and after last point
+        actual_rates = [self.flat_curve.get_rate(0.1), self.flat_curve.get_rate(10.0)]
+        np.testing.assert_allclose(actual_rates, [self.fed_rates[0], self.fed_rates[-1]],
+                                   rtol=0, atol=5e-7)
     
     def test_flat_vs_other_interpolation_methods(self):
         """Compare flat interpolation with other methods."""
@@ -76,27 +61,14 @@ class TestFlatInterpolation(unittest.TestCase):
         """Test that flat interpolation creates proper step function."""
         # Create a detailed test across the entire curve
         test_tenors = np.linspace(0.1, 6.0, 100)
-        rates = [self.flat_curve.get_rate(t) for t in test_tenors]
+        rates = self.flat_curve.get_rates(test_tenors)
         
-        # Verify step function behavior
-        for i, tenor in enumerate(test_tenors):
-            rate = rates[i]
-            
-            if tenor <= 0.25:
-                expected = 0.05
-            elif tenor <= 0.5:
-                expected = 0.05
-            elif tenor <= 1.0:
-                expected = 0.0525
-            elif tenor <= 2.0:
-                expected = 0.055
-            elif tenor <= 5.0:
-                expected = 0.06
-            else:
-                expected = 0.065
-            
-            self.assertAlmostEqual(rate, expected, places=6, 
-                                 msg=f"Failed at tenor {tenor}")
+        # Verify step function behavior: each rate holds up to and including the next node
+        step_ends = np.array([0.5, 1.0, 2.0, 5.0])
+        step_rates = np.array([0.05, 0.0525, 0.055, 0.06, 0.065])
+        expected = step_rates[np.searchsorted(step_ends, test_tenors, side='left')]
+        
+        np.testing.assert_allclose(rates, expected, rtol=0, atol=5e-7)
     
     def test_flat_interpolation_with_different_curves(self):
         """Test flat interpolation with different curve shapes."""
@@ -116,9 +88,7 @@ class TestFlatInterpolation(unittest.TestCase):
                 curve = YieldCurve(tenors, rates, interpolation_method='flat')
                 
                 # Test that exact points return exact rates
-                for tenor, rate in zip(tenors, rates):
-                    actual = curve.get_rate(tenor)
-                    self.assertAlmostEqual(actual, rate, places=6)
+                np.testing.assert_allclose(curve.get_rates(tenors), rates, rtol=0, atol=5e-7)
                 
                 # Test intermediate points
                 if len(tenors) > 1:
@@ -130,14 +100,13 @@ class TestFlatInterpolation(unittest.TestCase):
     def test_flat_interpolation_discount_factors(self):
         """Test that discount factors work correctly with flat interpolation."""
         # Test discount factor calculation
-        for tenor in [0.3, 0.75, 1.5, 3.0]:
-            rate = self.flat_curve.get_rate(tenor)
-            df = self.flat_curve.get_discount_factor(tenor)
-            expected_df = np.exp(-rate * tenor)
-            
-            self.assertAlmostEqual(df, expected_df, places=6)
-            self.assertGreater(df, 0)  # Should be positive
-            self.assertLessEqual(df, 1)  # Should be <= 1
+        tenors = np.array([0.3, 0.75, 1.5, 3.0])
+        dfs = self.flat_curve.get_discount_factors(tenors)
+        expected_dfs = np.exp(-self.flat_curve.get_rates(tenors) * tenors)
+        
+        np.testing.assert_allclose(dfs, expected_dfs, rtol=0, atol=5e-7)
+        self.assertTrue(np.all(dfs > 0))  # Should be positive
+        self.assertTrue(np.all(dfs <= 1))  # Should be <= 1
     
     def test_flat_interpolation_forward_rates(self):
         """Test forward rate calculation with flat interpolation."""
@@ -150,6 +119,11 @@ class TestFlatInterpolation(unittest.TestCase):
         # Should be finite and positive
         self.assertTrue(np.isfinite(forward_rate))
         self.assertGreater(forward_rate, 0)
+        
+        # Should match the log-ratio of the discount factors
+        df_start, df_end = self.flat_curve.get_discount_factors([start_tenor, end_tenor])
+        expected = (np.log(df_start) - np.log(df_end)) / (end_tenor - start_tenor)
+        self.assertAlmostEqual(forward_rate, expected, places=12)
 
 
 if __name__ == '__main__':
@@ -2,40 +2,45 @@
 Unit tests for the hybrid interpolation method.
 """
 
+import functools
 import unittest
 import numpy as np
 from src.core.curve import YieldCurve
 
+TENORS = [0.25, 0.5, 1.0, 2.0, 5.0, 10.0]
+RATES = [0.05, 0.0525, 0.055, 0.06, 0.062, 0.065]
+
+
+@functools.lru_cache(maxsize=32)
+def _hybrid_curve(cutoff_tenor: float, pre_cutoff_method: str, post_cutoff_method: str) -> YieldCurve:
+    """Hybrid curve on the shared test nodes; curves are never mutated, so tests can share them."""
+    return YieldCurve(TENORS, RATES,
+                      interpolation_method='hybrid',
+                      cutoff_tenor=cutoff_tenor,
+                      pre_cutoff_method=pre_cutoff_method,
+                      post_cutoff_method=post_cutoff_method)
+
 
 class TestHybridInterpolation(unittest.TestCase):
     """Test cases for hybrid interpolation method."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.tenors = [0.25, 0.5, 1.0, 2.0, 5.0, 10.0]
-        self.rates = [0.05, 0.0525, 0.055, 0.06, 0.062, 0.065]
-        self.cutoff_tenor = 2.0
+    @classmethod
+    def setUpClass(cls):
+        """Set up test data shared by every test."""
+        cls.tenors = TENORS
+        cls.rates = RATES
+        cls.cutoff_tenor = 2.0
     
     def test_hybrid_interpolation_basic(self):
         """Test basic hybrid interpolation functionality."""
-        curve = YieldCurve(self.tenors, self.rates,
-                          interpolation_method='hybrid',
-                          cutoff_tenor=self.cutoff_tenor,
-                          pre_cutoff_method='flat',
-                          post_cutoff_method='cubic')
+        curve = _hybrid_curve(self.cutoff_tenor, 'flat', 'cubic')
         
         # Test at known points
-        for tenor, expected_rate in zip(self.tenors, self.rates):
-            actual_rate = curve.get_rate(tenor)
-            self.assertAlmostEqual(actual_rate, expected_rate, places=5)
+        np.testing.assert_allclose(curve.get_rates(self.tenors), self.rates, rtol=0, atol=5e-6)
     
     def test_hybrid_pre_cutoff_behavior(self):
         """Test that pre-cutoff uses flat interpolation."""
-        curve = YieldCurve(self.tenors, self.rates,
-                          interpolation_method='hybrid',
-                          cutoff_tenor=self.cutoff_tenor,
-                          pre_cutoff_method='flat',
-                          post_cutoff_method='cubic')
+        curve = _hybrid_curve(self.cutoff_tenor, 'flat', 'cubic')
         
         # Test between 0.5 and 1.0 (should use flat = 0.0525)
         test_tenor = 0.75
@@ -49,11 +54,7 @@ class TestHybridInterpolation(unittest.TestCase):
     
     def test_hybrid_post_cutoff_behavior(self):
         """Test that post-cutoff uses cubic interpolation."""
-        curve = YieldCurve(self.tenors, self.rates,
-                          interpolation_method='hybrid',
-                          cutoff_tenor=self.cutoff_tenor,
-                          pre_cutoff_method='flat',
-                          post_cutoff_method='cubic')
+        curve = _hybrid_curve(self.cutoff_tenor, 'flat', 'cubic')
         
         # Create pure cubic curve for comparison
         post_cutoff_tenors = [t for t in self.tenors if t >= self.cutoff_tenor]
@@ -70,11 +71,7 @@ class TestHybridInterpolation(unittest.TestCase):
     
     def test_hybrid_cutoff_transition(self):
         """Test smooth transition at cutoff point."""
-        curve = YieldCurve(self.tenors, self.rates,
-                          interpolation_method='hybrid',
-                          cutoff_tenor=self.cutoff_tenor,
-                          pre_cutoff_method='flat',
-                          post_cutoff_method='cubic')
+        curve = _hybrid_curve(self.cutoff_tenor, 'flat', 'cubic')
         
         # Test very close to cutoff from both sides
         just_before = curve.get_rate(self.cutoff_tenor - 0.001)
@@ -95,18 +92,12 @@ class TestHybridInterpolation(unittest.TestCase):
         
         for pre_method, post_method in combinations:
             with self.subTest(pre=pre_method, post=post_method):
-                curve = YieldCurve(self.tenors, self.rates,
-                                  interpolation_method='hybrid',
-                                  cutoff_tenor=self.cutoff_tenor,
-                                  pre_cutoff_method=pre_method,
-                                  post_cutoff_method=post_method)
+                curve = _hybrid_curve(self.cutoff_tenor, pre_method, post_method)
                 
                 # Test that it works without errors
-                test_tenors = [0.3, 1.5, 3.0, 8.0]
-                for tenor in test_tenors:
-                    rate = curve.get_rate(tenor)
-                    self.assertTrue(np.isfinite(rate))
-                    self.assertGreater(rate, 0)
+                rates = curve.get_rates([0.3, 1.5, 3.0, 8.0])
+                self.assertTrue(np.isfinite(rates).all())
+                self.assertTrue((rates > 0).all())
     
     def test_hybrid_different_cutoff_points(self):
         """Test hybrid interpolation with different cutoff points."""
@@ -114,28 +105,18 @@ class TestHybridInterpolation(unittest.TestCase):
         
         for cutoff in cutoff_points:
             with self.subTest(cutoff=cutoff):
-                curve = YieldCurve(self.tenors, self.rates,
-                                  interpolation_method='hybrid',
-                                  cutoff_tenor=cutoff,
-                                  pre_cutoff_method='flat',
-                                  post_cutoff_method='cubic')
+                curve = _hybrid_curve(cutoff, 'flat', 'cubic')
                 
                 # Test various points
-                test_tenors = [0.1, 0.75, 1.5, 3.0, 7.0]
-                for tenor in test_tenors:
-                    rate = curve.get_rate(tenor)
-                    self.assertTrue(np.isfinite(rate))
-                    self.assertGreater(rate, 0)
+                rates = curve.get_rates([0.1, 0.75, 1.5, 3.0, 7.0])
+                self.assertTrue(np.isfinite(rates).all())
+                self.assertTrue((rates > 0).all())
     
     def test_hybrid_cutoff_not_in_data(self):
         """Test hybrid interpolation when cutoff point is not in original data."""
         cutoff_tenor = 1.5  # Between 1.0 and 2.0
         
-        curve = YieldCurve(self.tenors, self.rates,
-                          interpolation_method='hybrid',
-                          cutoff_tenor=cutoff_tenor,
-                          pre_cutoff_method='flat',
-                          post_cutoff_method='cubic')
+        curve = _hybrid_curve(cutoff_tenor, 'flat', 'cubic')
         
         # Should work fine and interpolate cutoff rate
         rate_at_cutoff = curve.get_rate(cutoff_tenor)
@@ -152,32 +133,20 @@ class TestHybridInterpolation(unittest.TestCase):
     def test_hybrid_extreme_cutoff_points(self):
         """Test hybrid interpolation with extreme cutoff points."""
         # Cutoff before all data points
-        curve1 = YieldCurve(self.tenors, self.rates,
-                           interpolation_method='hybrid',
-                           cutoff_tenor=0.1,
-                           pre_cutoff_method='flat',
-                           post_cutoff_method='cubic')
+        curve1 = _hybrid_curve(0.1, 'flat', 'cubic')
         
         rate1 = curve1.get_rate(1.0)
         self.assertTrue(np.isfinite(rate1))
         
         # Cutoff after all data points
-        curve2 = YieldCurve(self.tenors, self.rates,
-                           interpolation_method='hybrid',
-                           cutoff_tenor=20.0,
-                           pre_cutoff_method='flat',
-                           post_cutoff_method='cubic')
+        curve2 = _hybrid_curve(20.0, 'flat', 'cubic')
         
         rate2 = curve2.get_rate(5.0)
         self.assertTrue(np.isfinite(rate2))
     
     def test_hybrid_vs_pure_methods(self):
         """Compare hybrid interpolation with pure methods."""
-        hybrid_curve = YieldCurve(self.tenors, self.rates,
-                                 interpolation_method='hybrid',
-                                 cutoff_tenor=self.cutoff_tenor,
-                                 pre_cutoff_method='flat',
-                                 post_cutoff_method='cubic')
+        hybrid_curve = _hybrid_curve(self.cutoff_tenor, 'flat', 'cubic')
         
         flat_curve = YieldCurve(self.tenors, self.rates, interpolation_method='flat')
         cubic_curve = YieldCurve(self.tenors, self.rates, interpolation_method='cubic')
@@ -202,30 +171,20 @@ class TestHybridInterpolation(unittest.TestCase):
     
     def test_hybrid_discount_factors(self):
         """Test discount factor calculation with hybrid interpolation."""
-        curve = YieldCurve(self.tenors, self.rates,
-                          interpolation_method='hybrid',
-                          cutoff_tenor=self.cutoff_tenor,
-                          pre_cutoff_method='flat',
-                          post_cutoff_method='cubic')
+        curve = _hybrid_curve(self.cutoff_tenor, 'flat', 'cubic')
         
         # Test discount factors at various points
-        test_tenors = [0.3, 1.5, 3.0, 8.0]
-        for tenor in test_tenors:
-            rate = curve.get_rate(tenor)
-            df = curve.get_discount_factor(tenor)
-            expected_df = np.exp(-rate * tenor)
-            
-            self.assertAlmostEqual(df, expected_df, places=6)
-            self.assertGreater(df, 0)
-            self.assertLessEqual(df, 1)
+        test_tenors = np.array([0.3, 1.5, 3.0, 8.0])
+        rates = np.array([curve.get_rate(t) for t in test_tenors])
+        dfs = np.array([curve.get_discount_factor(t) for t in test_tenors])
+        
+        np.testing.assert_allclose(dfs, np.exp(-rates * test_tenors), rtol=0, atol=5e-7)
+        self.assertTrue((dfs > 0).all())
+        self.assertTrue((dfs <= 1).all())
     
     def test_hybrid_forward_rates(self):
         """Test forward rate calculation with hybrid interpolation."""
-        curve = YieldCurve(self.tenors, self.rates,
-                          interpolation_method='hybrid',
-                          cutoff_tenor=self.cutoff_tenor,
-                          pre_cutoff_method='flat',
-                          post_cutoff_method='cubic')
+        curve = _hybrid_curve(self.cutoff_tenor, 'flat', 'cubic')
         
         # Test forward rates across cutoff boundary
         forward_rate = curve.get_forward_rate(1.0, 3.0)
@@ -233,6 +192,30 @@ class TestHybridInterpolation(unittest.TestCase):
         self.assertTrue(np.isfinite(forward_rate))
         self.assertGreater(forward_rate, 0)
     
+    def test_hybrid_matches_single_method_curves(self):
+        """Test each side of the cutoff agrees with a curve built on that side's nodes."""
+        curve = _hybrid_curve(self.cutoff_tenor, 'linear', 'cubic')
+        pre_curve = YieldCurve(self.tenors[:4], self.rates[:4], interpolation_method='linear')
+        post_curve = YieldCurve(self.tenors[3:], self.rates[3:], interpolation_method='cubic')
+        
+        pre_tenors = np.array([0.1, 0.25, 0.7, 1.5, self.cutoff_tenor])
+        post_tenors = np.array([np.nextafter(self.cutoff_tenor, np.inf), 3.0, 7.5, 12.0])
+        np.testing.assert_allclose(curve.get_rates(pre_tenors), pre_curve.get_rates(pre_tenors), rtol=1e-12)
+        np.testing.assert_allclose(curve.get_rates(post_tenors), post_curve.get_rates(post_tenors), rtol=1e-12)
+    
+    def test_hybrid_single_node_linear_side(self):
+        """Test a linear side with a single node evaluates like the scalar path instead of raising."""
+        curve = YieldCurve(TENORS, RATES,
+                           interpolation_method='hybrid',
+                           cutoff_tenor=0.25,
+                           pre_cutoff_method='linear',
+                           post_cutoff_method='cubic')
+        tenors = np.array([0.1, 0.2, 3.0])
+        
+        rates = curve.get_rates(tenors)
+        np.testing.assert_array_equal(rates, [curve.get_rate(t) for t in tenors])
+        self.assertTrue(np.isfinite(rates[-1]))
+    
     def test_hybrid_error_handling(self):
         """Test error handling for hybrid interpolation."""
         # Test missing cutoff_tenor
@@ -2,6 +2,7 @@
 Comprehensive tests for swap pricing functionality.
 """
 
+import math
 import unittest
 import numpy as np
 from src.core.curve import YieldCurve
@@ -11,27 +12,44 @@ from src.core.instruments import IRSwap
 class TestSwapPricingComprehensive(unittest.TestCase):
     """Comprehensive test cases for swap pricing."""
     
-    def setUp(self):
-        """Set up test data with different curve scenarios."""
+    @classmethod
+    def setUpClass(cls):
+        """Set up the curve scenarios once; tests only read them."""
         # Flat curve
-        self.flat_tenors = [0.5, 1.0, 2.0, 3.0, 5.0, 10.0]
-        self.flat_rates = [0.05] * 6
-        self.flat_curve = YieldCurve(self.flat_tenors, self.flat_rates)
+        cls.flat_tenors = [0.5, 1.0, 2.0, 3.0, 5.0, 10.0]
+        cls.flat_rates = [0.05] * 6
+        cls.flat_curve = YieldCurve(cls.flat_tenors, cls.flat_rates)
         
         # Upward sloping curve
-        self.upward_tenors = [0.5, 1.0, 2.0, 3.0, 5.0, 10.0]
-        self.upward_rates = [0.02, 0.025, 0.03, 0.035, 0.04, 0.045]
-        self.upward_curve = YieldCurve(self.upward_tenors, self.upward_rates)
+        cls.upward_tenors = [0.5, 1.0, 2.0, 3.0, 5.0, 10.0]
+        cls.upward_rates = [0.02, 0.025, 0.03, 0.035, 0.04, 0.045]
+        cls.upward_curve = YieldCurve(cls.upward_tenors, cls.upward_rates)
+        # The same nodes under each interpolation method (cubic is the default)
+        cls.upward_curves = {
+            method: YieldCurve(cls.upward_tenors, cls.upward_rates, interpolation_method=method)
+            for method in ['linear', 'flat']
+        }
+        cls.upward_curves['cubic'] = cls.upward_curve
         
         # Downward sloping curve
-        self.downward_tenors = [0.5, 1.0, 2.0, 3.0, 5.0, 10.0]
-        self.downward_rates = [0.06, 0.055, 0.05, 0.045, 0.04, 0.035]
-        self.downward_curve = YieldCurve(self.downward_tenors, self.downward_rates)
+        cls.downward_tenors = [0.5, 1.0, 2.0, 3.0, 5.0, 10.0]
+        cls.downward_rates = [0.06, 0.055, 0.05, 0.045, 0.04, 0.035]
+        cls.downward_curve = YieldCurve(cls.downward_tenors, cls.downward_rates)
         
         # Inverted curve
-        self.inverted_tenors = [0.5, 1.0, 2.0, 3.0, 5.0, 10.0]
-        self.inverted_rates = [0.08, 0.07, 0.06, 0.05, 0.04, 0.03]
-        self.inverted_curve = YieldCurve(self.inverted_tenors, self.inverted_rates)
+        cls.inverted_tenors = [0.5, 1.0, 2.0, 3.0, 5.0, 10.0]
+        cls.inverted_rates = [0.08, 0.07, 0.06, 0.05, 0.04, 0.03]
+        cls.inverted_curve = YieldCurve(cls.inverted_tenors, cls.inverted_rates)
+        
+        # Par rates shared by the tests, keyed by (id(curve), tenor); the curves live as long as the class
+        cls._par_rates = {}
+    
+    def _par_rate(self, curve: YieldCurve, tenor: float) -> float:
+        """Par rate of a class curve, computed once per (curve, tenor)."""
+        key = (id(curve), tenor)
+        if key not in self._par_rates:
+            self._par_rates[key] = curve.get_par_rate(tenor)
+        return self._par_rates[key]
     
     def test_par_swap_zero_value(self):
         """Test that par swaps have approximately zero value."""
@@ -44,7 +62,7 @@ class TestSwapPricingComprehensive(unittest.TestCase):
         
         for curve, tenor in test_cases:
             with self.subTest(curve=curve, tenor=tenor):
-                par_rate = curve.get_par_rate(tenor)
+                par_rate = self._par_rate(curve, tenor)
                 par_swap = IRSwap(0.0, tenor, par_rate, notional=1.0)
                 price = par_swap.price(curve)
                 
@@ -60,7 +78,7 @@ class TestSwapPricingComprehensive(unittest.TestCase):
         for curve in curves:
             with self.subTest(curve=curve):
                 price = swap.price(curve)
-                self.assertTrue(np.isfinite(price))
+                self.assertTrue(math.isfinite(price))
     
     def test_swap_rate_sensitivity(self):
         """Test how swap price changes with fixed rate."""
@@ -72,15 +90,16 @@ class TestSwapPricingComprehensive(unittest.TestCase):
         
         for curve, tenor in test_cases:
             with self.subTest(curve=curve, tenor=tenor):
-                par_rate = curve.get_par_rate(tenor)
+                par_rate = self._par_rate(curve, tenor)
+                
+                # Both swaps share the par swap's schedule
+                par_swap = IRSwap(0.0, tenor, par_rate, notional=1.0)
                 
                 # Test swap with rate above par
-                high_rate_swap = IRSwap(0.0, tenor, par_rate + 0.01, notional=1.0)
-                high_price = high_rate_swap.price(curve)
+                high_price = par_swap.with_rate(par_rate + 0.01).price(curve)
                 
                 # Test swap with rate below par
-                low_rate_swap = IRSwap(0.0, tenor, par_rate - 0.01, notional=1.0)
-                low_price = low_rate_swap.price(curve)
+                low_price = par_swap.with_rate(par_rate - 0.01).price(curve)
                 
                 # High rate swap should have negative value (receiver pays)
                 # Low rate swap should have positive value (payer pays)
@@ -92,13 +111,12 @@ class TestSwapPricingComprehensive(unittest.TestCase):
         tenors = [0.5, 1.0, 2.0, 5.0, 10.0]
         fixed_rate = 0.04
         
-        for tenor in tenors:
-            with self.subTest(tenor=tenor):
-                swap = IRSwap(0.0, tenor, fixed_rate, notional=1.0)
-                price = swap.price(self.upward_curve)
-                
-                # Price should be finite
-                self.assertTrue(np.isfinite(price))
+        swaps = [IRSwap(0.0, tenor, fixed_rate, notional=1.0) for tenor in tenors]
+        prices = IRSwap.price_batch(swaps, self.upward_curve)
+        
+        # Prices should be finite and agree with pricing each swap on its own
+        self.assertTrue(np.isfinite(prices).all())
+        np.testing.assert_allclose(prices, [swap.price(self.upward_curve) for swap in swaps], rtol=0, atol=1e-12)
     
     def test_swap_notional_scaling(self):
         """Test that swap price scales with notional."""
@@ -109,13 +127,12 @@ class TestSwapPricingComprehensive(unittest.TestCase):
         base_swap = IRSwap(0.0, swap_tenor, fixed_rate, notional=1.0)
         base_price = base_swap.price(self.upward_curve)
         
-        for notional in notional_values:
-            with self.subTest(notional=notional):
-                swap = IRSwap(0.0, swap_tenor, fixed_rate, notional=notional)
-                price = swap.price(self.upward_curve)
-                
-                # Price should scale linearly with notional
-                self.assertAlmostEqual(price, base_price * notional, places=6)
+        # Price every notional from one curve lookup
+        swaps = [IRSwap(0.0, swap_tenor, fixed_rate, notional=notional) for notional in notional_values]
+        prices = IRSwap.price_batch(swaps, self.upward_curve)
+        
+        # Price should scale linearly with notional
+        np.testing.assert_allclose(prices, base_price * np.asarray(notional_values), rtol=0, atol=5e-7)
     
     def test_swap_frequency_impact(self):
         """Test swap pricing with different payment frequencies."""
@@ -127,13 +144,15 @@ class TestSwapPricingComprehensive(unittest.TestCase):
         base_swap = IRSwap(0.0, swap_tenor, fixed_rate, notional=1.0, frequency=2)
         base_price = base_swap.price(self.upward_curve)
         
-        for frequency in frequencies:
+        # Price every frequency's schedule from one curve lookup
+        swaps = [IRSwap(0.0, swap_tenor, fixed_rate, notional=1.0, frequency=frequency)
+                 for frequency in frequencies]
+        prices = IRSwap.price_batch(swaps, self.upward_curve)
+        
+        for frequency, price in zip(frequencies, prices):
             with self.subTest(frequency=frequency):
-                swap = IRSwap(0.0, swap_tenor, fixed_rate, notional=1.0, frequency=frequency)
-                price = swap.price(self.upward_curve)
-                
                 # All should be finite
-                self.assertTrue(np.isfinite(price))
+                self.assertTrue(math.isfinite(price))
                 
                 # More frequent payments should have different price due to timing
                 if frequency != 2:
@@ -157,10 +176,8 @@ class TestSwapPricingComprehensive(unittest.TestCase):
         self.assertGreater(len(cashflows['dates']), 0)
         
         # All values should be finite
-        for cf in cashflows['fixed']:
-            self.assertTrue(np.isfinite(cf))
-        for cf in cashflows['floating']:
-            self.assertTrue(np.isfinite(cf))
+        self.assertTrue(np.isfinite(cashflows['fixed']).all())
+        self.assertTrue(np.isfinite(cashflows['floating']).all())
     
     def test_swap_sensitivity_measures(self):
         """Test swap sensitivity measures (DV01, convexity)."""
@@ -168,18 +185,21 @@ class TestSwapPricingComprehensive(unittest.TestCase):
         
         # Test DV01
         dv01 = swap.get_dv01(self.upward_curve)
-        self.assertTrue(np.isfinite(dv01))
+        self.assertTrue(math.isfinite(dv01))
         
         # Test convexity
         convexity = swap.get_convexity(self.upward_curve)
-        self.assertTrue(np.isfinite(convexity))
+        self.assertTrue(math.isfinite(convexity))
         
-        # Test with different shifts
-        dv01_10bp = swap.get_dv01(self.upward_curve, shift=10.0)
-        convexity_50bp = swap.get_convexity(self.upward_curve, shift=50.0)
+        # Test with different shifts, all from one risk calculation
+        risk = swap.get_risk(self.upward_curve, [1.0, 10.0, 50.0])
         
-        self.assertTrue(np.isfinite(dv01_10bp))
-        self.assertTrue(np.isfinite(convexity_50bp))
+        self.assertTrue(np.isfinite(risk['dv01']).all())
+        self.assertTrue(np.isfinite(risk['convexity']).all())
+        np.testing.assert_allclose(risk['dv01'], [dv01, swap.get_dv01(self.upward_curve, shift=10.0),
+                                                  swap.get_dv01(self.upward_curve, shift=50.0)], rtol=1e-12)
+        np.testing.assert_allclose(risk['convexity'][1:], [convexity, swap.get_convexity(self.upward_curve, shift=50.0)],
+                                   rtol=1e-12)
     
     def test_swap_edge_cases(self):
         """Test swap pricing edge cases."""
@@ -196,40 +216,40 @@ class TestSwapPricingComprehensive(unittest.TestCase):
             {'start': 0.0, 'maturity': 5.0, 'rate': 0.001},
         ]
         
+        # Cases differing only in rate re-strike one swap instead of rebuilding its schedule
+        schedules = {}
+        swaps = []
         for case in edge_cases:
+            key = (case['start'], case['maturity'])
+            if key not in schedules:
+                schedules[key] = IRSwap(case['start'], case['maturity'], case['rate'], notional=1.0)
+            swaps.append(schedules[key].with_rate(case['rate']))
+        
+        # Price every case from one curve lookup
+        prices = IRSwap.price_batch(swaps, self.upward_curve)
+        
+        for case, price in zip(edge_cases, prices):
             with self.subTest(case=case):
-                swap = IRSwap(
-                    case['start'], 
-                    case['maturity'], 
-                    case['rate'], 
-                    notional=1.0
-                )
-                price = swap.price(self.upward_curve)
-                self.assertTrue(np.isfinite(price))
+                self.assertTrue(math.isfinite(price))
     
     def test_swap_curve_interpolation(self):
         """Test swap pricing with different interpolation methods."""
-        tenors = [0.5, 1.0, 2.0, 3.0, 5.0, 10.0]
-        rates = [0.02, 0.025, 0.03, 0.035, 0.04, 0.045]
+        swap = IRSwap(0.0, 3.0, 0.04, notional=1.0)
         
         # Test with different interpolation methods
         interpolation_methods = ['linear', 'cubic', 'flat']  # Skip log_linear due to edge cases
         
         for method in interpolation_methods:
             with self.subTest(method=method):
-                curve = YieldCurve(tenors, rates, interpolation_method=method)
-                swap = IRSwap(0.0, 3.0, 0.04, notional=1.0)
-                price = swap.price(curve)
+                price = swap.price(self.upward_curves[method])
                 
                 # Price should be finite
-                self.assertTrue(np.isfinite(price))
+                self.assertTrue(math.isfinite(price))
     
     def test_swap_pricing_accuracy(self):
         """Test swap pricing accuracy with known values."""
-        # Create a flat curve at 5%
-        flat_tenors = [0.5, 1.0, 2.0, 3.0, 5.0]
-        flat_rates = [0.05] * 5
-        flat_curve = YieldCurve(flat_tenors, flat_rates)
+        # The shared flat curve is at 5% everywhere
+        flat_curve = self.flat_curve
         
         # Test par swap (should be close to zero)
         par_rate = flat_curve.get_par_rate(2.0)